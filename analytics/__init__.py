@@ -6,25 +6,72 @@ Provides:
 - Cyber attack classification
 - Latency prediction
 - System health monitoring
+- Off-loop inference execution
 """
 
-from analytics.anomaly_detector import AnomalyDetector, AnomalyEvent
-from analytics.cyber_attack_classifier import CyberAttackClassifier, AttackPrediction
-from analytics.latency_predictor import LatencyPredictor, LatencyTrend
-from analytics.system_health_ai import SystemHealthMonitor, HealthAlert
-from analytics.utils import preprocess_telemetry, extract_features, FeatureVector
+import importlib
+
+# Exports resolve on first access (PEP 562): importing one submodule, or
+# the package for its utilities, does not load every model.
+_EXPORTS = {
+    "AnomalyDetector": "analytics.anomaly_detector",
+    "AnomalyEvent": "analytics.anomaly_detector",
+    "InferenceExecutor": "analytics.inference_executor",
+    "InferenceRejected": "analytics.inference_executor",
+    "CyberAttackClassifier": "analytics.cyber_attack_classifier",
+    "AttackPrediction": "analytics.cyber_attack_classifier",
+    "LatencyPredictor": "analytics.latency_predictor",
+    "LatencyTrend": "analytics.latency_predictor",
+    "SystemHealthMonitor": "analytics.system_health_ai",
+    "HealthAlert": "analytics.system_health_ai",
+    "RollingStats": "analytics.streaming_stats",
+    "RollingWindow": "analytics.streaming_stats",
+    "P2Quantile": "analytics.streaming_stats",
+    "WindowFeatureExtractor": "analytics.window_features",
+    "WindowFeatures": "analytics.window_features",
+    "preprocess_telemetry": "analytics.utils",
+    "extract_features": "analytics.utils",
+    "frame_features": "analytics.utils",
+    "telemetry_features": "analytics.utils",
+    "FeaturePipeline": "analytics.utils",
+    "FeatureVector": "analytics.utils",
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "AnomalyDetector",
     "AnomalyEvent",
     "CyberAttackClassifier",
     "AttackPrediction",
+    "InferenceExecutor",
+    "InferenceRejected",
     "LatencyPredictor",
     "LatencyTrend",
     "SystemHealthMonitor",
     "HealthAlert",
+    "WindowFeatureExtractor",
+    "WindowFeatures",
+    "RollingStats",
+    "RollingWindow",
+    "P2Quantile",
     "preprocess_telemetry",
     "extract_features",
+    "frame_features",
+    "telemetry_features",
+    "FeaturePipeline",
     "FeatureVector",
 ]
 
@@ -2,30 +2,64 @@
 ML-based anomaly detection for telemetry data.
 
 Uses Isolation Forest for unsupervised anomaly detection.
+
+Features:
+- On-demand detection over a telemetry DataFrame
+- Streaming scoring of CAN_TX micro-batches off the event loop
+- Small batches scored inline on compiled tree tables
+- Lazy, memory-mapped model loading (on first use or by a warm-up task)
+- Rolling window of scores and anomaly counts
 """
+import asyncio
 import logging
-from typing import Tuple, Optional
+import threading
+import time
+from typing import Any, Dict, List, Tuple, Optional
 from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime
 
 import numpy as np
-import pandas as pd
-
-try:
-    from sklearn.ensemble import IsolationForest
-    import joblib
-except ImportError:
-    IsolationForest = None
-    joblib = None
 
 from core.event_bus import event_bus, EventTopic
-from analytics.utils import preprocess_telemetry, extract_features
+from core.lazy_imports import is_available, lazy_import
+from analytics.compiled_trees import (
+    INLINE_MAX_ROWS,
+    CompiledIsolationForest,
+    export_compiled,
+    load_or_compile
+)
+from analytics.inference_executor import InferenceExecutor, InferenceRejected
+from analytics.model_store import load_model, save_model
+from analytics.online_learning import OnlineModelUpdater
+from analytics.streaming_stats import RollingWindow
+from analytics.utils import frame_features
+
+pd = lazy_import("pandas")
+
+# sklearn is imported when the model is loaded, not with this module
+SKLEARN_AVAILABLE = is_available("sklearn")
 
 logger = logging.getLogger(__name__)
 
 MODEL_PATH = Path("analytics/models/anomaly_model.joblib")
 
+STREAM_WINDOW = 1000
+STREAM_BATCH_WINDOW = 0.1
+STREAM_MAX_PENDING_BATCHES = 8
+Z_SCORE_LIMIT = 3.0
+
+
+def anomaly_severity(anomaly_ratio: float) -> str:
+    if anomaly_ratio > 0.5:
+        return "CRITICAL"
+    if anomaly_ratio > 0.3:
+        return "HIGH"
+    if anomaly_ratio > 0.1:
+        return "MEDIUM"
+    return "LOW"
+
+
 @dataclass
 class AnomalyEvent:
     timestamp: datetime
@@ -36,29 +70,97 @@ class AnomalyEvent:
     scores: list
 
 class AnomalyDetector:
-    def __init__(self, contamination: float = 0.05):
-        self.model = None
+    EXECUTOR_NAME = "anomaly"
+
+    def __init__(
+        self,
+        contamination: float = 0.05,
+        executor: Optional[InferenceExecutor] = None,
+        inline_max_rows: int = INLINE_MAX_ROWS
+    ):
+        self._model = None
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        self._load_ms: Optional[float] = None
+        self.compiled: Optional[CompiledIsolationForest] = None
         self.contamination = contamination
+        self.executor = executor
+        self.inline_max_rows = inline_max_rows
+        self.learner: Optional[OnlineModelUpdater] = None
         self._logger = logging.getLogger(__name__)
         self._trained = False
+        self._model_swaps = 0
+
+        self._subscription = None
+        self.alert_threshold = 0.1
+        self._latency_window: Optional[RollingWindow] = None
+        self._anomaly_window: Optional[RollingWindow] = None
+        self._score_window: Optional[RollingWindow] = None
+        self._last_latency_ms: Optional[float] = None
+        self._alerting = False
+        self._samples_seen = 0
+        self._samples_filtered = 0
+        self._batches_scored = 0
+        self._batches_rejected = 0
+        self._inline_calls = 0
+        self._last_score_ms = 0.0
+        self._updated_at: Optional[datetime] = None
 
-        if IsolationForest is None:
+        if not SKLEARN_AVAILABLE:
             self._logger.warning("scikit-learn not installed - anomaly detection disabled")
-            return
 
-        self._load_or_train()
+    @property
+    def model(self):
+        """The IsolationForest; loaded on first access unless warmed up earlier."""
+        if not self._loaded:
+            self.load()
+        return self._model
+
+    @model.setter
+    def model(self, model) -> None:
+        self._model = model
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def load(self) -> None:
+        """
+        Load (or create) the model and register it with the executor.
+
+        Safe to call from several threads at once; only the first call
+        does any work.
+        """
+        with self._load_lock:
+            if self._loaded:
+                return
+            t0 = time.perf_counter()
+            self._load_or_train()
+            if self.executor is not None and self._model is not None:
+                # A trained model at this point was loaded from MODEL_PATH
+                path = MODEL_PATH if self._trained else None
+                self.executor.register(self.EXECUTOR_NAME, self._model, path)
+            self._load_ms = (time.perf_counter() - t0) * 1000
+            self._loaded = True
+
+    async def warm_up(self) -> None:
+        """Load the model in a worker thread so the event loop keeps running."""
+        if not self._loaded:
+            await asyncio.to_thread(self.load)
 
     def _load_or_train(self) -> None:
-        if not IsolationForest:
+        if not SKLEARN_AVAILABLE:
             return
+        from sklearn.ensemble import IsolationForest
 
         try:
             if MODEL_PATH.exists():
-                self.model = joblib.load(MODEL_PATH)
+                self._model = load_model(MODEL_PATH)
                 self._trained = True
+                self.compiled = self._compile(self._model, MODEL_PATH)
                 self._logger.info(f"Loaded anomaly model from {MODEL_PATH}")
             else:
-                self.model = IsolationForest(
+                self._model = IsolationForest(
                     contamination=self.contamination,
                     random_state=42,
                     n_estimators=100,
@@ -68,10 +170,10 @@ class AnomalyDetector:
 
         except Exception as e:
             self._logger.error(f"Failed to load/create model: {e}")
-            self.model = None
+            self._model = None
 
-    def train(self, df: pd.DataFrame) -> bool:
-        if self.model is None or not IsolationForest:
+    def train(self, df: "pd.DataFrame") -> bool:
+        if self.model is None or not SKLEARN_AVAILABLE:
             self._logger.warning("Model unavailable")
             return False
 
@@ -79,16 +181,17 @@ class AnomalyDetector:
             if df.empty:
                 self._logger.warning("Cannot train on empty DataFrame")
                 return False
-            processed = preprocess_telemetry(df)
-            X = extract_features(processed)
+            X = frame_features(df)
 
             if len(X) < 10:
                 self._logger.warning(f"Insufficient training samples: {len(X)}")
                 return False
             self.model.fit(X)
             self._trained = True
-            MODEL_PATH.parent.mkdir(parents=True, exist_ok=True)
-            joblib.dump(self.model, MODEL_PATH)
+            save_model(self.model, MODEL_PATH)
+            if self.executor is not None:
+                self.executor.register(self.EXECUTOR_NAME, self.model, MODEL_PATH)
+            self.compiled = self._compile(self.model, MODEL_PATH, export=True)
 
             self._logger.info(
                 f"Model trained on {len(X)} samples and saved to {MODEL_PATH}"
@@ -99,36 +202,89 @@ class AnomalyDetector:
             self._logger.error(f"Training failed: {e}", exc_info=True)
             return False
 
+    async def swap_model(self, model) -> None:
+        """
+        Replace the fitted model while inference keeps running.
+
+        Inference reads ``self.model`` once per call, so in-flight calls
+        finish on the model they started with. The model is compiled in a
+        worker thread and, with an executor, loaded into its workers before
+        the references are swapped.
+        """
+        await self.warm_up()
+        compiled = await asyncio.to_thread(self._compile, model)
+        if self.executor is not None:
+            await self.executor.swap(self.EXECUTOR_NAME, model)
+        self.model = model
+        self.compiled = compiled
+        self._trained = True
+        self._model_swaps += 1
+
+    def enable_online_learning(self, **kwargs) -> OnlineModelUpdater:
+        """
+        Retrain from streamed telemetry (see OnlineModelUpdater).
+
+        Feature rows from the CAN_TX stream are sampled even before a
+        model is trained, so an untrained detector bootstraps itself.
+        """
+        if self.learner is None:
+            self.learner = OnlineModelUpdater(self, n_features=3, **kwargs)
+        return self.learner
+
+    def _compile(
+        self,
+        model,
+        path: Optional[Path] = None,
+        export: bool = False
+    ) -> Optional[CompiledIsolationForest]:
+        try:
+            if export:
+                export_compiled(model, path)
+            return load_or_compile(model, path)
+        except Exception as e:
+            self._logger.warning(f"Model compilation failed, scoring via sklearn only: {e}")
+            return None
+
+    async def _score_samples(self, X: np.ndarray, model=None) -> np.ndarray:
+        """
+        Score ``X`` inline on the compiled model when the batch is small,
+        otherwise on the inference executor or a worker thread.
+        """
+        if model is None:
+            model = self.model
+        compiled = self.compiled
+        if compiled is not None and model is self.model and len(X) <= self.inline_max_rows:
+            self._inline_calls += 1
+            return compiled.score_samples(X)
+
+        if self.executor is not None:
+            return await self.executor.run(self.EXECUTOR_NAME, "score_samples", X)
+        return await asyncio.to_thread(model.score_samples, X)
+
     async def detect(
         self,
-        df: pd.DataFrame,
+        df: "pd.DataFrame",
         threshold: float = 0.1
     ) -> Tuple[np.ndarray, AnomalyEvent]:
-        if self.model is None or not IsolationForest:
+        await self.warm_up()
+        model = self.model
+        if model is None or not SKLEARN_AVAILABLE:
             return np.array([]), None
 
         try:
             if df.empty:
                 return np.array([]), None
-            processed = preprocess_telemetry(df)
-            X = extract_features(processed)
+            X = frame_features(df)
 
             if len(X) == 0:
                 return np.array([]), None
-            predictions = self.model.predict(X)  
-            scores = self.model.score_samples(X)
+            # predict() is score_samples() - offset_ < 0; one pass over the trees
+            scores = await self._score_samples(X, model)
+            predictions = np.where(scores < model.offset_, -1, 1)
 
             anomaly_count = (predictions == -1).sum()
             anomaly_ratio = anomaly_count / len(predictions)
-
-            if anomaly_ratio > 0.5:
-                severity = "CRITICAL"
-            elif anomaly_ratio > 0.3:
-                severity = "HIGH"
-            elif anomaly_ratio > 0.1:
-                severity = "MEDIUM"
-            else:
-                severity = "LOW"
+            severity = anomaly_severity(anomaly_ratio)
 
             event = AnomalyEvent(
                 timestamp=datetime.now(),
@@ -158,15 +314,204 @@ class AnomalyDetector:
 
             return predictions, event
 
+        except InferenceRejected:
+            raise
+
         except Exception as e:
             self._logger.error(f"Detection failed: {e}", exc_info=True)
             return np.array([]), None
 
+    @property
+    def streaming(self) -> bool:
+        return self._subscription is not None
+
+    def start_streaming(
+        self,
+        window: int = STREAM_WINDOW,
+        batch_window: float = STREAM_BATCH_WINDOW,
+        alert_threshold: float = 0.1
+    ) -> None:
+        """
+        Score CAN_TX telemetry incrementally as it is published.
+
+        Events arrive in ``batch_window`` micro-batches; each batch is
+        scored in a worker thread while the loop keeps running. At most
+        ``STREAM_MAX_PENDING_BATCHES`` batches wait behind a slow scoring
+        pass, after which the oldest are dropped.
+        """
+        if self._subscription is not None:
+            return
+
+        self.alert_threshold = alert_threshold
+        self._latency_window = RollingWindow(window)
+        self._anomaly_window = RollingWindow(window)
+        self._score_window = RollingWindow(window)
+        self._last_latency_ms = None
+        self._alerting = False
+
+        self._subscription = event_bus.subscribe(
+            EventTopic.CAN_TX.value,
+            self._on_can_tx_batch,
+            batch_window=batch_window,
+            mailbox_size=STREAM_MAX_PENDING_BATCHES
+        )
+        self._logger.info(
+            f"Streaming anomaly detection started (window={window}, batch={batch_window}s)"
+        )
+
+    def stop_streaming(self) -> None:
+        if self._subscription is None:
+            return
+        event_bus.unsubscribe(EventTopic.CAN_TX.value, self._on_can_tx_batch)
+        self._subscription = None
+        self._logger.info("Streaming anomaly detection stopped")
+
+    def _batch_features(self, batch: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Build the (latency_ms, jitter_ms, queue_size) matrix for a batch.
+
+        Mirrors ``preprocess_telemetry``: jitter is the absolute latency
+        difference to the previous sample (carried across batches), rows
+        missing latency or queue size are dropped, and latencies 3 or more
+        standard deviations from the rolling mean are filtered out.
+        """
+        n = len(batch)
+        latency_ms = np.fromiter(
+            (np.nan if e.get("latency_us") is None else e["latency_us"] for e in batch),
+            dtype=np.float64, count=n
+        ) / 1000.0
+        queue_size = np.fromiter(
+            (np.nan if e.get("queue_size") is None else e["queue_size"] for e in batch),
+            dtype=np.float64, count=n
+        )
+
+        previous = latency_ms[0] if self._last_latency_ms is None else self._last_latency_ms
+        jitter_ms = np.abs(np.diff(latency_ms, prepend=previous))
+        jitter_ms[np.isnan(jitter_ms)] = 0.0
+        if not np.isnan(latency_ms[-1]):
+            self._last_latency_ms = float(latency_ms[-1])
+
+        valid = ~(np.isnan(latency_ms) | np.isnan(queue_size))
+        self._latency_window.push(latency_ms[valid])
+
+        std = self._latency_window.std()
+        if len(self._latency_window) > 1 and std > 0:
+            z = np.abs(latency_ms - self._latency_window.mean()) / std
+            keep = valid & (z < Z_SCORE_LIMIT)
+        else:
+            keep = valid
+
+        self._samples_filtered += int(n - keep.sum())
+        return np.column_stack((latency_ms, jitter_ms, queue_size))[keep]
+
+    async def _on_can_tx_batch(self, batch: List[Dict[str, Any]]) -> None:
+        await self.warm_up()
+        model = self.model
+        if model is None or not batch:
+            return
+        if not self._trained and self.learner is None:
+            return
+
+        try:
+            X = self._batch_features(batch)
+            self._samples_seen += len(batch)
+            if len(X) == 0:
+                return
+
+            if self.learner is not None:
+                self.learner.observe(X)
+            if not self._trained:
+                return
+
+            t0 = asyncio.get_running_loop().time()
+            scores = await self._score_samples(X, model)
+            anomalies = scores < model.offset_
+            self._last_score_ms = (asyncio.get_running_loop().time() - t0) * 1000
+
+            self._score_window.push(scores)
+            self._anomaly_window.push(anomalies.astype(np.float64))
+            self._batches_scored += 1
+            self._updated_at = datetime.now()
+
+            total = len(self._anomaly_window)
+            anomaly_ratio = self._anomaly_window.sum / total
+            if anomaly_ratio > self.alert_threshold and not self._alerting:
+                self._alerting = True
+                event_bus.publish_nowait(
+                    EventTopic.ATTACK_EVENT.value,
+                    {
+                        "type": "ANOMALY_DETECTED",
+                        "severity": anomaly_severity(anomaly_ratio),
+                        "anomaly_ratio": anomaly_ratio,
+                        "count": int(round(self._anomaly_window.sum)),
+                        "timestamp": self._updated_at.isoformat()
+                    }
+                )
+            elif anomaly_ratio <= self.alert_threshold:
+                self._alerting = False
+
+        except InferenceRejected:
+            self._batches_rejected += 1
+
+        except Exception as e:
+            self._logger.error(f"Streaming anomaly scoring failed: {e}", exc_info=True)
+
+    def stream_state(self, limit: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the rolling streaming detection state.
+
+        Args:
+            limit: Restrict counts to the most recent ``limit`` scored samples
+
+        Returns:
+            dict or None if streaming is off or nothing has been scored yet
+        """
+        window = self._anomaly_window
+        if self._subscription is None or window is None or len(window) == 0:
+            return None
+
+        if limit is not None and limit < len(window):
+            anomaly_count = int(window.latest(limit).sum())
+            total = limit
+            score_mean = float(self._score_window.latest(limit).mean())
+        else:
+            anomaly_count = int(round(window.sum))
+            total = len(window)
+            score_mean = self._score_window.mean()
+
+        anomaly_ratio = anomaly_count / total
+        return {
+            "anomaly_ratio": anomaly_ratio,
+            "anomaly_count": anomaly_count,
+            "total_samples": total,
+            "severity": anomaly_severity(anomaly_ratio),
+            "score_mean": score_mean,
+            "window": window.capacity,
+            "samples_seen": self._samples_seen,
+            "samples_filtered": self._samples_filtered,
+            "batches_scored": self._batches_scored,
+            "batches_dropped": self._subscription.dropped,
+            "batches_rejected": self._batches_rejected,
+            "score_ms_last": self._last_score_ms,
+            "timestamp": self._updated_at.isoformat() if self._updated_at else None
+        }
+
     def health_status(self) -> dict:
         """Get detector health status."""
         return {
-            "available": self.model is not None,
+            "available": SKLEARN_AVAILABLE and (not self._loaded or self._model is not None),
+            "loaded": self._loaded,
+            "load_ms": self._load_ms,
             "trained": self._trained,
             "contamination": self.contamination,
-            "model_path": str(MODEL_PATH)
+            "model_path": str(MODEL_PATH),
+            "executor": self.executor.mode if self.executor else None,
+            "compiled": self.compiled is not None,
+            "inline_max_rows": self.inline_max_rows,
+            "inline_calls": self._inline_calls,
+            "model_swaps": self._model_swaps,
+            "online_learning": self.learner.health_status() if self.learner else None,
+            "streaming": self.streaming,
+            "stream_samples_seen": self._samples_seen,
+            "stream_batches_scored": self._batches_scored
         }
\ No newline at end of file
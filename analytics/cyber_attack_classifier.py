@@ -1,27 +1,36 @@
 """
 ML-based cyber attack classification.
 
-Classifies detected attacks by type and confidence.
+Classifies detected attacks by type and confidence. The model is loaded
+lazily (memory-mapped) on first use or by a warm-up task.
 """
 
+import asyncio
 import logging
-from typing import Optional
+import threading
+import time
+from collections import Counter
+from typing import List, Optional
 from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime
 import numpy as np
-import pandas as pd
-
-try:
-    from sklearn.ensemble import RandomForestClassifier
-    import joblib
-except ImportError:
-    RandomForestClassifier = None
-    joblib = None
 
 from core.event_bus import event_bus, EventTopic
+from core.lazy_imports import is_available
+from analytics.compiled_trees import (
+    INLINE_MAX_ROWS,
+    CompiledRandomForest,
+    export_compiled,
+    load_or_compile
+)
+from analytics.inference_executor import InferenceExecutor, InferenceRejected
+from analytics.model_store import load_model, save_model
 from analytics.utils import extract_features
 
+# sklearn is imported when the model is loaded, not with this module
+SKLEARN_AVAILABLE = is_available("sklearn")
+
 logger = logging.getLogger(__name__)
 
 MODEL_PATH = Path("analytics/models/classifier_model.joblib")
@@ -35,6 +44,9 @@ ATTACK_TYPES = {
     5: "UNKNOWN"
 }
 
+ALERT_CONFIDENCE = 0.7
+HIGH_CONFIDENCE = 0.85
+
 
 @dataclass
 class AttackPrediction:
@@ -45,25 +57,73 @@ class AttackPrediction:
 
 
 class CyberAttackClassifier:
-    def __init__(self):
-        self.model = None
+    EXECUTOR_NAME = "attack_classifier"
+
+    def __init__(
+        self,
+        executor: Optional[InferenceExecutor] = None,
+        inline_max_rows: int = INLINE_MAX_ROWS
+    ):
+        self._model = None
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        self._load_ms: Optional[float] = None
+        self.compiled: Optional[CompiledRandomForest] = None
+        self.executor = executor
+        self.inline_max_rows = inline_max_rows
         self._logger = logging.getLogger(__name__)
         self._trained = False
+        self._inline_calls = 0
 
-        if RandomForestClassifier is None:
+        if not SKLEARN_AVAILABLE:
             self._logger.warning("scikit-learn not installed - classification disabled")
-            return
 
-        self._load_model()
+    @property
+    def model(self):
+        """The RandomForest; loaded on first access unless warmed up earlier."""
+        if not self._loaded:
+            self.load()
+        return self._model
+
+    @model.setter
+    def model(self, model) -> None:
+        self._model = model
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def load(self) -> None:
+        """Load (or create) the model and register it with the executor; thread-safe."""
+        with self._load_lock:
+            if self._loaded:
+                return
+            t0 = time.perf_counter()
+            if SKLEARN_AVAILABLE:
+                self._load_model()
+            if self.executor is not None and self._model is not None:
+                # A trained model at this point was loaded from MODEL_PATH
+                path = MODEL_PATH if self._trained else None
+                self.executor.register(self.EXECUTOR_NAME, self._model, path)
+            self._load_ms = (time.perf_counter() - t0) * 1000
+            self._loaded = True
+
+    async def warm_up(self) -> None:
+        """Load the model in a worker thread so the event loop keeps running."""
+        if not self._loaded:
+            await asyncio.to_thread(self.load)
 
     def _load_model(self) -> None:
+        from sklearn.ensemble import RandomForestClassifier
+
         try:
             if MODEL_PATH.exists():
-                self.model = joblib.load(MODEL_PATH)
+                self._model = load_model(MODEL_PATH)
                 self._trained = True
+                self.compiled = self._compile(self._model)
                 self._logger.info(f"Loaded classifier from {MODEL_PATH}")
             else:
-                self.model = RandomForestClassifier(
+                self._model = RandomForestClassifier(
                     n_estimators=100,
                     max_depth=10,
                     random_state=42,
@@ -73,10 +133,10 @@ class CyberAttackClassifier:
 
         except Exception as e:
             self._logger.error(f"Failed to load classifier: {e}")
-            self.model = None
+            self._model = None
 
     def train(self, X: np.ndarray, y: np.ndarray) -> bool:
-        if self.model is None or not RandomForestClassifier:
+        if self.model is None or not SKLEARN_AVAILABLE:
             self._logger.warning("Model unavailable")
             return False
 
@@ -88,8 +148,10 @@ class CyberAttackClassifier:
             self.model.fit(X, y)
             self._trained = True
 
-            MODEL_PATH.parent.mkdir(parents=True, exist_ok=True)
-            joblib.dump(self.model, MODEL_PATH)
+            save_model(self.model, MODEL_PATH)
+            if self.executor is not None:
+                self.executor.register(self.EXECUTOR_NAME, self.model, MODEL_PATH)
+            self.compiled = self._compile(self.model, export=True)
 
             self._logger.info(
                 f"Classifier trained on {len(X)} samples and saved to {MODEL_PATH}"
@@ -100,58 +162,125 @@ class CyberAttackClassifier:
             self._logger.error(f"Training failed: {e}", exc_info=True)
             return False
 
-    async def classify(self, features: np.ndarray) -> Optional[AttackPrediction]:
-        if self.model is None or not RandomForestClassifier:
+    def _compile(self, model, export: bool = False) -> Optional[CompiledRandomForest]:
+        try:
+            if export:
+                export_compiled(model, MODEL_PATH)
+            return load_or_compile(model, MODEL_PATH)
+        except Exception as e:
+            self._logger.warning(f"Model compilation failed, classifying via sklearn only: {e}")
             return None
 
+    async def _predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        Run predict_proba inline on the compiled model when the batch is
+        small, otherwise on the inference executor or a worker thread.
+        """
+        compiled = self.compiled
+        if compiled is not None and len(X) <= self.inline_max_rows:
+            self._inline_calls += 1
+            return compiled.predict_proba(X)
+
+        if self.executor is not None:
+            return await self.executor.run(self.EXECUTOR_NAME, "predict_proba", X)
+        return await asyncio.to_thread(self.model.predict_proba, X)
+
+    async def classify(self, features: np.ndarray) -> Optional[AttackPrediction]:
+        predictions = await self.classify_batch(features)
+        return predictions[0] if predictions else None
+
+    async def classify_batch(self, X: np.ndarray) -> List[AttackPrediction]:
+        """
+        Classify every row of a feature matrix with one predict_proba call.
+
+        Labels are taken from the arg-max probability, which is what
+        ``predict`` does internally. Rows classified as an attack with
+        confidence above ``ALERT_CONFIDENCE`` are summarised in a single
+        ATTACK_EVENT named after the most frequent attack type.
+
+        Returns:
+            list: One prediction per row (empty if the model is unavailable)
+        """
+        await self.warm_up()
+        if self.model is None or not SKLEARN_AVAILABLE:
+            return []
+
         try:
-            if len(features) == 0:
-                return None
-
-            if features.ndim == 1:
-                features = features.reshape(1, -1)
-
-            pred = self.model.predict(features)[0]
-            probs = self.model.predict_proba(features)[0]
-            confidence = probs.max()
-
-            attack_type = ATTACK_TYPES.get(pred, "UNKNOWN")
-
-            prediction = AttackPrediction(
-                timestamp=datetime.now(),
-                attack_type=attack_type,
-                confidence=float(confidence),
-                probabilities={
-                    ATTACK_TYPES.get(i, "UNKNOWN"): float(p)
-                    for i, p in enumerate(probs)
-                }
-            )
+            X = np.asarray(X)
+            if X.size == 0:
+                return []
+
+            if X.ndim == 1:
+                X = X.reshape(1, -1)
 
-            if confidence > 0.7 and attack_type != "NORMAL":
-                await event_bus.publish(
-                    EventTopic.ATTACK_EVENT.value,
-                    {
-                        "type": f"ATTACK_CLASSIFIED_{attack_type}",
-                        "severity": "HIGH" if confidence > 0.85 else "MEDIUM",
-                        "confidence": confidence,
-                        "probabilities": prediction.probabilities,
-                        "timestamp": prediction.timestamp.isoformat()
-                    }
+            probs = await self._predict_proba(X)
+            best = probs.argmax(axis=1)
+            confidences = probs[np.arange(len(probs)), best]
+
+            names = [ATTACK_TYPES.get(c, "UNKNOWN") for c in self.model.classes_.tolist()]
+            now = datetime.now()
+
+            predictions = [
+                AttackPrediction(
+                    timestamp=now,
+                    attack_type=names[b],
+                    confidence=float(c),
+                    probabilities=dict(zip(names, map(float, row)))
                 )
+                for b, c, row in zip(best.tolist(), confidences.tolist(), probs)
+            ]
+
+            alerts = [
+                p for p in predictions
+                if p.confidence > ALERT_CONFIDENCE and p.attack_type != "NORMAL"
+            ]
+            if alerts:
+                await self._publish_alerts(alerts, len(predictions))
 
             self._logger.debug(
-                f"Classification: {attack_type} ({confidence:.2%})"
+                f"Classified {len(predictions)} samples ({len(alerts)} alerts)"
             )
-            return prediction
+            return predictions
+
+        except InferenceRejected:
+            raise
 
         except Exception as e:
             self._logger.error(f"Classification failed: {e}", exc_info=True)
-            return None
+            return []
+
+    async def _publish_alerts(self, alerts: List[AttackPrediction], total: int) -> None:
+        counts = Counter(p.attack_type for p in alerts)
+        attack_type = counts.most_common(1)[0][0]
+        top = max(
+            (p for p in alerts if p.attack_type == attack_type),
+            key=lambda p: p.confidence
+        )
+
+        await event_bus.publish(
+            EventTopic.ATTACK_EVENT.value,
+            {
+                "type": f"ATTACK_CLASSIFIED_{attack_type}",
+                "severity": "HIGH" if top.confidence > HIGH_CONFIDENCE else "MEDIUM",
+                "confidence": top.confidence,
+                "probabilities": top.probabilities,
+                "count": len(alerts),
+                "total_samples": total,
+                "attack_counts": dict(counts),
+                "timestamp": top.timestamp.isoformat()
+            }
+        )
 
     def health_status(self) -> dict:
         return {
-            "available": self.model is not None,
+            "available": SKLEARN_AVAILABLE and (not self._loaded or self._model is not None),
+            "loaded": self._loaded,
+            "load_ms": self._load_ms,
             "trained": self._trained,
             "attack_types": list(ATTACK_TYPES.values()),
+            "executor": self.executor.mode if self.executor else None,
+            "compiled": self.compiled is not None,
+            "inline_max_rows": self.inline_max_rows,
+            "inline_calls": self._inline_calls,
             "model_path": str(MODEL_PATH)
         }
\ No newline at end of file
@@ -0,0 +1,226 @@
+"""
+Incremental time series forecasting.
+
+Features:
+- EWMA (level only), Holt linear trend and additive Holt-Winters models
+- O(1) state update per observation
+- Forecasts at several horizons from every model at once
+- Per-model, per-horizon forecast error (MAE / RMSE)
+"""
+
+import math
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+class EWMAForecaster:
+    """Exponentially weighted moving average; flat forecast at every horizon."""
+
+    name = "ewma"
+
+    def __init__(self, alpha: float = 0.3):
+        self.alpha = alpha
+        self.level: Optional[float] = None
+
+    def update(self, x: float) -> None:
+        if self.level is None:
+            self.level = x
+        else:
+            self.level += self.alpha * (x - self.level)
+
+    def forecast(self, steps: int) -> float:
+        return float("nan") if self.level is None else self.level
+
+
+class HoltForecaster:
+    """Holt's linear trend method (double exponential smoothing)."""
+
+    name = "holt"
+
+    def __init__(self, alpha: float = 0.3, beta: float = 0.1):
+        self.alpha = alpha
+        self.beta = beta
+        self.level: Optional[float] = None
+        self.trend = 0.0
+
+    def update(self, x: float) -> None:
+        if self.level is None:
+            self.level = x
+            return
+        previous = self.level
+        self.level = self.alpha * x + (1 - self.alpha) * (previous + self.trend)
+        self.trend = self.beta * (self.level - previous) + (1 - self.beta) * self.trend
+
+    def forecast(self, steps: int) -> float:
+        if self.level is None:
+            return float("nan")
+        return self.level + steps * self.trend
+
+
+class HoltWintersForecaster:
+    """
+    Additive Holt-Winters (triple exponential smoothing).
+
+    Behaves like Holt's method during the first ``season_length``
+    observations, which are then used to initialise the seasonal
+    components as residuals from a least-squares line through that
+    season (so a trend is not mistaken for seasonality).
+    """
+
+    name = "holt_winters"
+
+    def __init__(
+        self,
+        season_length: int,
+        alpha: float = 0.3,
+        beta: float = 0.1,
+        gamma: float = 0.2
+    ):
+        if season_length < 2:
+            raise ValueError(f"Season length must be at least 2, got {season_length}")
+        self.season_length = season_length
+        self.alpha = alpha
+        self.beta = beta
+        self.gamma = gamma
+        self.level: Optional[float] = None
+        self.trend = 0.0
+        self.seasonal: List[float] = []
+        self._first_season: List[float] = []
+        self._step = 0
+
+    @property
+    def seasonal_ready(self) -> bool:
+        return bool(self.seasonal)
+
+    def update(self, x: float) -> None:
+        m = self.season_length
+        i = self._step % m
+        self._step += 1
+
+        if self.level is None:
+            self.level = x
+            self._first_season.append(x)
+            return
+
+        season = self.seasonal[i] if self.seasonal else 0.0
+        previous = self.level
+        self.level = self.alpha * (x - season) + (1 - self.alpha) * (previous + self.trend)
+        self.trend = self.beta * (self.level - previous) + (1 - self.beta) * self.trend
+
+        if self.seasonal:
+            self.seasonal[i] = self.gamma * (x - self.level) + (1 - self.gamma) * season
+            return
+
+        self._first_season.append(x)
+        if len(self._first_season) == m:
+            first = self._first_season
+            x_mean = (m - 1) / 2.0
+            y_mean = sum(first) / m
+            slope = (
+                sum((k - x_mean) * (v - y_mean) for k, v in enumerate(first))
+                / (m * (m * m - 1) / 12.0)
+            )
+            self.seasonal = [v - y_mean - slope * (k - x_mean) for k, v in enumerate(first)]
+            self._first_season = []
+
+    def forecast(self, steps: int) -> float:
+        if self.level is None:
+            return float("nan")
+        season = 0.0
+        if self.seasonal:
+            season = self.seasonal[(self._step + steps - 1) % self.season_length]
+        return self.level + steps * self.trend + season
+
+
+class ForecastError:
+    """
+    Scores forecasts once their target step is observed.
+
+    Each horizon keeps the forecasts still waiting for their target in a
+    FIFO that never holds more than ``horizon`` entries.
+    """
+
+    def __init__(self, horizons: Sequence[int]):
+        self._pending: Dict[int, Deque[Tuple[int, float]]] = {h: deque() for h in horizons}
+        self._count = {h: 0 for h in horizons}
+        self._abs_sum = {h: 0.0 for h in horizons}
+        self._sq_sum = {h: 0.0 for h in horizons}
+
+    def observe(self, step: int, actual: float) -> None:
+        for h, pending in self._pending.items():
+            while pending and pending[0][0] <= step:
+                target, predicted = pending.popleft()
+                if target == step and not math.isnan(predicted):
+                    error = actual - predicted
+                    self._count[h] += 1
+                    self._abs_sum[h] += abs(error)
+                    self._sq_sum[h] += error * error
+
+    def record(self, step: int, horizon: int, predicted: float) -> None:
+        self._pending[horizon].append((step + horizon, predicted))
+
+    def mae(self, horizon: int) -> float:
+        n = self._count[horizon]
+        return self._abs_sum[horizon] / n if n else float("nan")
+
+    def rmse(self, horizon: int) -> float:
+        n = self._count[horizon]
+        return math.sqrt(self._sq_sum[horizon] / n) if n else float("nan")
+
+    def summary(self) -> Dict[int, Dict[str, float]]:
+        return {
+            h: {"mae": self.mae(h), "rmse": self.rmse(h), "count": self._count[h]}
+            for h in self._pending
+        }
+
+
+class MultiHorizonForecaster:
+    """
+    Runs several forecasting models side by side over one series.
+
+    Every ``update`` first scores earlier forecasts that targeted this
+    step, then updates each model and records its new forecasts for all
+    horizons.
+    """
+
+    def __init__(
+        self,
+        horizons: Iterable[int] = (1, 10, 60),
+        models: Optional[list] = None,
+        season_length: int = 60
+    ):
+        self.horizons = tuple(sorted(set(horizons)))
+        self.models = models if models is not None else [
+            EWMAForecaster(),
+            HoltForecaster(),
+            HoltWintersForecaster(season_length)
+        ]
+        self.errors = {model.name: ForecastError(self.horizons) for model in self.models}
+        self.step = 0
+
+    def update(self, x: float) -> None:
+        self.step += 1
+        for model in self.models:
+            errors = self.errors[model.name]
+            errors.observe(self.step, x)
+            model.update(x)
+            for h in self.horizons:
+                errors.record(self.step, h, model.forecast(h))
+
+    def forecasts(self) -> Dict[str, Dict[int, float]]:
+        return {
+            model.name: {h: model.forecast(h) for h in self.horizons}
+            for model in self.models
+        }
+
+    def best_model(self, horizon: int):
+        """Model with the lowest MAE at ``horizon`` (the first model until scored)."""
+        scored = [
+            (self.errors[m.name].mae(horizon), i, m)
+            for i, m in enumerate(self.models)
+            if not math.isnan(self.errors[m.name].mae(horizon))
+        ]
+        return min(scored)[2] if scored else self.models[0]
+
+    def error_summary(self) -> Dict[str, Dict[int, Dict[str, float]]]:
+        return {name: errors.summary() for name, errors in self.errors.items()}
@@ -0,0 +1,321 @@
+"""
+Off-loop execution of ML model inference.
+
+Features:
+- Process pool with models preloaded in every worker (memory-mapped
+  from their saved files where possible)
+- Thread pool for inference paths that release the GIL
+- Bounded concurrency with a bounded request queue
+- Queue wait and execution latency metrics
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import pickle
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Deque, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from analytics.model_store import load_model
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+EXECUTOR_MODES = (EXECUTOR_THREAD, EXECUTOR_PROCESS)
+
+LATENCY_SAMPLES = 1024
+
+_worker_models: Dict[str, Any] = {}
+
+
+class InferenceRejected(RuntimeError):
+    """Raised when the inference queue is full."""
+
+
+def _init_worker(sources: Dict[str, Tuple[Optional[str], Optional[bytes]]]) -> None:
+    """
+    Process pool initializer: load every registered model once.
+
+    Each source is ``(path, None)`` for a model saved to disk, which is
+    loaded memory-mapped so the workers share its arrays, or
+    ``(None, blob)`` for one that only exists pickled.
+    """
+    for name, (path, blob) in sources.items():
+        model = load_model(path) if path is not None else pickle.loads(blob)
+        # Workers are the unit of parallelism; nested joblib threads
+        # would only oversubscribe the cores
+        if hasattr(model, "n_jobs"):
+            model.n_jobs = 1
+        _worker_models[name] = model
+
+
+def _invoke(name: str, method: str, args: tuple) -> Any:
+    return getattr(_worker_models[name], method)(*args)
+
+
+def _ping() -> bool:
+    return True
+
+
+class InferenceExecutor:
+    """
+    Runs model methods on a worker pool instead of the event loop.
+
+    Models are registered by name and called as
+    ``await executor.run(name, "predict_proba", X)``. In process mode each
+    worker loads every registered model when it starts, so requests only
+    carry the feature matrix. A model registered with the ``path`` it was
+    saved to is loaded from that file memory-mapped; any other model is
+    pickled into each worker. Registering a model again (after training)
+    replaces the pool, and ``swap`` does so without a gap. In thread mode
+    the registered objects are called directly, which only helps when the
+    model's inference releases the GIL.
+
+    ``register`` may be called from any thread: the pool is only replaced
+    under a lock that ``run`` also holds while submitting, so a request
+    is never handed to a pool that is being shut down.
+
+    At most ``max_workers`` requests execute at once and at most
+    ``max_pending`` wait for a worker; further requests raise
+    ``InferenceRejected`` instead of queueing without bound.
+    """
+
+    def __init__(
+        self,
+        mode: str = EXECUTOR_PROCESS,
+        max_workers: int = 2,
+        max_pending: int = 32
+    ):
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(
+                f"Invalid executor mode '{mode}'. Allowed: {', '.join(EXECUTOR_MODES)}"
+            )
+
+        self.mode = mode
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(0, max_pending)
+
+        self._models: Dict[str, Any] = {}
+        self._paths: Dict[str, Path] = {}
+        self._pool: Optional[Executor] = None
+        self._pool_lock = threading.Lock()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._logger = logging.getLogger(__name__)
+
+        self._waiting = 0
+        self._running = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._pool_restarts = 0
+        self._wait_ms: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._exec_ms: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def register(
+        self,
+        name: str,
+        model: Any,
+        path: Optional[Union[str, Path]] = None
+    ) -> None:
+        """
+        Register or replace a model; a running process pool is restarted.
+
+        Pass ``path`` when ``model`` is exactly what is saved there, so
+        workers map the file instead of receiving a pickled copy. Requests
+        already submitted finish on the old pool.
+        """
+        with self._pool_lock:
+            self._set_model(self._models, self._paths, name, model, path)
+            if self._pool is not None and self.mode == EXECUTOR_PROCESS:
+                self._pool.shutdown(wait=False)
+                self._pool = None
+                self._pool_restarts += 1
+                self._logger.info(f"Model '{name}' replaced - restarting inference workers")
+
+    async def swap(
+        self,
+        name: str,
+        model: Any,
+        path: Optional[Union[str, Path]] = None
+    ) -> None:
+        """
+        Replace a model without a gap in service.
+
+        In process mode a new pool is started and warmed up with the new
+        model while the current pool keeps serving; the pools are then
+        exchanged in one step and the old one drains in the background.
+        """
+        with self._pool_lock:
+            if self.mode != EXECUTOR_PROCESS or self._pool is None:
+                self._set_model(self._models, self._paths, name, model, path)
+                return
+            models, paths = dict(self._models), dict(self._paths)
+
+        self._set_model(models, paths, name, model, path)
+        pool = self._create_pool(models, paths)
+        await self._warm_up(pool)
+
+        with self._pool_lock:
+            old, self._pool = self._pool, pool
+            self._models, self._paths = models, paths
+            self._pool_restarts += 1
+        if old is not None:
+            old.shutdown(wait=False)
+        self._logger.info(f"Model '{name}' swapped into fresh inference workers")
+
+    @staticmethod
+    def _set_model(
+        models: Dict[str, Any],
+        paths: Dict[str, Path],
+        name: str,
+        model: Any,
+        path: Optional[Union[str, Path]]
+    ) -> None:
+        models[name] = model
+        if path is not None:
+            # Workers may not share the parent's working directory
+            paths[name] = Path(path).resolve()
+        else:
+            paths.pop(name, None)
+
+    def _create_pool(self, models: Dict[str, Any], paths: Dict[str, Path]) -> Executor:
+        if self.mode == EXECUTOR_PROCESS:
+            sources = {
+                name: (str(paths[name]), None) if name in paths
+                else (None, pickle.dumps(model))
+                for name, model in models.items()
+            }
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(sources,)
+            )
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="inference"
+        )
+
+    def _ensure_pool(self) -> Executor:
+        """Return the current pool, creating it if needed; hold ``_pool_lock``."""
+        if self._pool is None:
+            self._pool = self._create_pool(self._models, self._paths)
+        return self._pool
+
+    async def _warm_up(self, pool: Executor) -> None:
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(pool, _ping) for _ in range(self.max_workers)
+        ))
+
+    async def start(self) -> None:
+        """Create the pool and bring every worker up with its models loaded."""
+        with self._pool_lock:
+            pool = self._ensure_pool()
+        t0 = time.perf_counter()
+        await self._warm_up(pool)
+        self._logger.info(
+            f"Inference executor started (mode={self.mode}, workers={self.max_workers}, "
+            f"models={list(self._models)}, warmup={(time.perf_counter() - t0) * 1000:.0f}ms)"
+        )
+
+    async def shutdown(self) -> None:
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is None:
+            return
+        await asyncio.to_thread(pool.shutdown, True)
+        self._logger.info(
+            f"Inference executor stopped (completed={self._completed}, "
+            f"rejected={self._rejected})"
+        )
+
+    async def run(self, name: str, method: str, *args: Any) -> Any:
+        """
+        Call ``method`` on the model registered as ``name`` in a worker.
+
+        Raises:
+            KeyError: If no model is registered under ``name``
+            InferenceRejected: If ``max_pending`` requests are already queued
+        """
+        if name not in self._models:
+            raise KeyError(f"No model registered as '{name}'")
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+
+        if self._slots.locked() and self._waiting >= self.max_pending:
+            self._rejected += 1
+            raise InferenceRejected(
+                f"Inference queue full ({self._waiting} pending)"
+            )
+
+        self._submitted += 1
+        queued_at = time.perf_counter()
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+
+        self._running += 1
+        started_at = time.perf_counter()
+        self._wait_ms.append((started_at - queued_at) * 1000)
+        try:
+            loop = asyncio.get_running_loop()
+            # run_in_executor submits immediately, so holding the lock
+            # keeps register() from shutting this pool down in between
+            with self._pool_lock:
+                pool = self._ensure_pool()
+                if self.mode == EXECUTOR_PROCESS:
+                    future = loop.run_in_executor(pool, _invoke, name, method, args)
+                else:
+                    future = loop.run_in_executor(
+                        pool, getattr(self._models[name], method), *args
+                    )
+            result = await future
+        except Exception:
+            self._failed += 1
+            raise
+        else:
+            self._completed += 1
+            return result
+        finally:
+            self._exec_ms.append((time.perf_counter() - started_at) * 1000)
+            self._running -= 1
+            self._slots.release()
+
+    @staticmethod
+    def _percentiles(samples: Deque[float]) -> Dict[str, float]:
+        if not samples:
+            return {"p50": 0.0, "p99": 0.0, "max": 0.0}
+        values = np.fromiter(samples, dtype=np.float64, count=len(samples))
+        p50, p99 = np.percentile(values, (50, 99))
+        return {"p50": float(p50), "p99": float(p99), "max": float(values.max())}
+
+    def health_status(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "running": self._pool is not None,
+            "models": list(self._models),
+            "mapped_models": list(self._paths),
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "in_flight": self._running,
+            "queued": self._waiting,
+            "submitted": self._submitted,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "pool_restarts": self._pool_restarts,
+            "queue_wait_ms": self._percentiles(self._wait_ms),
+            "execution_ms": self._percentiles(self._exec_ms)
+        }
@@ -2,14 +2,26 @@
 Time series latency prediction and trend analysis.
 
 Predicts latency trends and detects degradation.
+
+All statistics are maintained incrementally (see analytics.streaming_stats),
+so each CAN TX event costs O(1) regardless of the window size. Latencies
+are also aggregated into per-bucket p99 values which feed multi-horizon
+forecasts (see analytics.forecasting).
 """
 import logging
-from typing import Optional
-from collections import deque
+import math
+import time
+from typing import Optional, Sequence
 from dataclasses import dataclass
 from datetime import datetime
-import numpy as np
 from core.event_bus import event_bus, EventTopic
+from analytics.streaming_stats import RollingStats, P2Quantile
+from analytics.forecasting import MultiHorizonForecaster
+
+# Highest-priority class budget in src.can_translator.DEADLINE_BUDGETS_US
+DEFAULT_LATENCY_BUDGET_US = 5_000
+# A raised forecast alert re-arms once every forecast is below this share of the budget
+FORECAST_REARM_RATIO = 0.9
 
 logger = logging.getLogger(__name__)
 @dataclass
@@ -21,19 +33,71 @@ class LatencyTrend:
     prediction: Optional[float] = None
 
 class LatencyPredictor:
-    def __init__(self, window_size: int = 100):
-        self.latencies = deque(maxlen=window_size)
+    def __init__(
+        self,
+        window_size: int = 100,
+        trend_interval: int = 25,
+        bucket_seconds: float = 1.0,
+        horizons: Sequence[int] = (1, 10, 60),
+        season_length: int = 60,
+        latency_budget_us: float = DEFAULT_LATENCY_BUDGET_US
+    ):
+        self.stats = RollingStats(window_size)
+        self.latencies = self.stats.values
+        self.trend_interval = max(1, trend_interval)
+        self.bucket_seconds = bucket_seconds
+        self.latency_budget_us = latency_budget_us
+        self.forecaster = MultiHorizonForecaster(horizons, season_length=season_length)
         self._logger = logging.getLogger(__name__)
         self._threshold_slope = 50.0  
         self._min_samples = 20
+        self._min_buckets = 5
+        self._since_trend = 0
+        self._trend_checks = 0
+        self._bucket_p99 = P2Quantile(0.99)
+        self._bucket_start: Optional[float] = None
+        self._last_bucket_p99 = float("nan")
+        self._forecast_alerting = False
+        self._forecast_alerts = 0
+
+    def _observe_bucket(self, latency: float, now: float) -> bool:
+        """
+        Add a sample to the current p99 bucket.
 
-    async def on_can_tx_event(self, data: dict) -> None:
+        Returns True when ``now`` closed the previous bucket, whose p99
+        was then fed to the forecaster. Buckets without traffic are not
+        represented, so a forecast step is one non-empty bucket.
+        """
+        closed = False
+        if self._bucket_start is None:
+            self._bucket_start = now
+        elif now - self._bucket_start >= self.bucket_seconds:
+            self._last_bucket_p99 = self._bucket_p99.value
+            self.forecaster.update(self._last_bucket_p99)
+            self._bucket_p99 = P2Quantile(0.99)
+            self._bucket_start = now
+            closed = True
+
+        self._bucket_p99.add(latency)
+        return closed
+
+    async def on_can_tx_event(self, data: dict, now: Optional[float] = None) -> None:
         try:
             latency = data.get("latency_us")
             if latency is not None:
-                self.latencies.append(latency)
+                latency = float(latency)
+                self.stats.push(latency)
+                self._since_trend += 1
+
+                if self._observe_bucket(latency, time.monotonic() if now is None else now):
+                    await self._check_forecast()
 
-                if len(self.latencies) >= self._min_samples:
+                if (
+                    self._since_trend >= self.trend_interval
+                    and len(self.stats) >= self._min_samples
+                ):
+                    self._since_trend = 0
+                    self._trend_checks += 1
                     trend = await self.analyze_trend()
                     if trend:
                         await self._check_degradation(trend)
@@ -43,12 +107,10 @@ class LatencyPredictor:
 
     async def analyze_trend(self) -> Optional[LatencyTrend]:
         try:
-            if len(self.latencies) < self._min_samples:
+            if len(self.stats) < self._min_samples:
                 return None
 
-            arr = np.array(list(self.latencies))
-            z = np.polyfit(range(len(arr)), arr, 1)
-            slope = z[0]
+            slope, _ = self.stats.regression.fit()
 
             if slope > 10:
                 trend_direction = "degrading"
@@ -60,7 +122,7 @@ class LatencyPredictor:
                 trend_direction = "stable"
                 confidence = 1.0 - min(abs(slope) / 100, 1.0)
 
-            prediction = float(np.polyval(z, len(arr)))
+            prediction = float(self.stats.regression.predict())
 
             trend = LatencyTrend(
                 timestamp=datetime.now(),
@@ -99,25 +161,124 @@ class LatencyPredictor:
                 }
             )
 
+    async def _check_forecast(self) -> None:
+        """
+        Alert when a forecast p99 crosses the latency budget before the
+        observed p99 has.
+
+        Uses, per horizon, the model with the lowest error so far. One
+        event is published when the condition starts; it re-arms once no
+        horizon is forecast above ``FORECAST_REARM_RATIO`` of the budget.
+        """
+        if self.forecaster.step < self._min_buckets:
+            return
+
+        breaches = []
+        peak = float("-inf")
+        for h in self.forecaster.horizons:
+            model = self.forecaster.best_model(h)
+            predicted = model.forecast(h)
+            peak = max(peak, predicted)
+            if predicted > self.latency_budget_us:
+                breaches.append((h, model.name, predicted))
+
+        if not breaches:
+            if peak < self.latency_budget_us * FORECAST_REARM_RATIO:
+                self._forecast_alerting = False
+            return
+        if self._forecast_alerting or self._last_bucket_p99 > self.latency_budget_us:
+            return
+
+        self._forecast_alerting = True
+        self._forecast_alerts += 1
+        horizon, model_name, predicted = breaches[0]
+        seconds = horizon * self.bucket_seconds
+
+        self._logger.warning(
+            f"p99 latency forecast to exceed {self.latency_budget_us:.0f}µs "
+            f"in {seconds:.0f}s ({predicted:.0f}µs, {model_name})"
+        )
+
+        await event_bus.publish(
+            EventTopic.ERROR.value,
+            {
+                "type": "LATENCY_DEGRADATION",
+                "severity": "HIGH" if horizon == self.forecaster.horizons[0] else "MEDIUM",
+                "predicted": True,
+                "horizon_s": seconds,
+                "forecast_p99_us": predicted,
+                "current_p99_us": self._last_bucket_p99,
+                "budget_us": self.latency_budget_us,
+                "model": model_name,
+                "timestamp": datetime.now().isoformat()
+            }
+        )
+
+    def get_forecast(self) -> dict:
+        """Per-model p99 forecasts and forecast errors, keyed by horizon in seconds."""
+        forecaster = self.forecaster
+
+        def seconds(h: int) -> str:
+            return f"{h * self.bucket_seconds:g}s"
+
+        def clean(value: float) -> Optional[float]:
+            return None if math.isnan(value) else value
+
+        return {
+            "buckets": forecaster.step,
+            "bucket_seconds": self.bucket_seconds,
+            "current_p99_us": clean(self._last_bucket_p99),
+            "budget_us": self.latency_budget_us,
+            "alerting": self._forecast_alerting,
+            "alerts": self._forecast_alerts,
+            "best_model": {seconds(h): forecaster.best_model(h).name for h in forecaster.horizons},
+            "forecast_p99_us": {
+                name: {seconds(h): clean(v) for h, v in by_horizon.items()}
+                for name, by_horizon in forecaster.forecasts().items()
+            },
+            "error_us": {
+                name: {
+                    seconds(h): {k: clean(v) for k, v in e.items()}
+                    for h, e in by_horizon.items()
+                }
+                for name, by_horizon in forecaster.error_summary().items()
+            }
+        }
+
     def get_statistics(self) -> dict:
-        if not self.latencies:
+        """
+        Statistics of the current window, plus lifetime percentiles.
+
+        ``median``/``p95``/``p99`` are exact over the window like the other
+        unprefixed keys; ``lifetime_*`` are P² estimates over every sample.
+        """
+        stats = self.stats
+        if not len(stats):
             return {}
 
-        arr = np.array(list(self.latencies))
+        median, p95, p99 = stats.window_quantiles((0.5, 0.95, 0.99))
         return {
-            "count": len(self.latencies),
-            "mean": float(np.mean(arr)),
-            "median": float(np.median(arr)),
-            "std": float(np.std(arr)),
-            "min": float(np.min(arr)),
-            "max": float(np.max(arr)),
-            "p95": float(np.percentile(arr, 95)),
-            "p99": float(np.percentile(arr, 99))
+            "count": len(stats),
+            "total": stats.total,
+            "mean": stats.moments.mean,
+            "median": float(median),
+            "std": stats.moments.std(),
+            "min": stats.extrema.min,
+            "max": stats.extrema.max,
+            "p95": float(p95),
+            "p99": float(p99),
+            "lifetime_median": stats.quantile(0.5),
+            "lifetime_p95": stats.quantile(0.95),
+            "lifetime_p99": stats.quantile(0.99)
         }
 
     def health_status(self) -> dict:
         return {
-            "samples": len(self.latencies),
-            "max_window": self.latencies.maxlen,
+            "samples": len(self.stats),
+            "max_window": self.stats.capacity,
+            "trend_interval": self.trend_interval,
+            "trend_checks": self._trend_checks,
+            "forecast_buckets": self.forecaster.step,
+            "forecast_alerts": self._forecast_alerts,
             "statistics": self.get_statistics()
         }
\ No newline at end of file
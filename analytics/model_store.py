@@ -0,0 +1,84 @@
+"""
+Model persistence shared by the analytics models.
+
+Features:
+- Memory-mapped joblib loading (numpy arrays stay in the page cache)
+- Atomic saves that never truncate a file another process has mapped
+- Per-process memory report (RSS, and PSS/USS where available)
+"""
+
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from core.lazy_imports import lazy_import
+
+joblib = lazy_import("joblib")
+psutil = lazy_import("psutil")
+
+logger = logging.getLogger(__name__)
+
+MMAP_MODE = "r"
+
+
+def load_model(path: Union[str, Path], mmap_mode: Optional[str] = MMAP_MODE) -> Any:
+    """
+    Load a joblib model with its numpy arrays memory-mapped read-only.
+
+    Mapped pages are shared by every worker process that loads the same
+    file. Arrays that a model copies while unpickling (sklearn tree node
+    tables, for example) are private to the process regardless.
+    """
+    return joblib.load(path, mmap_mode=mmap_mode)
+
+
+def save_model(model: Any, path: Union[str, Path]) -> Path:
+    """
+    Save a joblib model by writing a temporary file and renaming it.
+
+    Rewriting a mapped file in place would invalidate the pages other
+    workers have mapped; after the rename they keep the old inode until
+    they reload.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.tmp")
+    joblib.dump(model, tmp)
+    os.replace(tmp, path)
+    return path
+
+
+def process_memory() -> Dict[str, Any]:
+    """
+    Memory of the current process in MB.
+
+    ``pss_mb`` splits shared pages between the processes mapping them, so
+    summing it over workers gives the real footprint; ``uss_mb`` is what
+    this process alone would free.
+    """
+    report: Dict[str, Any] = {"pid": os.getpid(), "rss_mb": None, "pss_mb": None, "uss_mb": None}
+    if psutil is None:
+        return report
+
+    process = psutil.Process()
+    try:
+        info = process.memory_full_info()
+    except (psutil.AccessDenied, OSError):
+        info = process.memory_info()
+
+    mb = 1024.0 * 1024.0
+    report["rss_mb"] = info.rss / mb
+    for field in ("pss", "uss"):
+        value = getattr(info, field, None)
+        if value is not None:
+            report[f"{field}_mb"] = value / mb
+    return report
+
+
+def process_age_ms() -> Optional[float]:
+    """Milliseconds since this process started, if psutil is available."""
+    if psutil is None:
+        return None
+    return (time.time() - psutil.Process().create_time()) * 1000
@@ -0,0 +1,217 @@
+"""
+Online model updating from streaming telemetry.
+
+Features:
+- Uniform reservoir sample of the feature stream (Algorithm R)
+- Periodic bounded refit in a background worker (thread or process)
+- Atomic hot-swap of the refitted model into its owner
+- Fit timing and sample statistics
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from core.lazy_imports import is_available
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESERVOIR_SIZE = 5000
+DEFAULT_REFIT_INTERVAL = 60.0
+DEFAULT_MIN_SAMPLES = 1000
+
+
+def fit_clone(template: Any, X: np.ndarray) -> Any:
+    """Fit an unfitted copy of ``template`` on ``X`` (runs in the fit worker)."""
+    from sklearn.base import clone
+
+    model = clone(template)
+    if hasattr(model, "n_jobs"):
+        model.n_jobs = 1
+    model.fit(X)
+    return model
+
+
+class ReservoirSample:
+    """
+    Fixed-size uniform sample of every row ever added.
+
+    Each of the ``seen`` rows is in the sample with probability
+    ``capacity / seen``; ``add`` handles a whole batch with vectorised
+    replacement decisions.
+    """
+
+    def __init__(self, capacity: int, n_features: int, seed: Optional[int] = None):
+        self.capacity = capacity
+        self.seen = 0
+        self._data = np.empty((capacity, n_features), dtype=np.float64)
+        self._size = 0
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, X: np.ndarray) -> None:
+        n = len(X)
+        if n == 0:
+            return
+
+        fill = min(self.capacity - self._size, n)
+        if fill:
+            self._data[self._size:self._size + fill] = X[:fill]
+            self._size += fill
+
+        rest = X[fill:]
+        if len(rest):
+            # Row k of the stream (0-based) replaces slot j ~ U[0, k] if j < capacity;
+            # with repeated slots the later row wins, as in the sequential algorithm
+            k = self.seen + fill + np.arange(len(rest))
+            j = (self._rng.random(len(rest)) * (k + 1)).astype(np.int64)
+            hit = j < self.capacity
+            self._data[j[hit]] = rest[hit]
+
+        self.seen += n
+
+    def snapshot(self) -> np.ndarray:
+        return self._data[:self._size].copy()
+
+
+class OnlineModelUpdater:
+    """
+    Keeps an owner's model current by periodic refits on a reservoir.
+
+    The owner feeds feature rows through ``observe`` (cheap, on the event
+    loop). Every ``refit_interval`` seconds, once at least ``min_samples``
+    rows are held and ``min_new_samples`` arrived since the last fit, an
+    unfitted clone of the owner's model is fitted on a snapshot of the
+    reservoir in a background worker and handed to ``owner.swap_model``.
+    The fit size is capped by the reservoir, so each refit costs bounded
+    CPU no matter how much telemetry has been seen.
+    """
+
+    def __init__(
+        self,
+        owner: Any,
+        n_features: int,
+        reservoir_size: int = DEFAULT_RESERVOIR_SIZE,
+        refit_interval: float = DEFAULT_REFIT_INTERVAL,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        min_new_samples: Optional[int] = None,
+        fit_in_process: bool = False,
+        seed: Optional[int] = None
+    ):
+        self.owner = owner
+        self.reservoir = ReservoirSample(reservoir_size, n_features, seed)
+        self.refit_interval = refit_interval
+        self.min_samples = min(min_samples, reservoir_size)
+        self.min_new_samples = min_samples if min_new_samples is None else min_new_samples
+        self.fit_in_process = fit_in_process
+
+        self._task: Optional[asyncio.Task] = None
+        self._fit_pool: Optional[Executor] = None
+        self._fit_lock = asyncio.Lock()
+        self._seen_at_fit = 0
+        self._logger = logging.getLogger(__name__)
+
+        self._fits = 0
+        self._fit_errors = 0
+        self._last_fit_ms = 0.0
+        self._last_fit_rows = 0
+        self._last_swap: Optional[float] = None
+
+    def observe(self, X: np.ndarray) -> None:
+        self.reservoir.add(X)
+
+    @property
+    def due(self) -> bool:
+        return (
+            len(self.reservoir) >= self.min_samples
+            and self.reservoir.seen - self._seen_at_fit >= self.min_new_samples
+        )
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+        self._logger.info(
+            f"Online learning started (reservoir={self.reservoir.capacity}, "
+            f"interval={self.refit_interval}s, process={self.fit_in_process})"
+        )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        if self._fit_pool is not None:
+            pool, self._fit_pool = self._fit_pool, None
+            await asyncio.to_thread(pool.shutdown, True)
+
+        self._logger.info(f"Online learning stopped (fits={self._fits})")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.refit_interval)
+            if self.due:
+                await self.refit()
+
+    def _executor(self) -> Optional[Executor]:
+        if self.fit_in_process and self._fit_pool is None:
+            self._fit_pool = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._fit_pool
+
+    async def refit(self) -> bool:
+        """Fit on the current reservoir and swap the result in."""
+        template = self.owner.model
+        if template is None or not is_available("sklearn") or len(self.reservoir) == 0:
+            return False
+
+        async with self._fit_lock:
+            X = self.reservoir.snapshot()
+            seen = self.reservoir.seen
+            loop = asyncio.get_running_loop()
+
+            t0 = time.perf_counter()
+            try:
+                model = await loop.run_in_executor(self._executor(), fit_clone, template, X)
+                await self.owner.swap_model(model)
+            except Exception as e:
+                self._fit_errors += 1
+                self._logger.error(f"Online refit failed: {e}", exc_info=True)
+                return False
+
+            self._last_fit_ms = (time.perf_counter() - t0) * 1000
+            self._last_fit_rows = len(X)
+            self._seen_at_fit = seen
+            self._fits += 1
+            self._last_swap = time.time()
+
+        self._logger.info(
+            f"Online refit #{self._fits} on {len(X)} samples "
+            f"({self._last_fit_ms:.0f}ms)"
+        )
+        return True
+
+    def health_status(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "reservoir_size": len(self.reservoir),
+            "reservoir_capacity": self.reservoir.capacity,
+            "samples_seen": self.reservoir.seen,
+            "refit_interval": self.refit_interval,
+            "refit_due": self.due,
+            "fits": self._fits,
+            "fit_errors": self._fit_errors,
+            "last_fit_ms": self._last_fit_ms,
+            "last_fit_rows": self._last_fit_rows,
+            "last_swap": self._last_swap
+        }
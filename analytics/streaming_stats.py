@@ -0,0 +1,349 @@
+"""
+Incremental statistics for telemetry streams.
+
+Features:
+- Batch ring window with running sums (O(1) mean/std)
+- Welford mean/variance with sample removal
+- Sliding-window least-squares slope in O(1) per sample
+- Monotonic-deque window minimum and maximum
+- P² streaming quantile estimates without storing samples
+"""
+
+import math
+from collections import deque
+from typing import Deque, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class RollingWindow:
+    """
+    Fixed-capacity numeric ring with a running sum and sum of squares.
+
+    ``push`` takes a whole batch and returns in O(batch) time; mean and
+    standard deviation are O(1). The running sums are recomputed from
+    the ring every so often to bound floating point drift.
+    """
+
+    def __init__(self, capacity: int, dtype=np.float64):
+        self.capacity = capacity
+        self._ring = np.zeros(capacity, dtype=dtype)
+        self._head = 0
+        self._size = 0
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._since_resync = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def push(self, values: np.ndarray) -> None:
+        cap = self.capacity
+        values = values[-cap:]
+        n = len(values)
+        if n == 0:
+            return
+
+        evicted = max(0, self._size + n - cap)
+        if evicted:
+            old = self._ring[(self._head - self._size + np.arange(evicted)) % cap]
+            self._sum -= float(old.sum())
+            self._sumsq -= float(np.dot(old, old))
+
+        self._ring[(self._head + np.arange(n)) % cap] = values
+        self._head = (self._head + n) % cap
+        self._size = min(cap, self._size + n)
+        self._sum += float(values.sum())
+        self._sumsq += float(np.dot(values, values))
+
+        self._since_resync += n
+        if self._since_resync >= 100 * cap:
+            window = self.latest()
+            self._sum = float(window.sum())
+            self._sumsq = float(np.dot(window, window))
+            self._since_resync = 0
+
+    def latest(self, n: Optional[int] = None) -> np.ndarray:
+        count = self._size if n is None else max(0, min(n, self._size))
+        return self._ring[(self._head - count + np.arange(count)) % self.capacity]
+
+    def mean(self) -> float:
+        return self._sum / self._size if self._size else 0.0
+
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1, as pandas)."""
+        n = self._size
+        if n < 2:
+            return float("nan")
+        var = (self._sumsq - self._sum * self._sum / n) / (n - 1)
+        return float(np.sqrt(max(var, 0.0)))
+
+
+class WelfordStats:
+    """
+    Running mean and variance (Welford), with support for removing a
+    previously added sample so it can track a sliding window.
+    """
+
+    __slots__ = ("count", "mean", "_m2")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+
+    def remove(self, x: float) -> None:
+        if self.count <= 1:
+            self.reset()
+            return
+        self.count -= 1
+        delta = x - self.mean
+        self.mean -= delta / self.count
+        self._m2 -= delta * (x - self.mean)
+
+    def reset(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def variance(self, ddof: int = 0) -> float:
+        if self.count <= ddof:
+            return float("nan")
+        return max(self._m2, 0.0) / (self.count - ddof)
+
+    def std(self, ddof: int = 0) -> float:
+        return math.sqrt(self.variance(ddof))
+
+
+class SlidingRegression:
+    """
+    Least-squares line through the last ``capacity`` samples in O(1).
+
+    Samples sit at x = 0..n-1 (oldest first), exactly as
+    ``np.polyfit(range(n), window, 1)`` sees them. Sliding the window
+    shifts every x by -1, which only changes Σxy by -Σy, so the fit never
+    has to revisit the window. Σx and Σx² have closed forms.
+    """
+
+    RESYNC_EVERY = 100
+
+    def __init__(self, capacity: int):
+        if capacity < 2:
+            raise ValueError(f"Capacity must be at least 2, got {capacity}")
+        self.capacity = capacity
+        self.values: Deque[float] = deque(maxlen=capacity)
+        self._sy = 0.0
+        self._sxy = 0.0
+        self._since_resync = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def push(self, y: float) -> Optional[float]:
+        """Add a sample; returns the evicted sample once the window is full."""
+        values = self.values
+        evicted = None
+        if len(values) == self.capacity:
+            evicted = values[0]
+            self._sy -= evicted
+            self._sxy -= self._sy
+        self._sxy += len(values) * y if evicted is None else (self.capacity - 1) * y
+        self._sy += y
+        values.append(y)
+
+        self._since_resync += 1
+        if self._since_resync >= self.RESYNC_EVERY * self.capacity:
+            self._resync()
+        return evicted
+
+    def _resync(self) -> None:
+        window = np.fromiter(self.values, dtype=np.float64, count=len(self.values))
+        self._sy = float(window.sum())
+        self._sxy = float(np.dot(np.arange(len(window)), window))
+        self._since_resync = 0
+
+    def fit(self) -> Tuple[float, float]:
+        """Return (slope, intercept); NaN with fewer than two samples."""
+        n = len(self.values)
+        if n < 2:
+            return float("nan"), float("nan")
+        sx = n * (n - 1) / 2.0
+        sxx = (n - 1) * n * (2 * n - 1) / 6.0
+        slope = (n * self._sxy - sx * self._sy) / (n * sxx - sx * sx)
+        return slope, (self._sy - slope * sx) / n
+
+    def predict(self, steps_ahead: int = 1) -> float:
+        """Extrapolate the line ``steps_ahead`` samples past the newest one."""
+        slope, intercept = self.fit()
+        return intercept + slope * (len(self.values) - 1 + steps_ahead)
+
+
+class SlidingExtrema:
+    """Window minimum and maximum in amortised O(1) via monotonic deques."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._index = 0
+        self._min: Deque[Tuple[int, float]] = deque()
+        self._max: Deque[Tuple[int, float]] = deque()
+
+    def push(self, x: float) -> None:
+        i = self._index
+        self._index += 1
+        expired = i - self.capacity
+
+        mins = self._min
+        while mins and mins[-1][1] >= x:
+            mins.pop()
+        mins.append((i, x))
+        if mins[0][0] <= expired:
+            mins.popleft()
+
+        maxs = self._max
+        while maxs and maxs[-1][1] <= x:
+            maxs.pop()
+        maxs.append((i, x))
+        if maxs[0][0] <= expired:
+            maxs.popleft()
+
+    @property
+    def min(self) -> float:
+        return self._min[0][1] if self._min else float("nan")
+
+    @property
+    def max(self) -> float:
+        return self._max[0][1] if self._max else float("nan")
+
+
+class P2Quantile:
+    """
+    P² streaming quantile estimator (Jain & Chlamtac, 1985).
+
+    Tracks one quantile with five markers whose heights are adjusted by
+    piecewise-parabolic interpolation; memory and update cost are O(1)
+    regardless of how many samples are seen. Exact for the first five
+    samples.
+    """
+
+    __slots__ = ("p", "count", "_q", "_n", "_np", "_dn")
+
+    def __init__(self, p: float):
+        if not 0.0 < p < 1.0:
+            raise ValueError(f"Quantile must be in (0, 1), got {p}")
+        self.p = p
+        self.count = 0
+        self._q = []
+        self._n = [0, 1, 2, 3, 4]
+        self._np = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self._dn = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        q = self._q
+        if self.count <= 5:
+            q.append(x)
+            if self.count == 5:
+                q.sort()
+            return
+
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        n = self._n
+        for i in range(k + 1, 5):
+            n[i] += 1
+        desired = self._np
+        dn = self._dn
+        for i in range(5):
+            desired[i] += dn[i]
+
+        for i in (1, 2, 3):
+            d = desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if not q[i - 1] < candidate < q[i + 1]:
+                    candidate = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                q[i] = candidate
+                n[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        q, n = self._q, self._n
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    @property
+    def value(self) -> float:
+        if self.count == 0:
+            return float("nan")
+        if self.count < 5:
+            ordered = sorted(self._q)
+            return float(np.percentile(ordered, self.p * 100))
+        return self._q[2]
+
+
+class RollingStats:
+    """
+    O(1)-per-sample summary of a numeric stream.
+
+    Count, mean, standard deviation, minimum, maximum and the regression
+    slope cover the last ``capacity`` samples. ``quantile`` gives P²
+    estimates over every sample since creation or the last ``reset``;
+    ``window_quantiles`` computes exact ones over the window on demand.
+    """
+
+    def __init__(self, capacity: int, quantiles: Sequence[float] = (0.5, 0.95, 0.99)):
+        self.capacity = capacity
+        self.regression = SlidingRegression(capacity)
+        self.moments = WelfordStats()
+        self.extrema = SlidingExtrema(capacity)
+        self.quantiles: Dict[float, P2Quantile] = {q: P2Quantile(q) for q in quantiles}
+        self.total = 0
+
+    @property
+    def values(self) -> Deque[float]:
+        return self.regression.values
+
+    def __len__(self) -> int:
+        return len(self.regression)
+
+    def push(self, x: float) -> None:
+        evicted = self.regression.push(x)
+        if evicted is not None:
+            self.moments.remove(evicted)
+        self.moments.add(x)
+        self.extrema.push(x)
+        for estimator in self.quantiles.values():
+            estimator.add(x)
+        self.total += 1
+
+    def quantile(self, q: float) -> float:
+        """P² estimate of ``q`` over every sample since creation or ``reset``."""
+        return self.quantiles[q].value
+
+    def window_quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """Exact quantiles of the current window; O(capacity), for reporting."""
+        return np.percentile(np.fromiter(self.values, np.float64, len(self)), np.asarray(qs) * 100)
+
+    def reset(self) -> None:
+        self.__init__(self.capacity, tuple(self.quantiles))
@@ -6,13 +6,17 @@ Features:
 - Feature engineering
 - Time series handling
 - Data validation
+- Pure-NumPy feature pipeline with reusable buffers
 """
 
 import logging
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Mapping, Union
 from dataclasses import dataclass
 import numpy as np
-import pandas as pd
+
+from core.lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +41,7 @@ class FeatureVector:
         ])
 
 
-def preprocess_telemetry(df: pd.DataFrame) -> pd.DataFrame:
+def preprocess_telemetry(df: "pd.DataFrame") -> "pd.DataFrame":
     if df.empty:
         logger.warning("Empty DataFrame provided for preprocessing")
         return pd.DataFrame()
@@ -85,7 +89,7 @@ def preprocess_telemetry(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def extract_features(
-    df: pd.DataFrame,
+    df: "pd.DataFrame",
     include_system_metrics: bool = False
 ) -> np.ndarray:
     if df.empty:
@@ -119,8 +123,118 @@ def extract_features(
         return np.array([])
 
 
+FEATURE_COLUMNS = ("latency_ms", "jitter_ms", "queue_size")
+Z_SCORE_LIMIT = 3.0
+
+
+def telemetry_features(
+    latency_us: np.ndarray,
+    queue_size: np.ndarray,
+    out: Optional[np.ndarray] = None,
+    scratch: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    NumPy equivalent of ``extract_features(preprocess_telemetry(df))``.
+
+    Computes (latency_ms, jitter_ms, queue_size) rows: jitter is taken
+    before rows missing latency or queue size are dropped, and rows whose
+    latency z-score (sample std) is 3 or more are filtered out; a zero or
+    undefined std filters every row, as in pandas.
+
+    Args:
+        latency_us: Latency column in microseconds
+        queue_size: Queue size column
+        out: Optional (n, 3) float64 buffer that receives the kept rows
+        scratch: Optional (n, 3) float64 work buffer, reused between calls
+
+    Returns:
+        np.ndarray: (kept, 3) feature matrix (a view of ``out`` if given)
+    """
+    n = len(latency_us)
+    if scratch is None:
+        scratch = np.empty((n, 3), dtype=np.float64)
+    work = scratch[:n]
+
+    latency_ms = work[:, 0]
+    jitter_ms = work[:, 1]
+    np.divide(latency_us, 1000.0, out=latency_ms, casting="unsafe")
+    work[:, 2] = queue_size
+
+    if n:
+        jitter_ms[0] = 0.0
+        np.subtract(latency_ms[1:], latency_ms[:-1], out=jitter_ms[1:])
+        np.abs(jitter_ms, out=jitter_ms)
+        jitter_ms[np.isnan(jitter_ms)] = 0.0
+
+    keep = ~np.isnan(latency_ms)
+    keep &= ~np.isnan(work[:, 2])
+    count = int(keep.sum())
+
+    if count > 1:
+        kept = latency_ms[keep]
+        mean = kept.mean()
+        std = kept.std(ddof=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            keep &= np.abs(latency_ms - mean) / std < Z_SCORE_LIMIT
+        count = int(keep.sum())
+
+    if out is None:
+        return work[keep]
+    return np.compress(keep, work, axis=0, out=out[:count])
+
+
+def frame_features(
+    data: Union["pd.DataFrame", np.ndarray, Mapping[str, np.ndarray]],
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Feature matrix from a DataFrame, structured array or dict of columns.
+
+    Uses ``latency_us`` (or ``latency_ms``) and ``queue_size``; falls back
+    to the pandas path when those columns are missing.
+    """
+    names = data.dtype.names if isinstance(data, np.ndarray) else data.keys()
+    if "queue_size" not in names or not ("latency_us" in names or "latency_ms" in names):
+        frame = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+        return extract_features(preprocess_telemetry(frame))
+
+    def column(name: str) -> np.ndarray:
+        values = np.asarray(data[name])
+        return values if values.dtype.kind == "f" else values.astype(np.float64)
+
+    if "latency_us" in names:
+        latency_us = column("latency_us")
+    else:
+        latency_us = column("latency_ms") * 1000.0
+
+    if len(latency_us) == 0:
+        return np.array([])
+    return telemetry_features(latency_us, column("queue_size"), out=out)
+
+
+class FeaturePipeline:
+    """
+    ``telemetry_features`` with buffers preallocated for up to ``capacity``
+    rows, for callers that score windows of similar size repeatedly. The
+    returned matrix is a view that the next ``transform`` overwrites.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._scratch = np.empty((capacity, 3), dtype=np.float64)
+        self._out = np.empty((capacity, 3), dtype=np.float64)
+
+    def transform(self, latency_us: np.ndarray, queue_size: np.ndarray) -> np.ndarray:
+        n = len(latency_us)
+        if n > self.capacity:
+            self.capacity = n
+            self._scratch = np.empty((n, 3), dtype=np.float64)
+            self._out = np.empty((n, 3), dtype=np.float64)
+        return telemetry_features(latency_us, queue_size, out=self._out, scratch=self._scratch)
+
+
 def calculate_statistics(
-    df: pd.DataFrame,
+    df: "pd.DataFrame",
     window_size: int = 100
 ) -> Dict[str, Any]:
     if df.empty:
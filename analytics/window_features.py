@@ -0,0 +1,273 @@
+"""
+Streaming windowed features over CAN TX frames.
+
+Features:
+- Sliding window (last ``window_us`` of frame time) and tumbling windows
+- Inter-arrival mean/variance and message rate
+- Steering angle delta, direction sign flips and value entropy
+- Duplicate-payload ratio and out-of-order timestamp count
+- O(1) amortised update per frame, cheap enough to run inline on can.tx
+"""
+
+import logging
+import math
+from collections import deque
+from dataclasses import dataclass, astuple, fields
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import numpy as np
+
+from analytics.streaming_stats import WelfordStats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_US = 1_000_000
+DEFAULT_TUMBLING_US = 1_000_000
+DEFAULT_TUMBLING_HISTORY = 60
+
+
+@dataclass
+class WindowFeatures:
+    frames: int
+    span_ms: float
+    message_rate_hz: float
+    inter_arrival_mean_ms: float
+    inter_arrival_var_ms2: float
+    angle_delta_mean: float
+    angle_delta_max: float
+    sign_flips: int
+    angle_entropy_bits: float
+    duplicate_ratio: float
+    out_of_order: int
+
+    def to_array(self) -> np.ndarray:
+        return np.array(astuple(self), dtype=np.float64)
+
+
+WINDOW_FEATURE_NAMES = tuple(f.name for f in fields(WindowFeatures))
+
+
+class _Frame:
+    __slots__ = ("ts_us", "angle", "gap_us", "delta", "flip", "reordered")
+
+    def __init__(
+        self,
+        ts_us: int,
+        angle: int,
+        gap_us: int,
+        delta: int,
+        flip: bool,
+        reordered: bool
+    ):
+        self.ts_us = ts_us
+        self.angle = angle
+        self.gap_us = gap_us
+        self.delta = delta
+        self.flip = flip
+        self.reordered = reordered
+
+
+class _WindowState:
+    """
+    Aggregates for a contiguous run of frames.
+
+    A frame's gap and delta relate it to its predecessor and its flip to
+    the two frames before it, so each only counts while those frames are
+    still in the window; evicting the oldest frame retracts them from the
+    next two frames.
+    """
+
+    def __init__(self):
+        self.frames: Deque[_Frame] = deque()
+        self.gaps = WelfordStats()
+        self.abs_delta_sum = 0.0
+        self.abs_deltas: Deque[tuple] = deque()  # monotonic (index, |delta|) for the max
+        self.flips = 0
+        self.reordered = 0
+        self.angle_counts: Dict[int, int] = {}
+        self.clogc = 0.0  # Σ c·log2(c) over angle counts, for O(1) entropy
+        self._index = 0
+        self._first_index = 0
+
+    def _count_angle(self, angle: int, step: int) -> None:
+        counts = self.angle_counts
+        c = counts.get(angle, 0)
+        if c > 1:
+            self.clogc -= c * math.log2(c)
+        c += step
+        if c > 1:
+            self.clogc += c * math.log2(c)
+        if c:
+            counts[angle] = c
+        else:
+            del counts[angle]
+
+    def add(self, frame: _Frame) -> None:
+        frames = self.frames
+        if frames:
+            self.gaps.add(frame.gap_us)
+            d = abs(frame.delta)
+            self.abs_delta_sum += d
+            maxima = self.abs_deltas
+            while maxima and maxima[-1][1] <= d:
+                maxima.pop()
+            maxima.append((self._index, d))
+            if len(frames) > 1 and frame.flip:
+                self.flips += 1
+        frames.append(frame)
+        self._index += 1
+        self.reordered += frame.reordered
+        self._count_angle(frame.angle, 1)
+
+    def pop_oldest(self) -> _Frame:
+        frames = self.frames
+        oldest = frames.popleft()
+        self._first_index += 1
+        self.reordered -= oldest.reordered
+        self._count_angle(oldest.angle, -1)
+
+        if frames:
+            second = frames[0]
+            self.gaps.remove(second.gap_us)
+            self.abs_delta_sum -= abs(second.delta)
+            if len(frames) > 1 and frames[1].flip:
+                self.flips -= 1
+            maxima = self.abs_deltas
+            while maxima and maxima[0][0] <= self._first_index:
+                maxima.popleft()
+        else:
+            self.gaps.reset()
+            self.abs_delta_sum = 0.0
+            self.abs_deltas.clear()
+            self.flips = 0
+        return oldest
+
+    def snapshot(self, window_us: Optional[int] = None) -> WindowFeatures:
+        frames = self.frames
+        n = len(frames)
+        span_us = frames[-1].ts_us - frames[0].ts_us if n else 0
+        # Rate over the configured window when there is one, otherwise over the span
+        rate_base_us = window_us or span_us
+        entropy = (math.log2(n) - self.clogc / n) if n else 0.0
+        return WindowFeatures(
+            frames=n,
+            span_ms=span_us / 1000.0,
+            message_rate_hz=n * 1_000_000 / rate_base_us if rate_base_us else 0.0,
+            inter_arrival_mean_ms=self.gaps.mean / 1000.0 if self.gaps.count else 0.0,
+            inter_arrival_var_ms2=self.gaps.variance() / 1e6 if self.gaps.count else 0.0,
+            angle_delta_mean=self.abs_delta_sum / (n - 1) if n > 1 else 0.0,
+            angle_delta_max=float(self.abs_deltas[0][1]) if self.abs_deltas else 0.0,
+            sign_flips=self.flips,
+            angle_entropy_bits=max(entropy, 0.0),
+            duplicate_ratio=(n - len(self.angle_counts)) / n if n else 0.0,
+            out_of_order=self.reordered
+        )
+
+
+class WindowFeatureExtractor:
+    """
+    Per-frame windowed features keyed on the frame ``timestamp_us``.
+
+    The sliding window holds frames newer than ``window_us`` before the
+    latest timestamp; tumbling windows cover aligned ``tumbling_us``
+    intervals and are emitted (kept in ``tumbling_history`` and passed to
+    ``on_window``) when a frame from a later interval arrives. Timestamps
+    that go backwards (replays, reordering) are counted as out-of-order
+    and clamped to the latest timestamp seen.
+
+    The payload of a steering frame is its angle, so duplicate payloads
+    are repeated angles within the window.
+    """
+
+    def __init__(
+        self,
+        window_us: int = DEFAULT_WINDOW_US,
+        tumbling_us: int = DEFAULT_TUMBLING_US,
+        tumbling_history: int = DEFAULT_TUMBLING_HISTORY,
+        on_window: Optional[Callable[[int, WindowFeatures], Any]] = None
+    ):
+        if window_us <= 0 or tumbling_us <= 0:
+            raise ValueError("Window lengths must be positive")
+
+        self.window_us = window_us
+        self.tumbling_us = tumbling_us
+        self.on_window = on_window
+        self.tumbling_history: Deque[tuple] = deque(maxlen=tumbling_history)
+
+        self._sliding = _WindowState()
+        self._tumbling = _WindowState()
+        self._tumbling_start: Optional[int] = None
+        self._last_ts: Optional[int] = None
+        self._last_angle: Optional[int] = None
+        self._last_delta = 0
+        self._frames_seen = 0
+        self._logger = logging.getLogger(__name__)
+
+    def add(self, timestamp_us: int, angle: int) -> None:
+        """Add one frame; O(1) amortised."""
+        last_ts = self._last_ts
+        reordered = last_ts is not None and timestamp_us < last_ts
+        ts = last_ts if reordered else timestamp_us
+
+        gap = ts - last_ts if last_ts is not None else 0
+        delta = angle - self._last_angle if self._last_angle is not None else 0
+        flip = delta * self._last_delta < 0
+        if delta:
+            self._last_delta = delta
+
+        frame = _Frame(ts, angle, gap, delta, flip, reordered)
+        self._last_ts = ts
+        self._last_angle = angle
+        self._frames_seen += 1
+
+        sliding = self._sliding
+        sliding.add(frame)
+        horizon = ts - self.window_us
+        while sliding.frames[0].ts_us <= horizon:
+            sliding.pop_oldest()
+
+        start = ts - ts % self.tumbling_us
+        if self._tumbling_start is None:
+            self._tumbling_start = start
+        elif start > self._tumbling_start:
+            self._emit_tumbling()
+            self._tumbling_start = start
+        self._tumbling.add(frame)
+
+    def _emit_tumbling(self) -> None:
+        features = self._tumbling.snapshot(self.tumbling_us)
+        self.tumbling_history.append((self._tumbling_start, features))
+        self._tumbling = _WindowState()
+        if self.on_window is not None:
+            try:
+                self.on_window(self._tumbling_start, features)
+            except Exception as e:
+                self._logger.error(f"Tumbling window callback failed: {e}", exc_info=True)
+
+    def on_can_tx_event(self, data: Dict[str, Any]) -> None:
+        ts = data.get("timestamp_us")
+        angle = data.get("angle")
+        if ts is None or angle is None:
+            return
+        self.add(int(ts), int(angle))
+
+    def sliding(self) -> WindowFeatures:
+        return self._sliding.snapshot(self.window_us)
+
+    def tumbling(self, last: Optional[int] = None) -> List[Dict[str, Any]]:
+        history = list(self.tumbling_history)
+        if last is not None:
+            history = history[-last:] if last > 0 else []
+        return [
+            {"start_us": start, **features.__dict__}
+            for start, features in history
+        ]
+
+    def health_status(self) -> Dict[str, Any]:
+        return {
+            "window_us": self.window_us,
+            "tumbling_us": self.tumbling_us,
+            "frames_seen": self._frames_seen,
+            "frames_in_window": len(self._sliding.frames),
+            "tumbling_windows": len(self.tumbling_history)
+        }
@@ -26,6 +26,9 @@ class Settings(BaseSettings):
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
     LOG_LEVEL: str = "INFO"
+    LOG_FILE: str = "data/system.log"
+    LOG_MAX_BYTES: int = 10485760
+    LOG_BACKUP_COUNT: int = 5
 
     DATABASE_URL: str = "sqlite+aiosqlite:///./data/aegiscan.db"
     DATABASE_POOL_SIZE: int = 10
@@ -42,12 +45,43 @@ class Settings(BaseSettings):
 
     MAX_TELEMETRY_BUFFER: int = 500
     TELEMETRY_RETENTION_DAYS: int = 30
+    TELEMETRY_BATCH_SIZE: int = 256
+    TELEMETRY_FLUSH_INTERVAL: float = 0.5
+    TELEMETRY_MAX_BACKLOG: int = 10000
+    TELEMETRY_DROP_POLICY: str = "drop_oldest"
+    TELEMETRY_BATCH_WINDOW: float = 0.02
 
     UDP_IP: str = "127.0.0.1"
     UDP_PORT: int = 5005
+    UDP_RCVBUF_BYTES: int = 1048576
+    UDP_RECV_BATCH: int = 64
     CAN_CHANNEL: str = "vcan0"
+    CAN_SCHEDULING: str = "priority"
+    CAN_DEADLINE_POLICY: Optional[str] = None
+    CAN_TX_BURST: int = 32
+    DOS_RATE_HZ: float = 2000.0
     STEERING_SCALE_FACTOR: float = 900.0 / 255.0
 
+    EVENT_TRANSPORT_SOCKET: Optional[str] = None
+    EVENT_TRANSPORT_LISTEN: bool = True
+    EVENT_TRANSPORT_TOPICS: str = "can.tx,attack.event,system.metrics"
+
+    INFERENCE_EXECUTOR: str = "process"
+    INFERENCE_WORKERS: int = 2
+    INFERENCE_MAX_PENDING: int = 32
+    INFERENCE_INLINE_MAX_ROWS: int = 16
+    ANALYTICS_ENABLED: bool = True
+    ANALYTICS_WARMUP: bool = True
+    LATENCY_BUDGET_US: int = 5000
+    ONLINE_LEARNING: bool = True
+    ONLINE_REFIT_INTERVAL: float = 60.0
+    ONLINE_RESERVOIR_SIZE: int = 5000
+    ONLINE_MIN_SAMPLES: int = 1000
+
+    @property
+    def event_transport_topics(self) -> list:
+        return [t.strip() for t in self.EVENT_TRANSPORT_TOPICS.split(",") if t.strip()]
+
     @property
     def is_sqlite(self) -> bool:
         return "sqlite" in self.DATABASE_URL.lower()
@@ -1,24 +1,37 @@
-import numpy as np
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 from backend.config import settings
-from backend.routers import gateway, analytics, external
+from backend.routers import gateway, external
 from backend.dependencies import engine
-from core.logger_engine import logger as core_logger
+from core.logger_engine import configure_logging
+from core.event_bus import event_bus
+from core.event_transport import UnixSocketTransport
 from core.metrics_engine import metrics_engine
-from src.gateway import Gateway
 
+# The analytics router pulls in numpy, sklearn and pandas; gateway-only
+# deployments never import it.
+if settings.ANALYTICS_ENABLED:
+    from backend.routers import analytics
+else:
+    analytics = None
+
+configure_logging()
 logger = logging.getLogger(__name__)
 
-_gateway_instance: Gateway = None
+_event_transport: UnixSocketTransport = None
+_warmup_task: asyncio.Task = None
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global _event_transport, _warmup_task
+
     try:
         logger.info("Starting AegisCAN-RT Application")
+        event_bus.bind_loop()
         from sqlalchemy import text
         async with engine.begin() as conn:
             await conn.execute(text("SELECT 1"))
@@ -32,9 +45,24 @@ async def lifespan(app: FastAPI):
         except ImportError:
             logger.warning("backend.models not found, skipping table creation")
 
+        gateway.get_gateway()
         metrics_engine.start()
         logger.info("Metrics engine started")
 
+        if analytics and settings.ANALYTICS_WARMUP:
+            _warmup_task = asyncio.create_task(analytics.warm_up_models())
+        if analytics and analytics.anomaly_detector.learner:
+            analytics.anomaly_detector.learner.start()
+
+        if settings.EVENT_TRANSPORT_SOCKET:
+            _event_transport = UnixSocketTransport(
+                settings.EVENT_TRANSPORT_SOCKET,
+                settings.event_transport_topics,
+                listen=settings.EVENT_TRANSPORT_LISTEN
+            )
+            await _event_transport.start()
+            logger.info("Event transport started")
+
         logger.info("Application startup complete")
 
         yield
@@ -47,9 +75,24 @@ async def lifespan(app: FastAPI):
         try:
             logger.info("Shutting down AegisCAN-RT Application")
 
+            if _event_transport:
+                await _event_transport.stop()
+                _event_transport = None
+                logger.info("Event transport stopped")
+
             await metrics_engine.stop()
             logger.info("Metrics engine stopped")
 
+            if _warmup_task:
+                _warmup_task.cancel()
+                await asyncio.gather(_warmup_task, return_exceptions=True)
+                _warmup_task = None
+
+            if analytics:
+                if analytics.anomaly_detector.learner:
+                    await analytics.anomaly_detector.learner.stop()
+                await analytics.inference_executor.shutdown()
+
             await engine.dispose()
             logger.info("Database connection closed")
 
@@ -92,15 +135,16 @@ app.include_router(
     },
 )
 
-app.include_router(
-    analytics.router,
-    prefix="/api/analytics",
-    tags=["Analytics"],
-    responses={
-        400: {"description": "Bad Request"},
-        500: {"description": "Internal Server Error"},
-    },
-)
+if analytics:
+    app.include_router(
+        analytics.router,
+        prefix="/api/analytics",
+        tags=["Analytics"],
+        responses={
+            400: {"description": "Bad Request"},
+            500: {"description": "Internal Server Error"},
+        },
+    )
 
 app.include_router(
     external.router,
@@ -3,10 +3,12 @@ Enhanced analytics router with ML model integration.
 (This expands on the previous backend/routers/analytics.py)
 """
 
+import asyncio
 import logging
 import sqlite3
 import json
-from typing import Optional, List
+import time
+from typing import Any, Dict, Optional, List
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Query, HTTPException, status
@@ -14,19 +16,89 @@ from fastapi import APIRouter, Query, HTTPException, status
 from backend.config import settings
 from backend.schemas.models import TelemetryResponse, TelemetryEntry, ErrorResponse
 from analytics.anomaly_detector import AnomalyDetector
+from analytics.inference_executor import EXECUTOR_PROCESS, InferenceExecutor, InferenceRejected
 from analytics.cyber_attack_classifier import CyberAttackClassifier
 from analytics.latency_predictor import LatencyPredictor
+from analytics.model_store import process_age_ms, process_memory
 from analytics.system_health_ai import SystemHealthMonitor
-import pandas as pd
+from analytics.window_features import WindowFeatureExtractor
+from core.event_bus import event_bus, EventTopic
+from core.lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-anomaly_detector = AnomalyDetector(contamination=0.05)
-attack_classifier = CyberAttackClassifier()
-latency_predictor = LatencyPredictor(window_size=100)
+inference_executor = InferenceExecutor(
+    mode=settings.INFERENCE_EXECUTOR,
+    max_workers=settings.INFERENCE_WORKERS,
+    max_pending=settings.INFERENCE_MAX_PENDING
+)
+anomaly_detector = AnomalyDetector(
+    contamination=0.05,
+    executor=inference_executor,
+    inline_max_rows=settings.INFERENCE_INLINE_MAX_ROWS
+)
+anomaly_detector.start_streaming()
+if settings.ONLINE_LEARNING:
+    anomaly_detector.enable_online_learning(
+        reservoir_size=settings.ONLINE_RESERVOIR_SIZE,
+        refit_interval=settings.ONLINE_REFIT_INTERVAL,
+        min_samples=settings.ONLINE_MIN_SAMPLES,
+        fit_in_process=settings.INFERENCE_EXECUTOR == EXECUTOR_PROCESS
+    )
+attack_classifier = CyberAttackClassifier(
+    executor=inference_executor,
+    inline_max_rows=settings.INFERENCE_INLINE_MAX_ROWS
+)
+latency_predictor = LatencyPredictor(
+    window_size=100,
+    latency_budget_us=settings.LATENCY_BUDGET_US
+)
+event_bus.subscribe(EventTopic.CAN_TX.value, latency_predictor.on_can_tx_event)
 health_monitor = SystemHealthMonitor()
+window_features = WindowFeatureExtractor()
+event_bus.subscribe(EventTopic.CAN_TX.value, window_features.on_can_tx_event)
+
+startup_report: Dict[str, Any] = {}
+
+
+async def warm_up_models() -> Dict[str, Any]:
+    """
+    Load the analytics models and start the inference workers.
+
+    Runs as a background task after startup so the API serves requests
+    while models load; anything that needs a model sooner loads it on
+    first use. The report (this worker's cold start time and memory) is
+    logged and served as ``startup`` by ``/api/analytics/health/status``.
+    """
+    t0 = time.perf_counter()
+    before = process_memory()
+
+    await asyncio.gather(anomaly_detector.warm_up(), attack_classifier.warm_up())
+    await inference_executor.start()
+
+    after = process_memory()
+    startup_report.update(
+        pid=after["pid"],
+        cold_start_ms=process_age_ms(),
+        warmup_ms=(time.perf_counter() - t0) * 1000,
+        model_load_ms={
+            "anomaly_detector": anomaly_detector.health_status()["load_ms"],
+            "attack_classifier": attack_classifier.health_status()["load_ms"]
+        },
+        memory_before_warmup=before,
+        memory=after
+    )
+
+    logger.info(
+        f"Analytics warm-up done in {startup_report['warmup_ms']:.0f}ms "
+        f"(pid={after['pid']}, rss={after['rss_mb'] or 0:.0f}MB, "
+        f"pss={after['pss_mb'] or 0:.0f}MB)"
+    )
+    return startup_report
 
 
 def get_db_path() -> str:
@@ -37,25 +109,43 @@ def get_db_path() -> str:
 @router.get("/anomalies/detect")
 async def detect_anomalies(
     limit: int = Query(100, ge=1, le=1000),
-    threshold: float = Query(0.1, ge=0, le=1)
+    threshold: float = Query(0.1, ge=0, le=1),
+    stream: bool = Query(True)
 ):
     """
     Detect anomalies in recent telemetry using ML.
 
+    Served from the streaming detector's rolling window when it has
+    scored live traffic; otherwise recent rows are read from the
+    database and scored on demand.
+
     Args:
         limit: Number of recent samples
         threshold: Anomaly alert threshold (0-1)
+        stream: Prefer the rolling streaming state
 
     Returns:
         dict: Anomaly detection results
     """
+    if stream:
+        state = anomaly_detector.stream_state(limit)
+        if state is not None:
+            return {
+                "status": "success",
+                "source": "stream",
+                "alert": state["anomaly_ratio"] > threshold,
+                **state
+            }
+
     try:
         db_path = get_db_path()
 
         with sqlite3.connect(db_path) as conn:
             df = pd.read_sql_query(
-                f"SELECT * FROM telemetry ORDER BY timestamp DESC LIMIT {limit}",
-                conn
+                "SELECT timestamp, latency_us, queue_size FROM telemetry "
+                "WHERE type = 'CAN_TX' ORDER BY timestamp DESC LIMIT ?",
+                conn,
+                params=(limit,)
             )
 
         if df.empty:
@@ -70,12 +160,14 @@ async def detect_anomalies(
         if event is None:
             return {
                 "status": "success",
+                "source": "database",
                 "anomalies": [],
                 "anomaly_ratio": 0
             }
 
         return {
             "status": "success",
+            "source": "database",
             "anomaly_ratio": event.anomaly_ratio,
             "anomaly_count": event.anomaly_count,
             "total_samples": event.total_samples,
@@ -84,6 +176,12 @@ async def detect_anomalies(
             "predictions": predictions.tolist()
         }
 
+    except InferenceRejected as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Inference busy: {str(e)}"
+        )
+
     except Exception as e:
         logger.error(f"Anomaly detection failed: {e}", exc_info=True)
         raise HTTPException(
@@ -107,9 +205,11 @@ async def classify_attack(
 
         with sqlite3.connect(db_path) as conn:
             df = pd.read_sql_query(
-                f"SELECT * FROM telemetry WHERE type='ATTACK' "
-                f"ORDER BY timestamp DESC LIMIT {limit}",
-                conn
+                "SELECT timestamp, attack_type, severity, event_count, "
+                "latency_us, queue_size FROM telemetry "
+                "WHERE type = 'ATTACK' ORDER BY timestamp DESC LIMIT ?",
+                conn,
+                params=(limit,)
             )
 
         if df.empty:
@@ -119,21 +219,19 @@ async def classify_attack(
                 "classifications": []
             }
 
-        from analytics.utils import extract_features, preprocess_telemetry
+        from analytics.utils import frame_features
 
-        processed = preprocess_telemetry(df)
-        X = extract_features(processed)
+        X = frame_features(df)
 
-        predictions = []
-        for features in X:
-            pred = await attack_classifier.classify(features)
-            if pred:
-                predictions.append({
-                    "type": pred.attack_type,
-                    "confidence": pred.confidence,
-                    "timestamp": pred.timestamp.isoformat(),
-                    "probabilities": pred.probabilities
-                })
+        predictions = [
+            {
+                "type": pred.attack_type,
+                "confidence": pred.confidence,
+                "timestamp": pred.timestamp.isoformat(),
+                "probabilities": pred.probabilities
+            }
+            for pred in await attack_classifier.classify_batch(X)
+        ]
 
         return {
             "status": "success",
@@ -141,6 +239,12 @@ async def classify_attack(
             "classifications": predictions
         }
 
+    except InferenceRejected as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Inference busy: {str(e)}"
+        )
+
     except Exception as e:
         logger.error(f"Attack classification failed: {e}", exc_info=True)
         raise HTTPException(
@@ -148,6 +252,27 @@ async def classify_attack(
             detail=f"Classification failed: {str(e)}"
         )
 
+@router.get("/features/window")
+async def get_window_features(
+    last: int = Query(10, ge=0, le=60)
+):
+    """
+    Get windowed CAN TX timing and steering features.
+
+    Args:
+        last: Number of completed tumbling windows to include
+
+    Returns:
+        dict: Sliding-window features and recent tumbling windows
+    """
+    return {
+        "status": "success",
+        "sliding": window_features.sliding().__dict__,
+        "tumbling": window_features.tumbling(last),
+        "health": window_features.health_status()
+    }
+
+
 @router.get("/latency/trends")
 async def get_latency_trends():
     """
@@ -159,6 +284,7 @@ async def get_latency_trends():
     return {
         "status": "success",
         "statistics": latency_predictor.get_statistics(),
+        "forecast": latency_predictor.get_forecast(),
         "health": latency_predictor.health_status()
     }
 
@@ -176,7 +302,10 @@ async def get_health_status():
         "health_monitor": health_monitor.health_status(),
         "anomaly_detector": anomaly_detector.health_status(),
         "attack_classifier": attack_classifier.health_status(),
-        "latency_predictor": latency_predictor.health_status()
+        "latency_predictor": latency_predictor.health_status(),
+        "window_features": window_features.health_status(),
+        "inference_executor": inference_executor.health_status(),
+        "startup": startup_report or None
     }
 
 @router.post("/health/thresholds")
@@ -13,10 +13,11 @@ import time
 from typing import Optional
 from enum import Enum
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
 from src.gateway import Gateway
+from src.telemetry_buffer import TYPE_NAMES
 from backend.schemas.models import (
     StatusResponse,
     AttackResponse,
@@ -27,10 +28,24 @@ from backend.schemas.models import (
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
-gateway = Gateway()
 
+_gateway: Optional[Gateway] = None
 _gateway_start_time: Optional[float] = None
 
+def get_gateway() -> Gateway:
+    """
+    Return the process-wide gateway, creating it on first use.
+
+    Creating the gateway opens the telemetry DB and subscribes to the
+    event bus, so it is deferred until startup or the first request
+    rather than done when this router is imported.
+    """
+    global _gateway
+    if _gateway is None:
+        _gateway = Gateway()
+    return _gateway
+
+
 class AttackMode(str, Enum):
     """Valid attack modes for the gateway."""
     DOS = "dos"
@@ -55,6 +70,7 @@ async def gateway_status():
         StatusResponse: Current gateway status (active/inactive)
     """
     try:
+        gateway = get_gateway()
         is_running = getattr(gateway, "running", False)
         status_val = "active" if is_running else "inactive"
         message = "BLE-CAN gateway ready" if is_running else "Gateway not started"
@@ -93,6 +109,7 @@ async def gateway_health():
         HealthResponse: Detailed health information
     """
     try:
+        gateway = get_gateway()
         is_running = getattr(gateway, "running", False)
         attack_mode = getattr(gateway.can, "attack_mode", None) if hasattr(gateway, "can") else None
         telemetry_count = len(getattr(gateway, "telemetry", []))
@@ -117,6 +134,54 @@ async def gateway_health():
             detail="Health check failed"
         )
 
+@router.get(
+    "/telemetry/window",
+    summary="Get recent buffered telemetry as columns",
+    responses={
+        200: {"description": "Telemetry window retrieved"},
+        500: {"description": "Failed to read telemetry buffer"}
+    }
+)
+async def telemetry_window(
+    n: int = Query(100, ge=1, le=100_000, description="Number of recent samples")
+):
+    """
+    Get the last N buffered telemetry samples in columnar form.
+
+    Reads straight from the in-memory ring buffer; no database access.
+
+    Args:
+        n: Number of recent samples
+
+    Returns:
+        dict: Column name to list of values, ordered oldest to newest
+    """
+    try:
+        gateway = get_gateway()
+        window = gateway.telemetry_window(n)
+        angle = window["angle"]
+
+        columns = {
+            name: values.tolist()
+            for name, values in window.items()
+            if name not in ("angle", "type_code")
+        }
+        columns["angle"] = [None if a != a else a for a in angle.tolist()]
+        columns["type"] = [TYPE_NAMES.get(code, "UNKNOWN") for code in window["type_code"].tolist()]
+
+        return {
+            "status": "success",
+            "count": len(angle),
+            "columns": columns
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to read telemetry window: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to read telemetry window"
+        )
+
 @router.post(
     "/start",
     response_model=StatusResponse,
@@ -145,8 +210,9 @@ async def start_gateway():
         HTTPException: If gateway already running or startup fails
     """
     global _gateway_start_time
-
     try:
+        gateway = get_gateway()
+
         is_running = getattr(gateway, "running", False)
 
         if is_running:
@@ -202,8 +268,9 @@ async def stop_gateway():
         HTTPException: If gateway not running or shutdown fails
     """
     global _gateway_start_time
-
     try:
+        gateway = get_gateway()
+
         is_running = getattr(gateway, "running", False)
 
         if not is_running:
@@ -262,6 +329,7 @@ async def trigger_attack(mode: str):
         HTTPException 500: Activation failed
     """
     try:
+        gateway = get_gateway()
         mode_lower = mode.lower() if mode else ""
         valid_modes = [e.value for e in AttackMode]
 
@@ -324,8 +392,9 @@ async def reset_gateway():
         StatusResponse: Reset status
     """
     global _gateway_start_time
-
     try:
+        gateway = get_gateway()
+
         logger.info("Resetting gateway...")
 
         is_running = getattr(gateway, "running", False)
@@ -83,8 +83,6 @@ class LoggerEngine:
             logger.filters = [f for f in logger.filters if not isinstance(f, ContextFilter)]
             logger.addFilter(cls._context_filter)
 
-LoggerEngine.configure()
-
 def get_logger(name: str) -> logging.Logger:
     """Get a configured logger instance."""
     return LoggerEngine.get_logger(name)
\ No newline at end of file
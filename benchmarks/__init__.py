@@ -0,0 +1,10 @@
+"""
+Performance benchmarks for AegisCAN-RT.
+
+Provides:
+- Gateway pipeline latency benchmarks
+- Throughput measurements
+- Before/after comparisons for hot-path changes
+"""
+
+__version__ = "0.1.0"
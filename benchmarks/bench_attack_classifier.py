@@ -0,0 +1,93 @@
+"""
+Benchmark per-row attack classification against classify_batch.
+
+The legacy path awaits ``classify`` once per feature row, which costs a
+``predict`` and a ``predict_proba`` call per row; ``classify_batch`` runs
+one ``predict_proba`` over the whole matrix.
+
+Usage:
+    python benchmarks/bench_attack_classifier.py --repeat 3
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analytics.cyber_attack_classifier import ATTACK_TYPES, CyberAttackClassifier
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+ROW_COUNTS = (50, 500, 5000)
+
+
+def make_classifier(seed: int = 0) -> CyberAttackClassifier:
+    """Fit the classifier in memory on synthetic features (nothing is saved)."""
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(2000, 3))
+    y = rng.integers(0, len(ATTACK_TYPES), len(X))
+    X[:, 0] += y * 2.0
+
+    classifier = CyberAttackClassifier()
+    classifier.model.fit(X, y)
+    classifier._trained = True
+    return classifier
+
+
+def classify_row_legacy(model, features: np.ndarray) -> tuple:
+    """Per-row work done by classify before classify_batch existed."""
+    features = features.reshape(1, -1)
+    pred = model.predict(features)[0]
+    probs = model.predict_proba(features)[0]
+    return ATTACK_TYPES.get(pred, "UNKNOWN"), float(probs.max())
+
+
+async def run(repeat: int) -> None:
+    classifier = make_classifier()
+    model = classifier.model
+    rng = np.random.default_rng(1)
+
+    for rows in ROW_COUNTS:
+        X = rng.normal(size=(rows, 3))
+
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            for features in X:
+                classify_row_legacy(model, features)
+                await asyncio.sleep(0)
+        per_row = (time.perf_counter() - t0) / repeat
+
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            await classifier.classify_batch(X)
+        batch = (time.perf_counter() - t0) / repeat
+
+        logger.info(
+            f"{rows:>5} rows | per-row {per_row * 1000:>10.1f}ms | "
+            f"batch {batch * 1000:>8.1f}ms | {per_row / batch:>6.1f}x"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-row vs batched attack classification"
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per row count")
+    args = parser.parse_args()
+
+    logger.info("=" * 60)
+    logger.info("Attack classifier benchmark")
+    logger.info("=" * 60)
+    asyncio.run(run(args.repeat))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+Benchmark end-to-end UDP -> CAN TX latency of the CANTranslator pipeline.
+
+Compares the legacy thread-hop/polling loop against the native asyncio
+priority queue pipeline.
+
+Usage:
+    python benchmarks/bench_can_pipeline.py --frames 2000 --rate 500
+"""
+
+import argparse
+import asyncio
+import logging
+import socket
+import struct
+import sys
+import time
+from pathlib import Path
+from queue import PriorityQueue, Empty
+from typing import List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.event_bus import event_bus, EventTopic
+from src.can_translator import CANTranslator
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+class LegacyCANTranslator(CANTranslator):
+    """Pre-asyncio pipeline: thread hop per packet and 5 ms idle polling."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._legacy_queue: PriorityQueue = PriorityQueue(maxsize=self.max_queue_size)
+        self._legacy_tasks: List[asyncio.Task] = []
+        self._sock = None
+
+    async def start(self) -> None:
+        self._setup_can_bus()
+        self.running = True
+        self._legacy_tasks = [
+            asyncio.create_task(self._udp_receiver_loop()),
+            asyncio.create_task(self._process_loop())
+        ]
+
+    async def stop(self) -> None:
+        self.running = False
+        for task in self._legacy_tasks:
+            task.cancel()
+        await asyncio.gather(*self._legacy_tasks, return_exceptions=True)
+        if self.can_bus:
+            self.can_bus.shutdown()
+            self.can_bus = None
+
+    async def _udp_receiver_loop(self) -> None:
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind((self.listen_ip, self.listen_port))
+        self._sock.setblocking(False)
+        loop = asyncio.get_running_loop()
+
+        try:
+            while self.running:
+                try:
+                    data, _ = await loop.sock_recvfrom(self._sock, 64)
+                    if len(data) >= 10:
+                        priority = data[0]
+                        ts_us = struct.unpack('<Q', data[1:9])[0]
+                        deadline_us = time.monotonic_ns() // 1000 + self._budget_by_priority[priority]
+                        await asyncio.to_thread(
+                            self._legacy_queue.put_nowait,
+                            (priority, priority, deadline_us, ts_us, data[9])
+                        )
+                except BlockingIOError:
+                    await asyncio.sleep(0.005)
+        finally:
+            self._sock.close()
+            self._sock = None
+
+    async def _process_loop(self) -> None:
+        while self.running:
+            try:
+                packet = await asyncio.wait_for(
+                    asyncio.to_thread(self._legacy_queue.get_nowait),
+                    timeout=0.1
+                )
+                self._process_packet(packet)
+            except (asyncio.TimeoutError, Empty):
+                await asyncio.sleep(0.005)
+
+
+async def measure(translator: CANTranslator, frames: int, rate_hz: float) -> List[int]:
+    loop = asyncio.get_running_loop()
+    latencies: List[int] = []
+    done = asyncio.Event()
+
+    def on_can_tx(data: dict) -> None:
+        latencies.append(int(loop.time() * 1_000_000) - data["timestamp_us"])
+        if len(latencies) >= frames:
+            done.set()
+
+    event_bus.subscribe(EventTopic.CAN_TX.value, on_can_tx)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    interval = 1.0 / rate_hz
+
+    try:
+        await translator.start()
+        await asyncio.sleep(0.1)
+
+        for i in range(frames):
+            ts_us = int(loop.time() * 1_000_000)
+            packet = bytes([0]) + struct.pack('<Q', ts_us) + bytes([i % 256])
+            sender.sendto(packet, (translator.listen_ip, translator.listen_port))
+            await asyncio.sleep(interval)
+
+        try:
+            await asyncio.wait_for(done.wait(), timeout=5.0)
+        except asyncio.TimeoutError:
+            logger.warning(f"Only {len(latencies)}/{frames} frames observed")
+
+    finally:
+        sender.close()
+        await translator.stop()
+        event_bus.unsubscribe(EventTopic.CAN_TX.value, on_can_tx)
+
+    return latencies
+
+
+def summarize(name: str, latencies: List[int]) -> None:
+    if not latencies:
+        logger.info(f"{name:<10} no samples")
+        return
+
+    arr = np.asarray(latencies, dtype=np.float64)
+    logger.info(
+        f"{name:<10} n={len(arr):<6} "
+        f"p50={np.percentile(arr, 50):>9.1f}µs "
+        f"p90={np.percentile(arr, 90):>9.1f}µs "
+        f"p99={np.percentile(arr, 99):>9.1f}µs "
+        f"max={arr.max():>9.1f}µs"
+    )
+
+
+async def run(frames: int, rate_hz: float, port: int) -> None:
+    legacy = await measure(LegacyCANTranslator(listen_port=port), frames, rate_hz)
+    current = await measure(CANTranslator(listen_port=port + 1), frames, rate_hz)
+
+    logger.info("=" * 60)
+    logger.info(f"End-to-end UDP -> CAN TX latency ({frames} frames @ {rate_hz} Hz)")
+    logger.info("=" * 60)
+    summarize("legacy", legacy)
+    summarize("asyncio", current)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark CANTranslator end-to-end latency"
+    )
+    parser.add_argument("--frames", type=int, default=2000, help="Frames to send")
+    parser.add_argument("--rate", type=float, default=500.0, help="Send rate in Hz")
+    parser.add_argument("--port", type=int, default=5105, help="First UDP port to use")
+
+    args = parser.parse_args()
+    logging.getLogger("src").setLevel(logging.WARNING)
+
+    asyncio.run(run(args.frames, args.rate, args.port))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
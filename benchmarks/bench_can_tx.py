@@ -0,0 +1,153 @@
+"""
+Benchmark CAN transmission on the event loop versus the CANTxWorker thread.
+
+Frames are sent to a python-can virtual bus. An optional per-send delay
+emulates a slow interface (a blocking socketcan write, a USB adapter).
+A ticker task measures event loop lag while frames are being sent, which
+is what the UDP receiver, event bus and API handlers experience.
+
+Usage:
+    python benchmarks/bench_can_tx.py --frames 20000 --send-delay-us 200
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import can
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.can_translator import CAN_ARBITRATION_ID
+from src.can_tx_worker import CANTxWorker
+from src.frame_codec import STEERING_PAYLOAD
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+TICK_INTERVAL = 0.001
+
+
+class SlowBus:
+    """Virtual bus wrapper whose send blocks for a fixed time."""
+
+    def __init__(self, bus: can.BusABC, delay_s: float):
+        self._bus = bus
+        self._delay_s = delay_s
+
+    def send(self, msg: can.Message, timeout=None) -> None:
+        if self._delay_s:
+            time.sleep(self._delay_s)
+        self._bus.send(msg, timeout)
+
+
+async def ticker(lags: List[float], stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + TICK_INTERVAL
+        await asyncio.sleep(TICK_INTERVAL)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def run_inline(bus: SlowBus, frames: int, chunk: int) -> Dict[str, np.ndarray]:
+    """Legacy path: build a Message per frame and send on the loop."""
+    lags: List[float] = []
+    send_us: List[int] = []
+    stop = asyncio.Event()
+    tick_task = asyncio.create_task(ticker(lags, stop))
+    payload = bytearray(STEERING_PAYLOAD.size)
+
+    for i in range(frames):
+        STEERING_PAYLOAD.pack_into(payload, 0, i % 900)
+        msg = can.Message(arbitration_id=CAN_ARBITRATION_ID, data=payload, is_extended_id=False)
+        t0 = time.perf_counter()
+        bus.send(msg)
+        send_us.append(int((time.perf_counter() - t0) * 1_000_000))
+        if i % chunk == chunk - 1:
+            await asyncio.sleep(0)
+
+    stop.set()
+    await tick_task
+    return {"send_us": np.array(send_us), "lag": np.array(lags)}
+
+
+async def run_worker(bus: SlowBus, frames: int, chunk: int, burst: int) -> Dict[str, np.ndarray]:
+    """Worker path: submit from the loop, send on the TX thread."""
+    lags: List[float] = []
+    send_us: List[int] = []
+    stop = asyncio.Event()
+    done = asyncio.Event()
+
+    def on_complete(results):
+        for r in results:
+            send_us.append(r[8])
+        if len(send_us) >= frames:
+            done.set()
+
+    worker = CANTxWorker(bus, CAN_ARBITRATION_ID, on_complete, max_pending=frames, max_burst=burst)
+    worker.start()
+    tick_task = asyncio.create_task(ticker(lags, stop))
+
+    for i in range(frames):
+        worker.submit(i % 900, i, 0, False, 0)
+        if i % chunk == chunk - 1:
+            await asyncio.sleep(0)
+
+    await done.wait()
+    stop.set()
+    await tick_task
+    await asyncio.to_thread(worker.stop)
+    return {"send_us": np.array(send_us), "lag": np.array(lags)}
+
+
+def report(label: str, elapsed: float, frames: int, result: Dict[str, np.ndarray]) -> None:
+    send_us = result["send_us"]
+    lag_ms = result["lag"] * 1000 if len(result["lag"]) else np.zeros(1)
+    logger.info(
+        f"{label:<16} {frames / elapsed:>10,.0f} fps | "
+        f"send p50={np.percentile(send_us, 50):>6.0f}µs p99={np.percentile(send_us, 99):>6.0f}µs | "
+        f"loop lag p99={np.percentile(lag_ms, 99):>7.2f}ms max={lag_ms.max():>7.2f}ms"
+    )
+
+
+async def run(args) -> None:
+    delay_s = args.send_delay_us / 1_000_000
+
+    for label in ("inline", "worker"):
+        bus = can.interface.Bus(interface="virtual", channel="bench-can-tx")
+        slow = SlowBus(bus, delay_s)
+        try:
+            t0 = time.perf_counter()
+            if label == "inline":
+                result = await run_inline(slow, args.frames, args.chunk)
+            else:
+                result = await run_worker(slow, args.frames, args.chunk, args.burst)
+            report(label, time.perf_counter() - t0, args.frames, result)
+        finally:
+            bus.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark CAN transmission on the event loop vs a TX thread"
+    )
+    parser.add_argument("--frames", type=int, default=20000, help="Frames to send")
+    parser.add_argument("--send-delay-us", type=int, default=0, help="Emulated per-send blocking time")
+    parser.add_argument("--chunk", type=int, default=64, help="Frames submitted per loop iteration")
+    parser.add_argument("--burst", type=int, default=32, help="TX worker burst size")
+    args = parser.parse_args()
+
+    logger.info("=" * 60)
+    logger.info(f"CAN TX benchmark ({args.frames} frames, send delay {args.send_delay_us}µs)")
+    logger.info("=" * 60)
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
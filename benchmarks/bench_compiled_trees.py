@@ -0,0 +1,94 @@
+"""
+Benchmark compiled tree tables against sklearn inference.
+
+Times IsolationForest.score_samples and RandomForestClassifier.predict_proba
+against their compiled equivalents for a few batch sizes, and the
+mmap load of the saved tables.
+
+Usage:
+    python benchmarks/bench_compiled_trees.py --repeat 2000
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from sklearn.ensemble import IsolationForest, RandomForestClassifier
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analytics.compiled_trees import compile_model, load_compiled
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+ROW_COUNTS = (1, 10, 100)
+
+
+def make_models(seed: int = 0) -> tuple:
+    """Models shaped like the detector's and classifier's defaults."""
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(5000, 3))
+    y = rng.integers(0, 6, len(X))
+    X[:, 0] += y * 2.0
+
+    iso = IsolationForest(n_estimators=100, random_state=42).fit(X)
+    rf = RandomForestClassifier(n_estimators=100, max_depth=10, random_state=42).fit(X, y)
+    return (iso, "score_samples"), (rf, "predict_proba")
+
+
+def per_call_us(fn, X: np.ndarray, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn(X)
+    return (time.perf_counter() - t0) / repeat * 1e6
+
+
+def run(repeat: int) -> None:
+    rng = np.random.default_rng(1)
+
+    for model, method in make_models():
+        with tempfile.TemporaryDirectory() as tmp:
+            compile_model(model).save(tmp)
+            t0 = time.perf_counter()
+            compiled = load_compiled(tmp)
+            load_ms = (time.perf_counter() - t0) * 1000
+
+            logger.info(
+                f"{type(model).__name__}: {compiled.n_nodes} nodes, "
+                f"depth {compiled.max_depth}, mmap load {load_ms:.2f}ms"
+            )
+
+            for rows in ROW_COUNTS:
+                X = rng.normal(size=(rows, 3))
+                assert np.allclose(getattr(model, method)(X), getattr(compiled, method)(X))
+
+                sk = per_call_us(getattr(model, method), X, max(1, repeat // 50))
+                fast = per_call_us(getattr(compiled, method), X, repeat)
+                logger.info(
+                    f"  {rows:>4} rows | sklearn {sk:>9.1f}us | "
+                    f"compiled {fast:>8.1f}us | {sk / fast:>6.1f}x"
+                )
+            del compiled
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark compiled tree tables vs sklearn inference"
+    )
+    parser.add_argument("--repeat", type=int, default=2000, help="Compiled calls per row count")
+    args = parser.parse_args()
+
+    logger.info("=" * 60)
+    logger.info("Compiled tree inference benchmark")
+    logger.info("=" * 60)
+    run(args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""
+Benchmark EventBus.publish against the legacy per-publish introspection path.
+
+Reports publishes/s for 1, 10 and 100 subscribers, with all-sync and
+all-async callbacks, plus the non-awaiting publish_nowait path, and
+compares exact-topic with wildcard (``can.*``) subscriptions.
+
+Usage:
+    python benchmarks/bench_event_bus.py --publishes 100000
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.event_bus import EventBus
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+TOPIC = "can.tx"
+SUBSCRIBER_COUNTS = (1, 10, 100)
+
+
+class LegacyEventBus(EventBus):
+    """EventBus.publish as it was before dispatch tables."""
+
+    async def publish(
+        self,
+        topic: str,
+        data: Any = None,
+        timeout: Optional[float] = None
+    ) -> int:
+        if topic not in self._subscribers:
+            return 0
+
+        self._active_topics.add(topic)
+        callbacks = self._subscribers[topic][:]
+        executed = 0
+
+        for callback in callbacks:
+            try:
+                if asyncio.iscoroutinefunction(callback):
+                    if timeout:
+                        await asyncio.wait_for(callback(data), timeout=timeout)
+                    else:
+                        await callback(data)
+                else:
+                    callback(data)
+                executed += 1
+            except Exception:
+                self._error_count += 1
+
+        return executed
+
+
+def make_sync_callback():
+    def on_event(data):
+        pass
+    return on_event
+
+
+def make_async_callback():
+    async def on_event(data):
+        pass
+    return on_event
+
+
+async def measure(bus: EventBus, publishes: int) -> float:
+    payload = {"angle": 10, "latency_us": 42}
+    publish = bus.publish
+
+    t0 = time.perf_counter()
+    for _ in range(publishes):
+        await publish(TOPIC, payload)
+    return publishes / (time.perf_counter() - t0)
+
+
+async def measure_nowait(bus: EventBus, publishes: int) -> float:
+    payload = {"angle": 10, "latency_us": 42}
+    publish_nowait = bus.publish_nowait
+
+    t0 = time.perf_counter()
+    for _ in range(publishes):
+        publish_nowait(TOPIC, payload)
+    await bus.drain(TOPIC)
+    return publishes / (time.perf_counter() - t0)
+
+
+async def run(publishes: int) -> None:
+    for kind, factory in (("sync", make_sync_callback), ("async", make_async_callback)):
+        logger.info("=" * 60)
+        logger.info(f"{kind} subscribers")
+        logger.info("=" * 60)
+
+        for count in SUBSCRIBER_COUNTS:
+            rates = {}
+            for label, bus_cls in (("legacy", LegacyEventBus), ("dispatch", EventBus)):
+                bus = bus_cls()
+                for _ in range(count):
+                    bus.subscribe(TOPIC, factory())
+                n = max(1000, publishes // count)
+                rates[label] = await measure(bus, n)
+                if label == "dispatch":
+                    rates["nowait"] = await measure_nowait(bus, n)
+
+            logger.info(
+                f"{count:>4} subs | legacy {rates['legacy']:>12,.0f} pub/s | "
+                f"dispatch {rates['dispatch']:>12,.0f} pub/s | "
+                f"nowait {rates['nowait']:>12,.0f} pub/s | "
+                f"{rates['dispatch'] / rates['legacy']:.2f}x"
+            )
+
+
+async def run_wildcard(publishes: int) -> None:
+    logger.info("=" * 60)
+    logger.info("exact vs wildcard subscriptions (sync)")
+    logger.info("=" * 60)
+
+    for count in SUBSCRIBER_COUNTS:
+        rates = {}
+        for label, pattern in (("exact", TOPIC), ("wildcard", "can.*")):
+            bus = EventBus()
+            for _ in range(count):
+                bus.subscribe(pattern, make_sync_callback())
+            rates[label] = await measure_nowait(bus, max(1000, publishes // count))
+
+        logger.info(
+            f"{count:>4} subs | exact {rates['exact']:>12,.0f} pub/s | "
+            f"wildcard {rates['wildcard']:>12,.0f} pub/s"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark EventBus publish throughput"
+    )
+    parser.add_argument("--publishes", type=int, default=100000, help="Publishes per single-subscriber run")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.publishes))
+    asyncio.run(run_wildcard(args.publishes))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Benchmark the pandas telemetry feature path against the NumPy pipeline.
+
+Compares ``extract_features(preprocess_telemetry(df))`` with
+``telemetry_features`` on column arrays and with a ``FeaturePipeline``
+reusing preallocated buffers, and checks that all three agree.
+
+Usage:
+    python benchmarks/bench_feature_pipeline.py --max-rows 1000000
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analytics.utils import (
+    FeaturePipeline,
+    extract_features,
+    preprocess_telemetry,
+    telemetry_features,
+)
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+ROW_COUNTS = (100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+def make_columns(rows: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    latency_us = rng.normal(20000, 5000, rows)
+    latency_us[rng.random(rows) < 0.01] = np.nan
+    latency_us[rng.random(rows) < 0.001] = 500_000
+    queue_size = rng.integers(0, 50, rows).astype(np.float64)
+    return latency_us, queue_size
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark pandas vs NumPy telemetry feature extraction"
+    )
+    parser.add_argument("--max-rows", type=int, default=1_000_000, help="Largest row count")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    logger.info("=" * 60)
+    logger.info("Feature pipeline benchmark")
+    logger.info("=" * 60)
+
+    for rows in (r for r in ROW_COUNTS if r <= args.max_rows):
+        latency_us, queue_size = make_columns(rows)
+        df = pd.DataFrame({
+            "timestamp": pd.date_range("2025-01-01", periods=rows, freq="ms"),
+            "latency_us": latency_us,
+            "queue_size": queue_size
+        })
+        pipeline = FeaturePipeline(rows)
+
+        expected = extract_features(preprocess_telemetry(df))
+        np.testing.assert_allclose(telemetry_features(latency_us, queue_size), expected)
+        np.testing.assert_allclose(pipeline.transform(latency_us, queue_size), expected)
+
+        pandas_s = best_of(lambda: extract_features(preprocess_telemetry(df)), args.repeat)
+        numpy_s = best_of(lambda: telemetry_features(latency_us, queue_size), args.repeat)
+        reuse_s = best_of(lambda: pipeline.transform(latency_us, queue_size), args.repeat)
+
+        logger.info(
+            f"{rows:>9,} rows | pandas {pandas_s * 1000:>9.3f}ms | "
+            f"numpy {numpy_s * 1000:>9.3f}ms ({pandas_s / numpy_s:>5.1f}x) | "
+            f"preallocated {reuse_s * 1000:>9.3f}ms ({pandas_s / reuse_s:>5.1f}x)"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
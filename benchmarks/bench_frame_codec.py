@@ -0,0 +1,144 @@
+"""
+Microbenchmark the UDP frame codec against the legacy slicing path.
+
+Reports per-frame time and transient allocation (tracemalloc peak above
+baseline) for decode + CAN payload packing, encode, and batch decode.
+
+Usage:
+    python benchmarks/bench_frame_codec.py --frames 200000
+"""
+
+import argparse
+import logging
+import struct
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.frame_codec import (
+    FRAME_HEADER,
+    FRAME_HEADER_SIZE,
+    FRAME_SIZE,
+    STEERING_LUT,
+    STEERING_PAYLOAD,
+    FrameEncoder,
+    decode_batch,
+    encode_frame_into,
+)
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+SCALE = 900 / 255
+
+
+def legacy_decode(data: bytes) -> bytes:
+    priority = data[0]
+    ts_us = struct.unpack('<Q', data[1:9])[0]
+    ble_data = data[9:]
+    raw = ble_data[0] if ble_data else 127
+    return struct.pack('<h', int((raw - 127) * SCALE))
+
+
+def make_codec_decode() -> Callable[[bytes], bytearray]:
+    payload = bytearray(STEERING_PAYLOAD.size)
+    unpack_from = FRAME_HEADER.unpack_from
+    pack_into = STEERING_PAYLOAD.pack_into
+
+    def decode(data: bytes) -> bytearray:
+        priority, ts_us = unpack_from(data, 0)
+        pack_into(payload, 0, STEERING_LUT[data[FRAME_HEADER_SIZE]])
+        return payload
+
+    return decode
+
+
+def legacy_encode(priority: int, ts: int, data: bytes) -> bytes:
+    return bytes([priority]) + struct.pack('<Q', ts) + data
+
+
+def time_per_frame(fn: Callable, args: tuple, frames: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        fn(*args)
+    return (time.perf_counter() - t0) / frames * 1e9
+
+
+def transient_bytes(fn: Callable, args: tuple, samples: int = 2000) -> float:
+    fn(*args)
+    tracemalloc.start()
+    total = 0
+    for _ in range(samples):
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        total += peak - current
+    tracemalloc.stop()
+    return total / samples
+
+
+def report(name: str, fn: Callable, args: tuple, frames: int) -> None:
+    logger.info(
+        f"{name:<22} {time_per_frame(fn, args, frames):>8.1f} ns/frame  "
+        f"{transient_bytes(fn, args):>7.1f} B transient/frame"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Microbenchmark the UDP frame codec"
+    )
+    parser.add_argument("--frames", type=int, default=200000, help="Frames per measurement")
+    args = parser.parse_args()
+
+    frame = bytearray(FRAME_SIZE)
+    encode_frame_into(frame, 0, 1_700_000_000_000_000, b"\xc8")
+    frame = bytes(frame)
+    encoder = FrameEncoder()
+
+    logger.info("=" * 60)
+    logger.info("Per-frame decode (header + steering + CAN payload)")
+    logger.info("=" * 60)
+    report("legacy slicing", legacy_decode, (frame,), args.frames)
+    report("codec unpack_from", make_codec_decode(), (frame,), args.frames)
+
+    logger.info("=" * 60)
+    logger.info("Per-frame encode")
+    logger.info("=" * 60)
+    report("legacy concat", legacy_encode, (0, 123456789, b"\xc8"), args.frames)
+    report("codec pack_into", encoder.encode, (0, 123456789, b"\xc8"), args.frames)
+
+    logger.info("=" * 60)
+    logger.info("Batch decode")
+    logger.info("=" * 60)
+    for count in (64, 4096, 1_000_000):
+        packed = frame * count
+        decode = make_codec_decode()
+
+        t0 = time.perf_counter()
+        for i in range(count):
+            decode(packed[i * FRAME_SIZE:(i + 1) * FRAME_SIZE])
+        loop_ns = (time.perf_counter() - t0) / count * 1e9
+
+        t0 = time.perf_counter()
+        decoded = decode_batch(packed)
+        np.asarray(decoded["angle"]).sum()
+        batch_ns = (time.perf_counter() - t0) / count * 1e9
+
+        logger.info(
+            f"{count:>9} frames  loop={loop_ns:>7.1f} ns/frame  "
+            f"decode_batch={batch_ns:>7.2f} ns/frame"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
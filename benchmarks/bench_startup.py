@@ -0,0 +1,159 @@
+"""
+Benchmark application import time and time to first /health response.
+
+Runs ``python -X importtime -c "import backend.main"`` in a fresh
+interpreter and prints the slowest modules by cumulative import time,
+lists which heavy optional dependencies were actually imported, then
+starts uvicorn and times the first 200 from ``/health``.
+
+Usage:
+    python benchmarks/bench_startup.py --runs 3
+    python benchmarks/bench_startup.py --gateway-only
+"""
+
+import argparse
+import json
+import logging
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+ROOT = Path(__file__).parent.parent
+HEAVY_MODULES = ("sklearn", "pandas", "scipy", "joblib", "can", "psutil")
+
+# Prints the heavy modules that were really imported (lazy stand-ins
+# are not counted) as JSON on the last line.
+PROBE = (
+    "import json, sys, time\n"
+    "t0 = time.perf_counter()\n"
+    "import backend.main\n"
+    "ms = (time.perf_counter() - t0) * 1000\n"
+    "heavy = [m for m in {heavy!r} if m in sys.modules]\n"
+    "print(json.dumps({{'import_ms': ms, 'imported': heavy}}))\n"
+)
+
+
+def child_env(gateway_only: bool) -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    env["ANALYTICS_ENABLED"] = "false" if gateway_only else "true"
+    return env
+
+
+def import_profile(env: Dict[str, str]) -> List[Tuple[int, int, str]]:
+    """``-X importtime`` rows as (self_us, cumulative_us, module)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import backend.main"],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return rows
+
+
+def import_probe(env: Dict[str, str]) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(heavy=HEAVY_MODULES)],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_health(env: Dict[str, str], timeout: float) -> float:
+    """Seconds from spawning uvicorn to the first 200 from /health."""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    t0 = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend.main:app",
+         "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - t0 < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {server.returncode}")
+            try:
+                with urllib.request.urlopen(url, timeout=0.5) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - t0
+            except OSError:
+                time.sleep(0.01)
+        raise TimeoutError(f"/health did not respond within {timeout}s")
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def run(runs: int, top: int, gateway_only: bool, timeout: float) -> None:
+    env = child_env(gateway_only)
+    mode = "gateway-only" if gateway_only else "full (analytics enabled)"
+    logger.info(f"Mode: {mode}")
+
+    rows = import_profile(env)
+    logger.info(f"Top {top} modules by cumulative import time:")
+    for self_us, cumulative_us, name in sorted(rows, key=lambda r: r[1], reverse=True)[:top]:
+        logger.info(f"  {cumulative_us / 1000:>8.1f}ms  (self {self_us / 1000:>6.1f}ms)  {name}")
+
+    probes = [import_probe(env) for _ in range(runs)]
+    import_ms = sorted(p["import_ms"] for p in probes)
+    logger.info(
+        f"import backend.main: median {import_ms[len(import_ms) // 2]:.0f}ms, "
+        f"min {import_ms[0]:.0f}ms over {runs} runs"
+    )
+    logger.info(f"Heavy modules imported: {', '.join(probes[-1]['imported']) or 'none'}")
+
+    health_s = sorted(time_to_health(env, timeout) for _ in range(runs))
+    logger.info(
+        f"Spawn to first /health: median {health_s[len(health_s) // 2] * 1000:.0f}ms, "
+        f"min {health_s[0] * 1000:.0f}ms over {runs} runs"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark AegisCAN-RT import time and time to first /health"
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Fresh processes per measurement")
+    parser.add_argument("--top", type=int, default=25, help="Modules to list from -X importtime")
+    parser.add_argument(
+        "--gateway-only",
+        action="store_true",
+        help="Start with ANALYTICS_ENABLED=false"
+    )
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait for /health")
+    args = parser.parse_args()
+
+    logger.info("=" * 60)
+    logger.info("Startup benchmark")
+    logger.info("=" * 60)
+    run(args.runs, args.top, args.gateway_only, args.timeout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+Benchmark UDP ingress throughput and loss on loopback.
+
+Compares the legacy one-datagram-per-await sock_recvfrom loop against the
+batched DatagramProtocol ingress. Frames are sent from a separate process.
+
+Usage:
+    python benchmarks/bench_udp_ingress.py --frames 200000 --rate 50000
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import socket
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.frame_codec import FRAME_HEADER
+from src.udp_ingress import UDPIngress, SLOT_SIZE
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+HOST = "127.0.0.1"
+BURST = 100
+
+
+def send_frames(port: int, frames: int, rate_hz: float) -> None:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    packet = bytearray(10)
+    burst_interval = BURST / rate_hz
+    next_burst = time.perf_counter()
+
+    for i in range(0, frames, BURST):
+        for j in range(min(BURST, frames - i)):
+            struct.pack_into('<BQB', packet, 0, 0, i + j, 127)
+            sock.sendto(packet, (HOST, port))
+
+        next_burst += burst_interval
+        delay = next_burst - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+    sock.close()
+
+
+class Sink:
+    def __init__(self):
+        self.received = 0
+
+    def on_datagram(self, data: bytes) -> None:
+        struct.unpack('<Q', data[1:9])
+        self.received += 1
+
+    def on_batch(self, buffer: memoryview, sizes: List[int], count: int) -> None:
+        unpack_from = FRAME_HEADER.unpack_from
+        for i in range(count):
+            unpack_from(buffer, i * SLOT_SIZE)
+        self.received += count
+
+
+async def legacy_receiver(port: int, sink: Sink, stop: asyncio.Event) -> None:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((HOST, port))
+    sock.setblocking(False)
+    loop = asyncio.get_running_loop()
+
+    async def loop_body():
+        while True:
+            try:
+                data, _ = await loop.sock_recvfrom(sock, 64)
+                sink.on_datagram(data)
+            except BlockingIOError:
+                await asyncio.sleep(0.005)
+
+    task = asyncio.create_task(loop_body())
+    await stop.wait()
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    sock.close()
+
+
+async def measure(variant: str, port: int, frames: int, rate_hz: float, rcvbuf: int) -> dict:
+    sink = Sink()
+    stop = asyncio.Event()
+    ingress = None
+
+    if variant == "legacy":
+        receiver = asyncio.create_task(legacy_receiver(port, sink, stop))
+    else:
+        ingress = UDPIngress(HOST, port, sink.on_batch, rcvbuf_bytes=rcvbuf)
+        await ingress.start()
+        receiver = None
+
+    await asyncio.sleep(0.1)
+
+    sender = multiprocessing.Process(target=send_frames, args=(port, frames, rate_hz))
+    t0 = time.perf_counter()
+    sender.start()
+
+    while sender.is_alive():
+        await asyncio.sleep(0.05)
+
+    last = -1
+    while sink.received != last:
+        last = sink.received
+        await asyncio.sleep(0.2)
+    elapsed = time.perf_counter() - t0
+
+    result = {
+        "variant": variant,
+        "received": sink.received,
+        "lost": frames - sink.received,
+        "fps": sink.received / elapsed,
+        "kernel_drops": None,
+        "avg_batch": 1.0
+    }
+
+    if ingress:
+        status = ingress.health_status()
+        result["kernel_drops"] = status["kernel_drops"]
+        result["avg_batch"] = status["avg_batch"]
+        ingress.close()
+    else:
+        stop.set()
+        await receiver
+
+    return result
+
+
+async def run(frames: int, rate_hz: float, port: int, rcvbuf: int) -> None:
+    results = [
+        await measure("legacy", port, frames, rate_hz, rcvbuf),
+        await measure("protocol", port + 1, frames, rate_hz, rcvbuf),
+    ]
+
+    logger.info("=" * 60)
+    logger.info(f"UDP ingress: {frames} frames @ {rate_hz:.0f} Hz target")
+    logger.info("=" * 60)
+    for r in results:
+        logger.info(
+            f"{r['variant']:<10} received={r['received']:<8} lost={r['lost']:<8} "
+            f"rate={r['fps']:>9.0f} fps  avg_batch={r['avg_batch']:>5.1f}  "
+            f"kernel_drops={r['kernel_drops']}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark UDP ingress throughput"
+    )
+    parser.add_argument("--frames", type=int, default=200000, help="Frames to send")
+    parser.add_argument("--rate", type=float, default=50000.0, help="Target send rate in Hz")
+    parser.add_argument("--port", type=int, default=5115, help="First UDP port to use")
+    parser.add_argument("--rcvbuf", type=int, default=1 << 20, help="SO_RCVBUF in bytes")
+
+    args = parser.parse_args()
+
+    asyncio.run(run(args.frames, args.rate, args.port, args.rcvbuf))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@ Core module initialization.
 
 Provides centralized access to core components:
 - Event bus for pub/sub messaging
+- Event transports for cross-process pub/sub
 - Logger for structured logging
 - Task manager for async task lifecycle
 - Metrics engine for performance monitoring
@@ -10,6 +11,7 @@ Provides centralized access to core components:
 """
 
 from core.event_bus import event_bus, EventBus
+from core.event_transport import EventTransport, UnixSocketTransport
 from core.logger_engine import get_logger, LoggerEngine
 from core.task_manager import task_manager, TaskManager
 from core.metrics_engine import metrics_engine, MetricsEngine
@@ -18,6 +20,8 @@ from core.scheduler import scheduler, TaskScheduler
 __all__ = [
     "event_bus",
     "EventBus",
+    "EventTransport",
+    "UnixSocketTransport",
     "get_logger",
     "LoggerEngine",
     "task_manager",
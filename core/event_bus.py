@@ -7,16 +7,39 @@ Features:
 - Exception isolation
 - Subscriber tracking
 - Type-safe events
+- Precomputed sync/async dispatch tables
+- Sequential, concurrent and queued delivery modes
+- Non-blocking publish for hot paths
+- Thread-safe publish onto the owning loop
+- Hierarchical wildcard subscriptions (``*`` and ``#``)
+- Sampled, latest-only and time-windowed batch subscriptions
 """
 
 import asyncio
 import logging
-from collections import defaultdict
-from typing import Any, Callable, Dict, List, Optional, Set
+import threading
+import time
+from collections import defaultdict, deque
+from functools import partial
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+Callback = Callable[[Any], Any]
+
+DELIVERY_SEQUENTIAL = "sequential"
+DELIVERY_CONCURRENT = "concurrent"
+DELIVERY_QUEUED = "queued"
+DELIVERY_MODES = (DELIVERY_SEQUENTIAL, DELIVERY_CONCURRENT, DELIVERY_QUEUED)
+
+DEFAULT_MAILBOX_SIZE = 1000
+
+TOPIC_SEPARATOR = "."
+WILDCARD_ONE = "*"
+WILDCARD_REST = "#"
+
+
 class EventTopic(str, Enum):
     """Standard event topics."""
     CAN_TX = "can.tx"
@@ -30,6 +53,349 @@ class EventTopic(str, Enum):
     ERROR = "error"
 
 
+class Subscription:
+    """
+    A callback registered on a topic pattern.
+
+    Queued subscriptions own a bounded mailbox and a worker task that
+    invokes the callback. When the mailbox is full the oldest event is
+    dropped. The mailbox is a deque drained in full on every wakeup, and
+    it is bound lazily to the loop that first delivers to it.
+
+    Coalescing subscriptions (``sample_interval`` and/or ``batch_window``)
+    are dispatched through ``accept``, which runs inline with the sync
+    callbacks and forwards only what should reach the callback: one event
+    per sample interval, or the list of events collected during a batch
+    window. Async callbacks receive that output through the mailbox.
+    """
+
+    __slots__ = (
+        "topic", "callback", "delivery", "is_async", "mailbox_size",
+        "with_topic", "seq", "sample_interval", "batch_window", "batch_max",
+        "sampled_out", "batches", "_next_due", "_batch", "_batch_timer",
+        "queued", "delivered", "dropped", "errors",
+        "lag_ms_last", "lag_ms_max", "_lag_ms_total",
+        "_mailbox", "_waiter", "_idle", "_worker", "_loop", "_on_error",
+    )
+
+    def __init__(
+        self,
+        topic: str,
+        callback: Callback,
+        delivery: str,
+        mailbox_size: int,
+        on_error: Callable[["Subscription", BaseException], None],
+        with_topic: bool = False,
+        seq: int = 0,
+        sample_interval: Optional[float] = None,
+        batch_window: Optional[float] = None,
+        batch_max: Optional[int] = None
+    ):
+        self.topic = topic
+        self.callback = callback
+        self.delivery = delivery
+        self.is_async = asyncio.iscoroutinefunction(callback)
+        self.mailbox_size = max(1, mailbox_size)
+        self.with_topic = with_topic
+        self.seq = seq
+        self.sample_interval = sample_interval
+        self.batch_window = batch_window
+        self.batch_max = batch_max
+        self._on_error = on_error
+
+        self._next_due = 0.0
+        self._batch: List[Any] = []
+        self._batch_timer: Optional[asyncio.TimerHandle] = None
+
+        self._mailbox: Deque[Tuple[float, str, Any]] = deque(maxlen=self.mailbox_size)
+        self._waiter: Optional[asyncio.Future] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.queued = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.sampled_out = 0
+        self.batches = 0
+        self.lag_ms_last = 0.0
+        self.lag_ms_max = 0.0
+        self._lag_ms_total = 0.0
+
+    @property
+    def name(self) -> str:
+        return getattr(self.callback, "__qualname__", repr(self.callback))
+
+    @property
+    def coalescing(self) -> bool:
+        return self.sample_interval is not None or self.batch_window is not None
+
+    def accept(self, topic: str, data: Any) -> None:
+        """Apply sampling and batching to an event, then deliver it."""
+        if self.sample_interval is not None:
+            now = time.monotonic()
+            if now < self._next_due:
+                self.sampled_out += 1
+                return
+            self._next_due = now + self.sample_interval
+
+        if self.batch_window is None:
+            self._deliver(topic, data)
+            return
+
+        batch = self._batch
+        batch.append((topic, data) if self.with_topic else data)
+        if self.batch_max and len(batch) >= self.batch_max:
+            self.flush()
+        elif self._batch_timer is None:
+            self._batch_timer = asyncio.get_running_loop().call_later(
+                self.batch_window, self.flush
+            )
+
+    def flush(self) -> None:
+        """Deliver the pending batch now."""
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        if not self._batch:
+            return
+
+        batch = self._batch
+        self._batch = []
+        self.batches += 1
+        self._deliver(None, batch)
+
+    def _deliver(self, topic: Optional[str], payload: Any) -> None:
+        # topic is None for batches, which are passed to the callback alone
+        if self.is_async or self.delivery == DELIVERY_QUEUED:
+            loop = asyncio.get_running_loop()
+            self.offer(topic, payload, loop, loop.time())
+            return
+
+        try:
+            if self.with_topic and topic is not None:
+                self.callback(topic, payload)
+            else:
+                self.callback(payload)
+            self.delivered += 1
+        except Exception as exc:
+            self.errors += 1
+            self._on_error(self, exc)
+
+    def offer(
+        self,
+        topic: Optional[str],
+        data: Any,
+        loop: asyncio.AbstractEventLoop,
+        now: float
+    ) -> None:
+        """Put an event in the mailbox without waiting."""
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._start(loop)
+
+        mailbox = self._mailbox
+        if len(mailbox) == self.mailbox_size:
+            self.dropped += 1
+        mailbox.append((now, topic, data))
+        self.queued += 1
+
+        waiter = self._waiter
+        if waiter is not None:
+            self._waiter = None
+            self._idle.clear()
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _start(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+        self._loop = loop
+        self._mailbox.clear()
+        self._waiter = None
+        self._idle = asyncio.Event()
+        self._worker = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        mailbox = self._mailbox
+        loop = self._loop
+        callback = self.callback
+        is_async = self.is_async
+        with_topic = self.with_topic
+
+        while True:
+            if not mailbox:
+                self._waiter = loop.create_future()
+                self._idle.set()
+                await self._waiter
+                continue
+
+            enqueued_at, topic, data = mailbox.popleft()
+
+            lag_ms = (loop.time() - enqueued_at) * 1000
+            self.lag_ms_last = lag_ms
+            self._lag_ms_total += lag_ms
+            if lag_ms > self.lag_ms_max:
+                self.lag_ms_max = lag_ms
+
+            try:
+                args = (topic, data) if with_topic and topic is not None else (data,)
+                if is_async:
+                    await callback(*args)
+                else:
+                    callback(*args)
+                self.delivered += 1
+            except Exception as exc:
+                self.errors += 1
+                self._on_error(self, exc)
+
+    async def join(self) -> None:
+        """Wait until every queued event has been handled."""
+        if self._idle is not None and self._loop is asyncio.get_running_loop():
+            while self._mailbox or not self._idle.is_set():
+                await self._idle.wait()
+
+    def close(self) -> None:
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        self._batch = []
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+        self._worker = None
+        self._waiter = None
+        self._idle = None
+        self._loop = None
+        self._mailbox.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        handled = self.delivered + self.errors
+        return {
+            "topic": self.topic,
+            "callback": self.name,
+            "delivery": self.delivery,
+            "depth": len(self._mailbox),
+            "capacity": self.mailbox_size,
+            "queued": self.queued,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "sampled_out": self.sampled_out,
+            "batches": self.batches,
+            "lag_ms_last": self.lag_ms_last,
+            "lag_ms_avg": self._lag_ms_total / handled if handled else 0.0,
+            "lag_ms_max": self.lag_ms_max
+        }
+
+
+def validate_topic_pattern(pattern: str) -> None:
+    """
+    Check a subscription pattern.
+
+    Segments are separated by ``.``; ``*`` matches exactly one segment and
+    ``#`` (last segment only) matches zero or more trailing segments.
+    """
+    segments = pattern.split(TOPIC_SEPARATOR)
+    for i, segment in enumerate(segments):
+        if not segment:
+            raise ValueError(f"Empty segment in topic pattern '{pattern}'")
+        if segment == WILDCARD_REST and i != len(segments) - 1:
+            raise ValueError(f"'{WILDCARD_REST}' must be the last segment in '{pattern}'")
+        if segment not in (WILDCARD_ONE, WILDCARD_REST) and (
+            WILDCARD_ONE in segment or WILDCARD_REST in segment
+        ):
+            raise ValueError(f"Wildcards must fill a whole segment in '{pattern}'")
+
+
+def is_wildcard(pattern: str) -> bool:
+    return WILDCARD_ONE in pattern or WILDCARD_REST in pattern
+
+
+class _TrieNode:
+    __slots__ = ("children", "patterns")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.patterns: Set[str] = set()
+
+
+class TopicTrie:
+    """
+    Segment trie of subscription patterns.
+
+    ``match`` walks one level per topic segment, following the literal
+    child and the ``*`` child, and collecting ``#`` children on the way.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+
+    def insert(self, pattern: str) -> None:
+        node = self._root
+        for segment in pattern.split(TOPIC_SEPARATOR):
+            node = node.children.setdefault(segment, _TrieNode())
+        node.patterns.add(pattern)
+
+    def remove(self, pattern: str) -> None:
+        path = [self._root]
+        for segment in pattern.split(TOPIC_SEPARATOR):
+            node = path[-1].children.get(segment)
+            if node is None:
+                return
+            path.append(node)
+
+        path[-1].patterns.discard(pattern)
+        segments = pattern.split(TOPIC_SEPARATOR)
+        for depth in range(len(segments), 0, -1):
+            node = path[depth]
+            if node.patterns or node.children:
+                break
+            del path[depth - 1].children[segments[depth - 1]]
+
+    def match(self, topic: str) -> Set[str]:
+        """Get every pattern that matches a concrete topic."""
+        matched: Set[str] = set()
+        nodes = [self._root]
+
+        for segment in topic.split(TOPIC_SEPARATOR):
+            next_nodes = []
+            for node in nodes:
+                rest = node.children.get(WILDCARD_REST)
+                if rest is not None:
+                    matched |= rest.patterns
+                child = node.children.get(segment)
+                if child is not None:
+                    next_nodes.append(child)
+                child = node.children.get(WILDCARD_ONE)
+                if child is not None:
+                    next_nodes.append(child)
+            nodes = next_nodes
+            if not nodes:
+                return matched
+
+        for node in nodes:
+            matched |= node.patterns
+            rest = node.children.get(WILDCARD_REST)
+            if rest is not None:
+                matched |= rest.patterns
+
+        return matched
+
+
+# (sync callbacks and coalescing front ends, sequential async callbacks,
+#  concurrent async callbacks, queued subscriptions,
+#  subscriptions routed through a mailbox by publish_nowait)
+DispatchEntry = Tuple[
+    Tuple[Callback, ...],
+    Tuple[Callback, ...],
+    Tuple[Callback, ...],
+    Tuple[Subscription, ...],
+    Tuple[Subscription, ...],
+]
+
+_NO_SUBSCRIBERS: DispatchEntry = ((), (), (), (), ())
+
+
 class EventBus:
     """
     Thread-safe event bus for asynchronous pub/sub messaging.
@@ -39,55 +405,150 @@ class EventBus:
     - Exception handling per callback
     - Callback removal
     - Topic enumeration
+
+    Subscriptions may use ``*`` (one segment) and ``#`` (trailing
+    segments) wildcards, e.g. ``can.*`` or ``*.tx``. Patterns live in a
+    topic trie; the first publish on a concrete topic resolves every
+    matching subscription into tuples of callbacks per delivery path,
+    and that entry is cached until a relevant subscription changes.
+    Callbacks are classified once, at subscribe time. On publish, sync callbacks run first, in
+    subscription order, then events are put in queued mailboxes, then
+    sequential async callbacks are awaited in order, and finally
+    concurrent async callbacks are awaited together.
+
+    Delivery modes (per subscription):
+    - sequential: awaited one after another inside ``publish``
+    - concurrent: awaited together with ``asyncio.gather`` inside ``publish``
+    - queued: handed to a bounded per-subscriber mailbox and worker;
+      ``publish`` does not wait for the callback
+
+    Callbacks always run on the loop the bus is bound to. Other threads
+    publish through ``publish_threadsafe``; other processes are bridged
+    by a transport from ``core.event_transport``.
     """
 
-    def __init__(self):
-        self._subscribers: Dict[str, List[Callable[[Any], Any]]] = defaultdict(list)
+    def __init__(self, default_delivery: str = DELIVERY_SEQUENTIAL):
+        if default_delivery not in DELIVERY_MODES:
+            raise ValueError(
+                f"Invalid delivery mode '{default_delivery}'. Allowed: {', '.join(DELIVERY_MODES)}"
+            )
+
+        self.default_delivery = default_delivery
+        self._subscribers: Dict[str, List[Subscription]] = defaultdict(list)
+        self._dispatch: Dict[str, DispatchEntry] = {}
+        self._trie = TopicTrie()
+        self._seq = 0
         self._active_topics: Set[str] = set()
         self._error_count: int = 0
+        self._threadsafe_count: int = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
         self._logger = logging.getLogger(__name__)
 
+    def bind_loop(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """
+        Bind the bus to the loop that owns its subscribers.
+
+        Args:
+            loop: Owning loop (the running loop if None)
+        """
+        self._loop = loop or asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident() if loop is None else None
+
     def subscribe(
         self,
         topic: str,
         callback: Callable[[Any], Any],
-        once: bool = False
-    ) -> None:
+        once: bool = False,
+        delivery: Optional[str] = None,
+        mailbox_size: int = DEFAULT_MAILBOX_SIZE,
+        with_topic: bool = False,
+        sample_interval: Optional[float] = None,
+        latest_only: bool = False,
+        batch_window: Optional[float] = None,
+        batch_max: Optional[int] = None
+    ) -> Subscription:
         """
         Subscribe to a topic.
 
         Args:
-            topic: Event topic name
+            topic: Event topic name or wildcard pattern
             callback: Async or sync callback function
             once: If True, callback fires only once then is removed
+            delivery: sequential, concurrent or queued (bus default if None)
+            mailbox_size: Mailbox capacity for queued delivery
+            with_topic: If True, callback is called as ``callback(topic, data)``
+            sample_interval: Deliver at most one event per interval (seconds)
+            latest_only: Deliver only the newest event once the callback is
+                free (queued delivery with a one-slot mailbox)
+            batch_window: Deliver a list of the events collected during
+                each window (seconds); with ``with_topic`` the list holds
+                ``(topic, data)`` pairs
+            batch_max: Flush a batch early once it holds this many events
+
+        Returns:
+            Subscription: The registered subscription
         """
         if not callable(callback):
             raise TypeError(f"Callback must be callable, got {type(callback)}")
 
+        validate_topic_pattern(topic)
+
+        if latest_only and batch_window is not None:
+            raise ValueError("latest_only and batch_window cannot be combined")
+        if latest_only:
+            delivery = DELIVERY_QUEUED
+            mailbox_size = 1
+
+        delivery = delivery or self.default_delivery
+        if delivery not in DELIVERY_MODES:
+            raise ValueError(
+                f"Invalid delivery mode '{delivery}'. Allowed: {', '.join(DELIVERY_MODES)}"
+            )
+
         if once:
             original_callback = callback
 
-            async def one_time_callback(data: Any) -> None:
-                try:
-                    if asyncio.iscoroutinefunction(original_callback):
-                        await original_callback(data)
-                    else:
-                        original_callback(data)
-                finally:
-                    self.unsubscribe(topic, one_time_callback)
+            if asyncio.iscoroutinefunction(original_callback):
+                async def one_time_callback(*args: Any) -> None:
+                    try:
+                        await original_callback(*args)
+                    finally:
+                        self.unsubscribe(topic, one_time_callback)
+            else:
+                def one_time_callback(*args: Any) -> None:
+                    try:
+                        original_callback(*args)
+                    finally:
+                        self.unsubscribe(topic, one_time_callback)
 
             callback = one_time_callback
 
-        self._subscribers[topic].append(callback)
+        self._seq += 1
+        subscription = Subscription(
+            topic, callback, delivery, mailbox_size, self._on_mailbox_error,
+            with_topic=with_topic, seq=self._seq,
+            sample_interval=sample_interval,
+            batch_window=batch_window,
+            batch_max=batch_max
+        )
+        if topic not in self._subscribers:
+            self._trie.insert(topic)
+        self._subscribers[topic].append(subscription)
+        self._invalidate(topic)
         self._logger.debug(
-            f"Subscriber added to '{topic}' "
-            f"(total: {len(self._subscribers[topic])})"
+            f"Subscriber added to '{topic}' ({delivery}, "
+            f"total: {len(self._subscribers[topic])})"
         )
+        return subscription
 
     def unsubscribe(self, topic: str, callback: Callable[[Any], Any]) -> bool:
         """
         Unsubscribe a callback from a topic.
 
+        Callbacks match by equality, so a bound method taken again from
+        the same object (``obj.method``) removes the original subscription.
+
         Args:
             topic: Event topic name
             callback: Callback to remove
@@ -98,19 +559,71 @@ class EventBus:
         if topic not in self._subscribers:
             return False
 
-        original_len = len(self._subscribers[topic])
-        self._subscribers[topic] = [
-            cb for cb in self._subscribers[topic] if cb is not callback
-        ]
+        kept = []
+        removed = []
+        for sub in self._subscribers[topic]:
+            (removed if sub.callback == callback else kept).append(sub)
 
-        if len(self._subscribers[topic]) < original_len:
+        if removed:
+            for sub in removed:
+                sub.close()
+            self._subscribers[topic] = kept
             self._logger.debug(f"Subscriber removed from '{topic}'")
-            if not self._subscribers[topic]:
+            if not kept:
                 del self._subscribers[topic]
+                self._trie.remove(topic)
+            self._invalidate(topic)
             return True
 
         return False
 
+    def _invalidate(self, pattern: str) -> None:
+        """Drop cached dispatch entries affected by a change to ``pattern``."""
+        if is_wildcard(pattern):
+            self._dispatch.clear()
+        else:
+            self._dispatch.pop(pattern, None)
+
+    def _resolve(self, topic: str) -> DispatchEntry:
+        """Build and cache the dispatch entry for a concrete topic."""
+        subs = sorted(
+            (
+                sub
+                for pattern in self._trie.match(topic)
+                for sub in self._subscribers.get(pattern, ())
+            ),
+            key=lambda sub: sub.seq
+        )
+        if not subs:
+            self._dispatch[topic] = _NO_SUBSCRIBERS
+            return _NO_SUBSCRIBERS
+
+        def bound(sub: Subscription) -> Callback:
+            return partial(sub.callback, topic) if sub.with_topic else sub.callback
+
+        coalescing = [s for s in subs if s.coalescing]
+        direct = [s for s in subs if not s.coalescing]
+        inline = [s for s in direct if s.delivery != DELIVERY_QUEUED]
+        queued = tuple(s for s in direct if s.delivery == DELIVERY_QUEUED)
+
+        entry = (
+            tuple(bound(s) for s in inline if not s.is_async)
+            + tuple(partial(s.accept, topic) for s in coalescing),
+            tuple(bound(s) for s in inline if s.is_async and s.delivery == DELIVERY_SEQUENTIAL),
+            tuple(bound(s) for s in inline if s.is_async and s.delivery == DELIVERY_CONCURRENT),
+            queued,
+            queued + tuple(s for s in inline if s.is_async)
+        )
+        self._dispatch[topic] = entry
+        return entry
+
+    def _on_mailbox_error(self, subscription: Subscription, exc: BaseException) -> None:
+        self._error_count += 1
+        self._logger.error(
+            f"Callback failed for topic '{subscription.topic}': {exc}",
+            exc_info=exc
+        )
+
     async def publish(
         self,
         topic: str,
@@ -123,28 +636,49 @@ class EventBus:
         Args:
             topic: Event topic name
             data: Event data payload
-            timeout: Timeout for all callbacks (seconds)
+            timeout: Timeout for each inline async callback (seconds)
 
         Returns:
-            int: Number of successfully executed callbacks
+            int: Number of successfully executed callbacks (queued
+            subscribers count once their mailbox accepts the event)
         """
-        if topic not in self._subscribers:
+        entry = self._dispatch.get(topic)
+        if entry is None:
+            entry = self._resolve(topic)
+        if entry is _NO_SUBSCRIBERS:
             self._logger.debug(f"No subscribers for topic '{topic}'")
             return 0
 
-        self._active_topics.add(topic)
-        callbacks = self._subscribers[topic][:]  
+        if topic not in self._active_topics:
+            self._active_topics.add(topic)
+
+        sync_callbacks, sequential, concurrent, queued, _ = entry
         executed = 0
 
-        for callback in callbacks:
+        for callback in sync_callbacks:
+            try:
+                callback(data)
+                executed += 1
+            except Exception as exc:
+                self._error_count += 1
+                self._logger.error(
+                    f"Callback failed for topic '{topic}': {exc}",
+                    exc_info=True
+                )
+
+        if queued:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            for subscription in queued:
+                subscription.offer(topic, data, loop, now)
+            executed += len(queued)
+
+        for callback in sequential:
             try:
-                if asyncio.iscoroutinefunction(callback):
-                    if timeout:
-                        await asyncio.wait_for(callback(data), timeout=timeout)
-                    else:
-                        await callback(data)
+                if timeout:
+                    await asyncio.wait_for(callback(data), timeout=timeout)
                 else:
-                    callback(data)
+                    await callback(data)
                 executed += 1
             except asyncio.TimeoutError:
                 self._error_count += 1
@@ -159,8 +693,104 @@ class EventBus:
                     exc_info=True
                 )
 
+        if concurrent:
+            if timeout:
+                calls = [asyncio.wait_for(cb(data), timeout=timeout) for cb in concurrent]
+            else:
+                calls = [cb(data) for cb in concurrent]
+            results = await asyncio.gather(*calls, return_exceptions=True)
+
+            for callback, result in zip(concurrent, results):
+                if isinstance(result, asyncio.TimeoutError):
+                    self._error_count += 1
+                    self._logger.error(
+                        f"Callback timeout for topic '{topic}': "
+                        f"{callback.__name__ if hasattr(callback, '__name__') else 'unknown'}"
+                    )
+                elif isinstance(result, Exception):
+                    self._error_count += 1
+                    self._logger.error(
+                        f"Callback failed for topic '{topic}': {result}",
+                        exc_info=result
+                    )
+                else:
+                    executed += 1
+
+        return executed
+
+    def publish_nowait(self, topic: str, data: Any = None) -> int:
+        """
+        Publish an event without awaiting any subscriber.
+
+        Sync callbacks run inline. Async callbacks, whatever their delivery
+        mode, are handed to their subscription's mailbox, so no task is
+        created per event. Must be called from the event loop thread.
+
+        Returns:
+            int: Number of callbacks executed or queued
+        """
+        entry = self._dispatch.get(topic)
+        if entry is None:
+            entry = self._resolve(topic)
+        if entry is _NO_SUBSCRIBERS:
+            return 0
+
+        if topic not in self._active_topics:
+            self._active_topics.add(topic)
+
+        sync_callbacks, _, _, _, deferred = entry
+        executed = 0
+
+        for callback in sync_callbacks:
+            try:
+                callback(data)
+                executed += 1
+            except Exception as exc:
+                self._error_count += 1
+                self._logger.error(
+                    f"Callback failed for topic '{topic}': {exc}",
+                    exc_info=True
+                )
+
+        if deferred:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            for subscription in deferred:
+                subscription.offer(topic, data, loop, now)
+            executed += len(deferred)
+
         return executed
 
+    def publish_threadsafe(self, topic: str, data: Any = None) -> None:
+        """
+        Publish from any thread.
+
+        The event is scheduled onto the bound loop with
+        ``call_soon_threadsafe`` and delivered there via ``publish_nowait``.
+        Called from the loop thread itself, it publishes immediately.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            raise RuntimeError("EventBus is not bound to a running event loop")
+
+        if self._loop_thread == threading.get_ident():
+            self.publish_nowait(topic, data)
+            return
+
+        self._threadsafe_count += 1
+        loop.call_soon_threadsafe(self.publish_nowait, topic, data)
+
+    async def drain(self, topic: Optional[str] = None) -> None:
+        """
+        Flush pending batches and wait until all mailboxes (optionally only
+        those subscribed with pattern ``topic``) are empty.
+        """
+        topics = [topic] if topic is not None else list(self._subscribers)
+        for name in topics:
+            for subscription in list(self._subscribers.get(name, ())):
+                subscription.flush()
+                await subscription.join()
+
     def get_subscriber_count(self, topic: str) -> int:
         """Get number of subscribers for a topic."""
         return len(self._subscribers.get(topic, []))
@@ -169,13 +799,24 @@ class EventBus:
         """Get all active topics."""
         return list(self._subscribers.keys())
 
+    def mailbox_stats(self) -> List[Dict[str, Any]]:
+        """Get delivery metrics for queued and coalescing subscriptions."""
+        return [
+            sub.stats()
+            for subs in self._subscribers.values()
+            for sub in subs
+            if sub.queued or sub.coalescing
+        ]
+
     def health_status(self) -> Dict[str, Any]:
         """Get event bus health information."""
         return {
             "topics": len(self._subscribers),
             "total_subscribers": sum(len(v) for v in self._subscribers.values()),
             "error_count": self._error_count,
-            "active_topics": list(self._active_topics)
+            "active_topics": list(self._active_topics),
+            "threadsafe_publishes": self._threadsafe_count,
+            "mailboxes": self.mailbox_stats()
         }
 
-event_bus = EventBus()
\ No newline at end of file
+event_bus = EventBus()
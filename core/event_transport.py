@@ -0,0 +1,272 @@
+"""
+Inter-process transports for the event bus.
+
+Features:
+- Pluggable transport interface
+- Unix domain socket bridge with JSON-lines framing
+- Bidirectional forwarding of selected topics
+- Echo suppression for relayed events
+- Hub fan-out between connected peers
+- Per-peer write backpressure with drop accounting
+"""
+
+import asyncio
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from core.event_bus import EventBus, event_bus
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BUFFER_BYTES = 1 << 20
+DEFAULT_RECONNECT_INTERVAL = 1.0
+
+
+class EventTransport(ABC):
+    """
+    Base class for bridges that carry bus events between processes.
+
+    A transport subscribes to its exported topics (wildcard patterns
+    allowed) on the local bus and sends every local event to its peers.
+    Events received from a peer are published on the local bus with
+    ``publish_nowait``; while that happens the transport's own forwarders
+    are muted, so relayed events are never echoed back.
+    """
+
+    def __init__(self, topics: Iterable[str], bus: Optional[EventBus] = None):
+        self.bus = bus or event_bus
+        self.topics = [getattr(t, "value", t) for t in topics]
+        self._forwarders: Dict[str, Callable[[str, Any], None]] = {}
+        self._relaying = False
+        self._logger = logging.getLogger(__name__)
+
+        self.sent = 0
+        self.received = 0
+        self.dropped = 0
+        self.errors = 0
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Connect or start listening, then attach the forwarders."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Detach the forwarders and close every peer connection."""
+
+    @abstractmethod
+    def send(self, topic: str, data: Any, origin: Any = None) -> None:
+        """Send an event to every peer except ``origin``."""
+
+    def _attach(self) -> None:
+        for topic in self.topics:
+            if topic in self._forwarders:
+                continue
+            forwarder = self._make_forwarder()
+            self._forwarders[topic] = forwarder
+            self.bus.subscribe(topic, forwarder, with_topic=True)
+
+    def _detach(self) -> None:
+        for topic, forwarder in self._forwarders.items():
+            self.bus.unsubscribe(topic, forwarder)
+        self._forwarders.clear()
+
+    def _make_forwarder(self) -> Callable[[str, Any], None]:
+        def forward(topic: str, data: Any) -> None:
+            if not self._relaying:
+                self.send(topic, data)
+        return forward
+
+    def _deliver(self, topic: str, data: Any, origin: Any = None) -> None:
+        """Publish an event received from a peer on the local bus."""
+        self.received += 1
+        self._relaying = True
+        try:
+            self.bus.publish_nowait(topic, data)
+        finally:
+            self._relaying = False
+
+    def health_status(self) -> Dict[str, Any]:
+        return {
+            "type": type(self).__name__,
+            "topics": list(self.topics),
+            "sent": self.sent,
+            "received": self.received,
+            "dropped": self.dropped,
+            "errors": self.errors
+        }
+
+
+class UnixSocketTransport(EventTransport):
+    """
+    Event bridge over a Unix domain socket.
+
+    One process listens (``listen=True``) and acts as a hub; others
+    connect and reconnect automatically. Each event is one JSON line,
+    ``{"topic": ..., "data": ...}``. Values that are not JSON types are
+    sent as strings. The hub re-sends events it receives to its other
+    peers, so every process sees every exported topic once.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        topics: Iterable[str],
+        bus: Optional[EventBus] = None,
+        listen: bool = True,
+        max_buffer_bytes: int = DEFAULT_MAX_BUFFER_BYTES,
+        reconnect_interval: float = DEFAULT_RECONNECT_INTERVAL
+    ):
+        super().__init__(topics, bus)
+        self.path = path
+        self.listen = listen
+        self.max_buffer_bytes = max_buffer_bytes
+        self.reconnect_interval = reconnect_interval
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connect_task: Optional[asyncio.Task] = None
+        self._peer_tasks: List[asyncio.Task] = []
+        self._peers: List[asyncio.StreamWriter] = []
+        self._running = False
+
+    async def start(self) -> None:
+        if self._running:
+            return
+
+        self._running = True
+        self.bus.bind_loop()
+        self._attach()
+
+        if self.listen:
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            self._server = await asyncio.start_unix_server(self._on_peer, path=self.path)
+            self._logger.info(f"Event transport listening on {self.path}")
+        else:
+            self._connect_task = asyncio.create_task(self._connect_loop())
+
+    async def stop(self) -> None:
+        if not self._running:
+            return
+
+        self._running = False
+        self._detach()
+
+        if self._connect_task:
+            self._connect_task.cancel()
+            await asyncio.gather(self._connect_task, return_exceptions=True)
+            self._connect_task = None
+
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+        for writer in list(self._peers):
+            writer.close()
+        tasks = [t for t in self._peer_tasks if not t.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._peer_tasks.clear()
+        self._peers.clear()
+
+        self._logger.info(
+            f"Event transport stopped (sent={self.sent}, received={self.received}, "
+            f"dropped={self.dropped})"
+        )
+
+    async def _connect_loop(self) -> None:
+        while self._running:
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.path)
+                self._logger.info(f"Event transport connected to {self.path}")
+                await self._serve_peer(reader, writer)
+            except (FileNotFoundError, ConnectionRefusedError) as e:
+                self._logger.debug(f"Event transport connect failed: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                self._logger.error(f"Event transport connection error: {e}", exc_info=True)
+
+            if self._running:
+                await asyncio.sleep(self.reconnect_interval)
+
+    async def _on_peer(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._peer_tasks.append(task)
+        try:
+            await self._serve_peer(reader, writer)
+        finally:
+            self._peer_tasks.remove(task)
+
+    async def _serve_peer(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._peers.append(writer)
+        try:
+            while self._running:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                    topic = message["topic"]
+                    data = message.get("data")
+                except (ValueError, KeyError, TypeError) as e:
+                    self.errors += 1
+                    self._logger.warning(f"Malformed event from peer: {e}")
+                    continue
+
+                self._deliver(topic, data, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if writer in self._peers:
+                self._peers.remove(writer)
+            writer.close()
+
+    def _deliver(self, topic: str, data: Any, origin: Any = None) -> None:
+        super()._deliver(topic, data, origin)
+        if self.listen and len(self._peers) > 1:
+            self.send(topic, data, origin)
+
+    def send(self, topic: str, data: Any, origin: Any = None) -> None:
+        peers = self._peers
+        if not peers:
+            return
+
+        try:
+            line = json.dumps(
+                {"topic": topic, "data": data},
+                default=str,
+                separators=(",", ":")
+            ).encode() + b"\n"
+        except (TypeError, ValueError) as e:
+            self.errors += 1
+            self._logger.warning(f"Event on '{topic}' is not serializable: {e}")
+            return
+
+        for writer in peers:
+            if writer is origin:
+                continue
+            transport = writer.transport
+            if transport.is_closing():
+                continue
+            if transport.get_write_buffer_size() > self.max_buffer_bytes:
+                self.dropped += 1
+                continue
+            writer.write(line)
+            self.sent += 1
+
+    def health_status(self) -> Dict[str, Any]:
+        status = super().health_status()
+        status.update({
+            "path": self.path,
+            "listen": self.listen,
+            "peers": len(self._peers)
+        })
+        return status
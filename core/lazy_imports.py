@@ -0,0 +1,65 @@
+"""
+Deferred imports for heavy optional dependencies.
+
+``lazy_import`` keeps the usual optional-dependency shape
+
+    psutil = lazy_import("psutil")
+    if psutil is None:
+        ...
+
+but only looks the module up at import time; it is imported on first
+attribute access. Processes that never touch it (a gateway-only
+deployment and the ML stack, say) never pay for importing it.
+"""
+
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Any, Optional
+
+
+def is_available(name: str) -> bool:
+    """Whether a top-level module can be imported, without importing it."""
+    if name in sys.modules:
+        return sys.modules[name] is not None
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class _LazyModule(ModuleType):
+    """
+    Stand-in that imports the real module on first attribute access.
+
+    The import goes through ``importlib.import_module`` and its per-module
+    lock, so threads racing on first use (the model warm-ups, say) import
+    it once. ``importlib.util.LazyLoader`` is not thread-safe before 3.12.
+    """
+
+    def __getattr__(self, attr: str) -> Any:
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__name__ in sys.modules else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> Optional[ModuleType]:
+    """
+    Return ``name`` as a module that is imported on first attribute access.
+
+    Returns the real module if it is already imported and None if it is
+    not installed. Only top-level modules are supported: looking up a
+    submodule imports its parent package eagerly.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    if "." in name:
+        raise ValueError(f"lazy_import only supports top-level modules, got '{name}'")
+    if not is_available(name):
+        return None
+    return _LazyModule(name)
@@ -2,14 +2,19 @@ import logging
 import logging.config
 import os
 from pathlib import Path
+from typing import Optional
 from backend.config import settings  
 
 class LoggerEngine:
-    def __init__(self, log_file: str = "data/system.log"):
-        self.log_file = Path(log_file)
-        self._configure()
+    def __init__(self, log_file: Optional[str] = None):
+        self.log_file = Path(log_file or settings.LOG_FILE)
+        self.logger = logging.getLogger("aegiscan")
+        self.configured = False
 
-    def _configure(self):
+    def configure(self):
+        """Install the console and rotating file handlers (idempotent)."""
+        if self.configured:
+            return
         log_dir = self.log_file.parent
         log_dir.mkdir(parents=True, exist_ok=True)
 
@@ -34,8 +39,8 @@ class LoggerEngine:
                     "level": "DEBUG",
                     "formatter": "standard",
                     "filename": str(self.log_file),
-                    "maxBytes": 10 * 1024 * 1024,  
-                    "backupCount": 5,
+                    "maxBytes": settings.LOG_MAX_BYTES,
+                    "backupCount": settings.LOG_BACKUP_COUNT,
                 },
             },
             "root": {
@@ -45,7 +50,7 @@ class LoggerEngine:
         }
 
         logging.config.dictConfig(logging_config)
-        self.logger = logging.getLogger("aegiscan")
+        self.configured = True
 
     def debug(self, msg: str, extra: dict | None = None):
         self.logger.debug(msg, extra=extra)
@@ -62,10 +67,18 @@ class LoggerEngine:
     def critical(self, msg: str, extra: dict | None = None):
         self.logger.critical(msg, extra=extra)
 
+# Handlers are installed by configure_logging() at application startup,
+# not on import, so tools and tests importing core.* keep their own setup.
 logger_engine = LoggerEngine()
 logger = logger_engine.logger
 
 
+def configure_logging() -> logging.Logger:
+    """Configure process-wide logging once and return the app logger."""
+    logger_engine.configure()
+    return logger
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Return a named logger using the configured logging engine.
@@ -15,12 +15,10 @@ from typing import Any, Dict, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
-try:
-    import psutil
-except ImportError:
-    psutil = None
-
 from core.event_bus import event_bus, EventTopic
+from core.lazy_imports import lazy_import
+
+psutil = lazy_import("psutil")
 
 logger = logging.getLogger(__name__)
 
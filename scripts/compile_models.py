@@ -0,0 +1,105 @@
+"""
+Compile trained models to array-backed tree tables for inline inference.
+
+Every ``analytics/models/*.joblib`` holding an IsolationForest or
+RandomForestClassifier is exported to a ``.compiled`` directory next to
+it (one .npy file per table) and checked against sklearn on random rows.
+
+Usage:
+    python scripts/compile_models.py --verify-rows 1000
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analytics.compiled_trees import (
+    KIND_ISOLATION_FOREST,
+    export_compiled,
+    load_compiled
+)
+from analytics.model_store import load_model
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+MODELS_DIR = Path("analytics/models")
+TOLERANCE = 1e-9
+
+
+def compile_model_file(model_path: Path, verify_rows: int) -> bool:
+    """
+    Export one joblib model and compare outputs on random rows.
+
+    Returns:
+        bool: True if the export matches sklearn within ``TOLERANCE``
+    """
+    model = load_model(model_path)
+    try:
+        out = export_compiled(model, model_path)
+    except TypeError as e:
+        logger.info(f"Skipping {model_path.name}: {e}")
+        return True
+
+    compiled = load_compiled(out)
+    logger.info(
+        f"{model_path.name} -> {out} ({compiled.n_trees} trees, "
+        f"{compiled.n_nodes} nodes, depth {compiled.max_depth})"
+    )
+
+    if verify_rows <= 0:
+        return True
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(verify_rows, compiled.n_features)) * 50.0
+    if compiled.kind == KIND_ISOLATION_FOREST:
+        expected, actual = model.score_samples(X), compiled.score_samples(X)
+    else:
+        expected, actual = model.predict_proba(X), compiled.predict_proba(X)
+
+    error = float(np.abs(expected - actual).max())
+    ok = error <= TOLERANCE
+    log = logger.info if ok else logger.error
+    log(f"  max abs difference vs sklearn over {verify_rows} rows: {error:.2e}")
+    return ok
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Compile AegisCAN-RT models to tree tables"
+    )
+    parser.add_argument(
+        "--models-dir",
+        type=Path,
+        default=MODELS_DIR,
+        help="Directory with .joblib models"
+    )
+    parser.add_argument(
+        "--verify-rows",
+        type=int,
+        default=1000,
+        help="Random rows to compare against sklearn (0 to skip)"
+    )
+
+    args = parser.parse_args()
+
+    paths = sorted(args.models_dir.glob("*.joblib"))
+    if not paths:
+        logger.error(f"No models found in {args.models_dir}")
+        return 1
+
+    failed = [p.name for p in paths if not compile_model_file(p, args.verify_rows)]
+    if failed:
+        logger.error(f"Compiled output differs from sklearn: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""
+Migrate the telemetry table to typed columns.
+
+Adds any typed column missing from an existing database, copies values
+that older versions stored in ``extra_json`` into them and removes the
+copied keys, leaving ``extra_json`` NULL for rows with nothing else.
+Safe to run more than once.
+
+Attack types were not recorded before the ``attack_type`` column
+existed, so older ATTACK rows keep it empty.
+
+Usage:
+    python scripts/migrate_db.py --vacuum
+"""
+
+import argparse
+import logging
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, Union
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from backend.config import settings
+from src.telemetry_writer import TELEMETRY_COLUMNS, ensure_telemetry_schema
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+def backfill_typed_columns(conn: sqlite3.Connection) -> Dict[str, int]:
+    """
+    Move known keys out of ``extra_json`` into their columns.
+
+    A value already in the column wins over the JSON copy.
+
+    Returns:
+        dict: Rows updated per column
+    """
+    updated = {}
+    for name in TELEMETRY_COLUMNS[1:]:
+        path = f"$.{name}"
+        cursor = conn.execute(
+            f"""
+            UPDATE telemetry
+            SET {name} = coalesce({name}, json_extract(extra_json, ?)),
+                extra_json = json_remove(extra_json, ?)
+            WHERE json_valid(extra_json) AND json_type(extra_json, ?) IS NOT NULL
+            """,
+            (path, path, path)
+        )
+        updated[name] = cursor.rowcount
+
+    conn.execute("UPDATE telemetry SET extra_json = NULL WHERE extra_json = '{}'")
+    return updated
+
+
+def migrate(db_path: Union[str, Path]) -> Dict[str, int]:
+    """
+    Bring ``db_path`` to the current telemetry schema in one transaction.
+
+    Returns:
+        dict: Rows backfilled per column (columns with none are omitted)
+    """
+    with sqlite3.connect(db_path) as conn:
+        added = ensure_telemetry_schema(conn)
+        if added:
+            logger.info(f"Added columns: {', '.join(added)}")
+
+        updated = backfill_typed_columns(conn)
+        conn.commit()
+
+    return {name: count for name, count in updated.items() if count}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Migrate AegisCAN-RT telemetry to typed columns"
+    )
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=Path(str(settings.DATABASE_URL).replace("sqlite+aiosqlite:///", "")),
+        help="SQLite database file"
+    )
+    parser.add_argument(
+        "--vacuum",
+        action="store_true",
+        help="Vacuum database after migrating"
+    )
+
+    args = parser.parse_args()
+
+    if not args.db.exists():
+        logger.error(f"Database not found: {args.db}")
+        return 1
+
+    logger.info("=" * 60)
+    logger.info(f"AegisCAN-RT Telemetry Migration ({args.db})")
+    logger.info("=" * 60)
+
+    try:
+        backfilled = migrate(args.db)
+    except sqlite3.Error as e:
+        logger.error(f"Migration failed: {e}", exc_info=True)
+        return 1
+
+    for name, count in backfilled.items():
+        logger.info(f"  {name}: {count} rows backfilled")
+    if not backfilled:
+        logger.info("  Nothing to backfill")
+
+    if args.vacuum:
+        with sqlite3.connect(args.db) as conn:
+            conn.execute("VACUUM")
+        logger.info("Database vacuumed")
+
+    logger.info("=" * 60)
+    logger.info("Migration Complete")
+    logger.info("=" * 60)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -100,7 +100,7 @@ def train_attack_classifier(df: pd.DataFrame) -> bool:
     logger.info("Training attack classifier...")
 
     try:
-        if "attack_type" not in df.columns:
+        if "attack_type" not in df.columns or df["attack_type"].isna().all():
             logger.warning("No attack labels in data - skipping classifier training")
             return False
 
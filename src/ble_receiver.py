@@ -12,13 +12,12 @@ Features:
 import asyncio
 import logging
 import socket
-import struct
 import random
-from queue import PriorityQueue, Full, Empty
 from typing import Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from core.event_bus import event_bus, EventTopic
+from src.frame_codec import FrameEncoder
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +27,6 @@ STEERING_CENTER = 127
 STEERING_RANGE = 55 
 STEERING_MIN = 0
 STEERING_MAX = 255
-PACKET_TIMEOUT = 0.1
 SIMULATE_INTERVAL = 0.02  
 
 @dataclass
@@ -41,7 +39,8 @@ class PacketInfo:
 
 class BLEReceiver:
     def __init__(self, max_queue_size: int = 500):
-        self.queue: PriorityQueue = PriorityQueue(maxsize=max_queue_size)
+        self.max_queue_size = max_queue_size
+        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=max_queue_size)
         self.running = False
         self._udp_task: Optional[asyncio.Task] = None
         self._simulate_task: Optional[asyncio.Task] = None
@@ -49,6 +48,7 @@ class BLEReceiver:
         self._logger = logging.getLogger(__name__)
         self._packet_count = 0
         self._drop_count = 0
+        self._encoder = FrameEncoder()
 
     def create_packet(
         self,
@@ -66,17 +66,14 @@ class BLEReceiver:
 
             while self.running:
                 try:
-                    priority, ts, data = await asyncio.wait_for(
-                        asyncio.to_thread(self.queue.get_nowait),
-                        timeout=PACKET_TIMEOUT
-                    )
+                    priority, ts, data = await self.queue.get()
 
-                    packet = bytes([priority]) + struct.pack('<Q', ts) + data
+                    packet = self._encoder.encode(priority, ts, data)
 
                     self._sock.sendto(packet, (UDP_IP, UDP_PORT))
                     self._packet_count += 1
 
-                    await event_bus.publish(
+                    event_bus.publish_nowait(
                         EventTopic.BLE_TX.value,
                         {
                             "priority": priority,
@@ -90,16 +87,6 @@ class BLEReceiver:
                         f"UDP packet sent: priority={priority}, len={len(data)}"
                     )
 
-                except asyncio.TimeoutError:
-                    continue
-
-                except Full:
-                    self._drop_count += 1
-                    self._logger.warning(
-                        f"Queue full - dropped {self._drop_count} packets total"
-                    )
-                    await asyncio.sleep(0.01)
-
                 except Exception as e:
                     self._logger.error(f"UDP forward error: {e}", exc_info=True)
                     await asyncio.sleep(0.5)
@@ -144,7 +131,7 @@ class BLEReceiver:
 
                     self._logger.debug(f"BLE simulated: steering={steering_val}")
 
-                except Full:
+                except asyncio.QueueFull:
                     self._drop_count += 1
                     self._logger.warning("BLE queue full - dropping packet")
 
@@ -161,6 +148,7 @@ class BLEReceiver:
             self._logger.warning("BLEReceiver already running")
             return
 
+        self.queue = asyncio.PriorityQueue(maxsize=self.max_queue_size)
         self.running = True
         self._logger.info("Starting BLEReceiver")
 
@@ -3,36 +3,64 @@ UDP to CAN frame translation with attack simulation.
 
 Features:
 - Real-time UDP packet reception
-- CAN frame generation and transmission
+- CAN frame generation and transmission on a dedicated TX thread
 - Steering angle scaling
-- Attack mode injection
+- Priority or earliest-deadline-first (EDF) scheduling
+- Per-class deadline enforcement
+- Attack mode injection (DoS as a synthetic high-priority frame flood)
 - Latency measurement
 - Error recovery
 """
 
 import asyncio
 import logging
-import socket
-import struct
 import time
-from queue import PriorityQueue, Empty
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
-try:
-    import can
-except ImportError:
-    can = None
 from core.event_bus import event_bus, EventTopic
+from core.lazy_imports import lazy_import
+from src.can_tx_worker import CANTxWorker, TxResult, DEFAULT_MAX_BURST
+from src.frame_codec import (
+    FRAME_SIZE,
+    FRAME_HEADER,
+    FRAME_HEADER_SIZE,
+    STEERING_LUT,
+    scale_steering,
+)
+from src.udp_ingress import UDPIngress, SLOT_SIZE
+
+can = lazy_import("can")
 
 logger = logging.getLogger(__name__)
 
 CAN_INTERFACE_PRIORITY = ["virtual", "socketcan"]  
 CAN_CHANNEL = "vcan0"
 CAN_ARBITRATION_ID = 0x100
-STEERING_SCALE_FACTOR = 900 / 255  
 UDP_LISTEN_IP = "127.0.0.1"
 UDP_LISTEN_PORT = 5005
+UDP_RCVBUF_BYTES = 1 << 20
+UDP_RECV_BATCH = 64
+
+DOS_RATE_HZ = 2000.0
+DOS_PRIORITY = 0
+DOS_TICK_SEC = 0.005
+
+SCHEDULING_PRIORITY = "priority"
+SCHEDULING_EDF = "edf"
+SCHEDULING_MODES = (SCHEDULING_PRIORITY, SCHEDULING_EDF)
+
+DEADLINE_DROP = "drop"
+DEADLINE_FLAG = "flag"
+DEADLINE_POLICIES = (DEADLINE_DROP, DEADLINE_FLAG)
+
+# Deadline budget per priority class, measured from arrival at the gateway.
+# Priorities above the highest listed class share that class's budget.
+DEADLINE_BUDGETS_US: Dict[int, int] = {
+    0: 5_000,
+    1: 20_000,
+    2: 100_000,
+}
 
 @dataclass
 class PacketMetrics:
@@ -45,17 +73,137 @@ class PacketMetrics:
 
 
 class CANTranslator:
-    def __init__(self, attack_mode: Optional[str] = None):
-        self.queue: PriorityQueue = PriorityQueue(maxsize=500)
+    def __init__(
+        self,
+        attack_mode: Optional[str] = None,
+        listen_ip: str = UDP_LISTEN_IP,
+        listen_port: int = UDP_LISTEN_PORT,
+        max_queue_size: int = 500,
+        rcvbuf_bytes: int = UDP_RCVBUF_BYTES,
+        recv_batch: int = UDP_RECV_BATCH,
+        scheduling: str = SCHEDULING_PRIORITY,
+        deadline_policy: Optional[str] = None,
+        deadline_budgets_us: Optional[Dict[int, int]] = None,
+        tx_burst: int = DEFAULT_MAX_BURST,
+        dos_rate_hz: float = DOS_RATE_HZ,
+        dos_priority: int = DOS_PRIORITY
+    ):
+        if scheduling not in SCHEDULING_MODES:
+            raise ValueError(
+                f"Invalid scheduling mode '{scheduling}'. Allowed: {', '.join(SCHEDULING_MODES)}"
+            )
+        if deadline_policy is None:
+            deadline_policy = DEADLINE_DROP if scheduling == SCHEDULING_EDF else DEADLINE_FLAG
+        if deadline_policy not in DEADLINE_POLICIES:
+            raise ValueError(
+                f"Invalid deadline policy '{deadline_policy}'. Allowed: {', '.join(DEADLINE_POLICIES)}"
+            )
+
+        self.scheduling = scheduling
+        self.deadline_policy = deadline_policy
+        self.deadline_budgets_us = dict(deadline_budgets_us or DEADLINE_BUDGETS_US)
+        max_class = max(self.deadline_budgets_us)
+        self._class_by_priority = [
+            p if p in self.deadline_budgets_us else max_class for p in range(256)
+        ]
+        self._budget_by_priority = [
+            self.deadline_budgets_us[cls] for cls in self._class_by_priority
+        ]
+        self._deadline_misses = {cls: 0 for cls in sorted(self.deadline_budgets_us)}
+        self._deadline_drops = 0
+
+        self.listen_ip = listen_ip
+        self.listen_port = listen_port
+        self.rcvbuf_bytes = rcvbuf_bytes
+        self.recv_batch = recv_batch
+        self.max_queue_size = max_queue_size
+        self.tx_burst = tx_burst
+        self.dos_rate_hz = dos_rate_hz
+        self.dos_priority = dos_priority
+        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=max_queue_size)
         self.running = False
-        self.attack_mode = attack_mode
-        self.can_bus: Optional[can.Bus] = None
-        self._udp_task: Optional[asyncio.Task] = None
+        self._attack_mode = attack_mode
+        self.can_bus: Optional["can.Bus"] = None
+        self._ingress: Optional[UDPIngress] = None
+        self._tx: Optional[CANTxWorker] = None
         self._process_task: Optional[asyncio.Task] = None
-        self._sock: Optional[socket.socket] = None
+        self._dos_task: Optional[asyncio.Task] = None
         self._logger = logging.getLogger(__name__)
         self._packet_count = 0
         self._error_count = 0
+        self._drop_count = 0
+        self._dos_injected = 0
+        self._dos_owed = 0.0
+        self._dos_raw = 0
+
+    @property
+    def attack_mode(self) -> Optional[str]:
+        return self._attack_mode
+
+    @attack_mode.setter
+    def attack_mode(self, mode: Optional[str]) -> None:
+        self._attack_mode = mode
+        if self.running:
+            self._sync_dos_flood()
+
+    def _sync_dos_flood(self) -> None:
+        active = self._dos_task is not None and not self._dos_task.done()
+
+        if self._attack_mode == "dos" and not active:
+            self._dos_task = asyncio.create_task(self._dos_flood())
+        elif self._attack_mode != "dos" and active:
+            self._dos_task.cancel()
+            self._dos_task = None
+
+    async def _dos_flood(self) -> None:
+        """
+        Flood the queue with synthetic high-priority frames.
+
+        Frames are injected in small batches every ``DOS_TICK_SEC`` so the
+        configured rate holds without one sleep per frame. They compete
+        with real traffic for queue slots and CAN bandwidth, which is what
+        the pipeline metrics then show.
+        """
+        self._logger.warning(
+            f"DoS flood started: {self.dos_rate_hz:.0f} frames/s at priority {self.dos_priority}"
+        )
+        loop = asyncio.get_running_loop()
+        last = loop.time()
+
+        try:
+            while self.running:
+                await asyncio.sleep(DOS_TICK_SEC)
+                now = loop.time()
+                self._dos_tick(now - last, now)
+                last = now
+
+        except asyncio.CancelledError:
+            self._logger.info(f"DoS flood stopped ({self._dos_injected} frames injected)")
+            raise
+
+    def _dos_tick(self, elapsed: float, now: float) -> int:
+        """
+        Inject the frames owed for ``elapsed`` seconds of flooding.
+
+        Fractional frames carry over to the next tick so the long-run rate
+        matches ``dos_rate_hz``.
+
+        Returns:
+            int: Frames injected by this tick
+        """
+        self._dos_owed += elapsed * self.dos_rate_hz
+        count = int(self._dos_owed)
+        self._dos_owed -= count
+
+        arrival_us = time.monotonic_ns() // 1000
+        ts_us = int(now * 1_000_000)
+        raw = self._dos_raw
+        for _ in range(count):
+            self._enqueue(self.dos_priority, ts_us, raw, arrival_us)
+            raw = (raw + 1) & 0xFF
+        self._dos_raw = raw
+        self._dos_injected += count
+        return count
 
     def _setup_can_bus(self) -> None:
         if can is None:
@@ -78,122 +226,119 @@ class CANTranslator:
         raise RuntimeError("Failed to initialize CAN bus on any interface")
 
     def _scale_steering(self, raw: int) -> int:
-        return int((raw - 127) * STEERING_SCALE_FACTOR)
+        return scale_steering(raw)
 
-    async def _udp_receiver_loop(self) -> None:
-        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self._sock.bind((UDP_LISTEN_IP, UDP_LISTEN_PORT))
-        self._sock.setblocking(False)
+    def _enqueue(self, priority: int, ts_us: int, raw: int, arrival_us: int) -> bool:
+        """
+        Queue a decoded frame.
 
-        loop = asyncio.get_running_loop()
-
-        self._logger.info(f"UDP receiver listening on {UDP_LISTEN_IP}:{UDP_LISTEN_PORT}")
+        Queue items are ``(key, priority, deadline_us, ts_us, raw)``; the key
+        is the priority in priority mode and the absolute deadline in EDF
+        mode, so the same process loop serves both.
+        """
+        deadline_us = arrival_us + self._budget_by_priority[priority & 0xFF]
+        key = deadline_us if self.scheduling == SCHEDULING_EDF else priority
 
         try:
-            while self.running:
-                try:
-                    data, _ = await loop.sock_recvfrom(self._sock, 64)
-
-                    if len(data) >= 10:
-                        priority = data[0]
-                        ts_us = struct.unpack('<Q', data[1:9])[0]
-                        ble_data = data[9:]
-
-                        try:
-                            await asyncio.to_thread(
-                                self.queue.put_nowait,
-                                (priority, ts_us, ble_data)
-                            )
-                            self._logger.debug(
-                                f"UDP packet queued: priority={priority}, "
-                                f"len={len(ble_data)}"
-                            )
-                        except Exception as e:
-                            self._logger.warning(f"Queue error: {e}")
-
-                except BlockingIOError:
-                    await asyncio.sleep(0.005)
-
-                except Exception as e:
-                    self._error_count += 1
-                    self._logger.error(f"UDP receive error: {e}", exc_info=True)
-                    await asyncio.sleep(0.5)
-
-        finally:
-            if self._sock:
-                self._sock.close()
-                self._sock = None
-            self._logger.info("UDP receiver loop ended")
-
-    def _process_packet(self, item: Tuple[int, int, bytes]) -> None:
-        priority, ts_us, ble_data = item
+            self.queue.put_nowait((key, priority, deadline_us, ts_us, raw))
+            return True
+        except asyncio.QueueFull:
+            self._drop_count += 1
+            return False
+
+    def _enqueue_batch(self, buffer: memoryview, sizes: List[int], count: int) -> None:
+        enqueue = self._enqueue
+        unpack_from = FRAME_HEADER.unpack_from
+        arrival_us = time.monotonic_ns() // 1000
+
+        for i in range(count):
+            if sizes[i] < FRAME_SIZE:
+                continue
+
+            offset = i * SLOT_SIZE
+            priority, ts_us = unpack_from(buffer, offset)
+            enqueue(priority, ts_us, buffer[offset + FRAME_HEADER_SIZE], arrival_us)
+
+    def _process_packet(self, item: Tuple[int, int, int, int, int]) -> None:
+        _, priority, deadline_us, ts_us, raw = item
+
+        deadline_missed = time.monotonic_ns() // 1000 > deadline_us
+        if deadline_missed:
+            self._deadline_misses[self._class_by_priority[priority & 0xFF]] += 1
+            if self.deadline_policy == DEADLINE_DROP:
+                self._deadline_drops += 1
+                return
 
         try:
-            raw = ble_data[0] if ble_data else 127
-            steering_angle = self._scale_steering(raw)
+            steering_angle = STEERING_LUT[raw]
 
             if self.attack_mode == "flip":
                 steering_angle = -steering_angle
-            elif self.attack_mode == "dos":
-                time.sleep(0.05)  
             elif self.attack_mode == "heart":
                 return  
 
-            can_data = struct.pack('<h', steering_angle)
-            msg = can.Message(
-                arbitration_id=CAN_ARBITRATION_ID,
-                data=can_data,
-                is_extended_id=False
-            )
+            if self._tx is None:
+                return
 
-            t0 = time.perf_counter()
+            if not self._tx.submit(
+                steering_angle, ts_us, priority, deadline_missed, self.queue.qsize(),
+                deadline_us
+            ):
+                self._drop_count += 1
 
-            if self.can_bus:
-                self.can_bus.send(msg)
+        except Exception as e:
+            self._error_count += 1
+            self._logger.error(f"CAN packet processing failed: {e}", exc_info=True)
+
+    def _on_tx_complete(self, results: List[TxResult]) -> None:
+        """
+        Publish CAN_TX events for a burst sent by the TX worker.
+
+        Runs on the event loop via ``call_soon_threadsafe``. Frames that
+        expired while queued for the worker count as deadline misses here,
+        and as drops if the worker did not send them.
+        """
+        for (angle, ts_us, priority, deadline_missed, queue_size, _, _,
+             wait_us, send_us, expired, ok) in results:
+            if expired:
+                self._deadline_misses[self._class_by_priority[priority & 0xFF]] += 1
+                if self.deadline_policy == DEADLINE_DROP:
+                    self._deadline_drops += 1
+                    continue
+
+            if not ok:
+                self._error_count += 1
+                continue
 
-            latency_us = int((time.perf_counter() - t0) * 1_000_000)
             self._packet_count += 1
 
-            asyncio.create_task(
-                event_bus.publish(
-                    EventTopic.CAN_TX.value,
-                    {
-                        "angle": steering_angle,
-                        "latency_us": latency_us,
-                        "queue_size": self.queue.qsize(),
-                        "timestamp_us": ts_us,
-                        "attack_mode": self.attack_mode,
-                        "packet_number": self._packet_count
-                    }
-                )
+            event_bus.publish_nowait(
+                EventTopic.CAN_TX.value,
+                {
+                    "angle": angle,
+                    "latency_us": send_us,
+                    "tx_wait_us": wait_us,
+                    "queue_size": queue_size,
+                    "timestamp_us": ts_us,
+                    "priority": priority,
+                    "deadline_missed": deadline_missed,
+                    "attack_mode": self.attack_mode,
+                    "packet_number": self._packet_count
+                }
             )
 
             self._logger.debug(
-                f"CAN TX: angle={steering_angle}°, latency={latency_us}µs"
+                f"CAN TX: angle={angle}°, latency={send_us}µs, wait={wait_us}µs"
             )
 
-        except Exception as e:
-            self._error_count += 1
-            self._logger.error(f"CAN packet processing failed: {e}", exc_info=True)
-
     async def _process_loop(self) -> None:
         self._logger.info("CAN process loop started")
 
         while self.running:
             try:
-                packet = await asyncio.wait_for(
-                    asyncio.to_thread(self.queue.get_nowait),
-                    timeout=0.1
-                )
+                packet = await self.queue.get()
                 self._process_packet(packet)
 
-            except asyncio.TimeoutError:
-                await asyncio.sleep(0.005)
-
-            except Empty:
-                await asyncio.sleep(0.005)
-
             except Exception as e:
                 self._error_count += 1
                 self._logger.error(f"Process loop error: {e}", exc_info=True)
@@ -212,11 +357,39 @@ class CANTranslator:
             self._logger.error(f"Failed to setup CAN bus: {e}")
             raise
 
+        self.queue = asyncio.PriorityQueue(maxsize=self.max_queue_size)
+        self._tx = CANTxWorker(
+            self.can_bus,
+            CAN_ARBITRATION_ID,
+            self._on_tx_complete,
+            max_pending=self.max_queue_size,
+            max_burst=self.tx_burst,
+            drop_expired=self.deadline_policy == DEADLINE_DROP
+        )
+        self._ingress = UDPIngress(
+            self.listen_ip,
+            self.listen_port,
+            self._enqueue_batch,
+            rcvbuf_bytes=self.rcvbuf_bytes,
+            max_batch=self.recv_batch
+        )
+
+        try:
+            await self._ingress.start()
+        except OSError as e:
+            self._logger.error(f"Failed to bind UDP ingress: {e}")
+            self._ingress = None
+            if self.can_bus:
+                self.can_bus.shutdown()
+                self.can_bus = None
+            raise
+
+        self._tx.start()
         self.running = True
         self._logger.info(f"Starting CANTranslator (attack_mode={self.attack_mode})")
 
-        self._udp_task = asyncio.create_task(self._udp_receiver_loop())
         self._process_task = asyncio.create_task(self._process_loop())
+        self._sync_dos_flood()
 
         self._logger.info("CANTranslator started successfully")
 
@@ -227,7 +400,10 @@ class CANTranslator:
         self.running = False
         self._logger.info("Stopping CANTranslator")
 
-        tasks = [t for t in [self._udp_task, self._process_task] if t and not t.done()]
+        if self._ingress:
+            self._ingress.close()
+
+        tasks = [t for t in [self._process_task, self._dos_task] if t and not t.done()]
 
         for task in tasks:
             task.cancel()
@@ -235,6 +411,10 @@ class CANTranslator:
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
 
+        if self._tx:
+            await asyncio.to_thread(self._tx.stop)
+            self._tx = None
+
         if self.can_bus:
             self.can_bus.shutdown()
             self.can_bus = None
@@ -250,6 +430,14 @@ class CANTranslator:
             "attack_mode": self.attack_mode,
             "queue_size": self.queue.qsize(),
             "packets_processed": self._packet_count,
+            "packets_dropped": self._drop_count,
+            "dos_frames_injected": self._dos_injected,
+            "scheduling": self.scheduling,
+            "deadline_policy": self.deadline_policy,
+            "deadline_misses": dict(self._deadline_misses),
+            "deadline_drops": self._deadline_drops,
             "errors": self._error_count,
-            "can_available": self.can_bus is not None
+            "can_available": self.can_bus is not None,
+            "tx": self._tx.health_status() if self._tx else None,
+            "ingress": self._ingress.health_status() if self._ingress else None
         }
\ No newline at end of file
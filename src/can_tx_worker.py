@@ -0,0 +1,251 @@
+"""
+Dedicated CAN transmit worker.
+
+Features:
+- Blocking bus.send() kept off the event loop
+- Deque hand-off with wake-on-idle signalling
+- Preallocated, reused can.Message objects
+- Burst draining of queued frames
+- Queue-wait and send latency measurement
+- Deadline re-check at send time (drop or flag frames that expired in the deque)
+- Completion callbacks batched back onto the event loop
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from core.lazy_imports import lazy_import
+from src.frame_codec import STEERING_PAYLOAD
+
+can = lazy_import("can")
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PENDING = 1024
+DEFAULT_MAX_BURST = 32
+
+# (angle, ts_us, priority, deadline_missed, queue_size, deadline_us, enqueued_ns)
+TxRequest = Tuple[int, int, int, bool, int, Optional[int], int]
+# request fields + (queue_wait_us, send_us, expired, ok); ``expired`` marks a
+# frame whose deadline passed while it waited for this worker
+TxResult = Tuple[int, int, int, bool, int, Optional[int], int, int, int, bool, bool]
+
+
+class CANTxWorker:
+    """
+    Sends steering frames from a dedicated thread.
+
+    ``submit`` is called on the event loop and only appends to a deque;
+    the worker thread is woken only when it is idle. The worker drains
+    up to ``max_burst`` frames per wakeup, sends them back to back using
+    preallocated messages, and reports the whole burst to ``on_complete``
+    with a single ``call_soon_threadsafe``.
+
+    Deadlines (``time.monotonic_ns() // 1000``) are checked again just
+    before sending, since a frame can expire while queued behind a burst.
+    With ``drop_expired`` such frames are not sent; otherwise they are
+    sent with ``deadline_missed`` set. Either way the result is marked
+    ``expired``.
+    """
+
+    def __init__(
+        self,
+        bus: Optional[Any],
+        arbitration_id: int,
+        on_complete: Callable[[List[TxResult]], None],
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_burst: int = DEFAULT_MAX_BURST,
+        drop_expired: bool = False
+    ):
+        self.bus = bus
+        self.arbitration_id = arbitration_id
+        self.max_pending = max_pending
+        self.max_burst = max(1, max_burst)
+        self.drop_expired = drop_expired
+        self._on_complete = on_complete
+        self._pending: Deque[TxRequest] = deque()
+        self._wakeup = threading.Event()
+        self._idle = False
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._logger = logging.getLogger(__name__)
+
+        self._messages = [self._new_message() for _ in range(self.max_burst)]
+
+        self._submitted = 0
+        self._rejected = 0
+        self._sent = 0
+        self._failed = 0
+        self._expired = 0
+        self._expired_dropped = 0
+        self._bursts = 0
+        self._largest_burst = 0
+        self._last_send_us = 0
+        self._max_send_us = 0
+        self._total_send_us = 0
+        self._max_wait_us = 0
+        self._total_wait_us = 0
+
+    def _new_message(self) -> Optional[Any]:
+        if can is None:
+            return None
+        return can.Message(
+            arbitration_id=self.arbitration_id,
+            data=bytearray(STEERING_PAYLOAD.size),
+            is_extended_id=False
+        )
+
+    def start(self) -> None:
+        if self._running:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="can-tx", daemon=True)
+        self._thread.start()
+        self._logger.info(
+            f"CAN TX worker started (burst={self.max_burst}, pending={self.max_pending})"
+        )
+
+    def stop(self, timeout: float = 2.0) -> None:
+        if not self._running:
+            return
+
+        self._running = False
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                self._logger.warning(f"CAN TX worker did not stop within {timeout}s")
+            self._thread = None
+
+        self._logger.info(
+            f"CAN TX worker stopped (sent={self._sent}, failed={self._failed}, "
+            f"rejected={self._rejected})"
+        )
+
+    def submit(
+        self,
+        angle: int,
+        ts_us: int,
+        priority: int,
+        deadline_missed: bool,
+        queue_size: int,
+        deadline_us: Optional[int] = None
+    ) -> bool:
+        """
+        Hand a frame to the worker. Returns False if the worker is backlogged.
+
+        Frames without a ``deadline_us`` never expire.
+        """
+        if len(self._pending) >= self.max_pending:
+            self._rejected += 1
+            return False
+
+        self._pending.append(
+            (angle, ts_us, priority, deadline_missed, queue_size, deadline_us,
+             time.perf_counter_ns())
+        )
+        self._submitted += 1
+
+        if self._idle:
+            self._wakeup.set()
+        return True
+
+    def _run(self) -> None:
+        pending = self._pending
+        pack_into = STEERING_PAYLOAD.pack_into
+        send = self.bus.send if self.bus is not None else None
+
+        while self._running:
+            if not pending:
+                self._wakeup.clear()
+                self._idle = True
+                if not pending:
+                    self._wakeup.wait(0.5)
+                self._idle = False
+                continue
+
+            results: List[TxResult] = []
+            for msg in self._messages:
+                if not pending:
+                    break
+                request = pending.popleft()
+                angle = request[0]
+                deadline_us = request[5]
+
+                expired = (
+                    not request[3]
+                    and deadline_us is not None
+                    and time.monotonic_ns() // 1000 > deadline_us
+                )
+                if expired:
+                    self._expired += 1
+                    if self.drop_expired:
+                        self._expired_dropped += 1
+                        wait_us = (time.perf_counter_ns() - request[6]) // 1000
+                        results.append(request + (wait_us, 0, True, False))
+                        continue
+                    request = request[:3] + (True,) + request[4:]
+
+                t0 = time.perf_counter_ns()
+                ok = True
+                if send is not None:
+                    try:
+                        pack_into(msg.data, 0, angle)
+                        send(msg)
+                    except Exception as e:
+                        ok = False
+                        self._failed += 1
+                        self._logger.error(f"CAN send failed: {e}")
+                t1 = time.perf_counter_ns()
+
+                wait_us = (t0 - request[6]) // 1000
+                send_us = (t1 - t0) // 1000
+                results.append(request + (wait_us, send_us, expired, ok))
+
+                if ok:
+                    self._sent += 1
+                self._last_send_us = send_us
+                self._total_send_us += send_us
+                self._total_wait_us += wait_us
+                if send_us > self._max_send_us:
+                    self._max_send_us = send_us
+                if wait_us > self._max_wait_us:
+                    self._max_wait_us = wait_us
+
+            self._bursts += 1
+            if len(results) > self._largest_burst:
+                self._largest_burst = len(results)
+
+            try:
+                self._loop.call_soon_threadsafe(self._on_complete, results)
+            except RuntimeError:
+                break
+
+    def health_status(self) -> Dict[str, Any]:
+        done = self._sent + self._failed
+        return {
+            "running": self._running,
+            "pending": len(self._pending),
+            "max_pending": self.max_pending,
+            "submitted": self._submitted,
+            "sent": self._sent,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "expired": self._expired,
+            "expired_dropped": self._expired_dropped,
+            "bursts": self._bursts,
+            "avg_burst": done / self._bursts if self._bursts else 0.0,
+            "largest_burst": self._largest_burst,
+            "send_us_last": self._last_send_us,
+            "send_us_avg": self._total_send_us / done if done else 0.0,
+            "send_us_max": self._max_send_us,
+            "queue_wait_us_avg": self._total_wait_us / done if done else 0.0,
+            "queue_wait_us_max": self._max_wait_us
+        }
@@ -0,0 +1,142 @@
+"""
+UDP wire format codec shared by BLEReceiver and CANTranslator.
+
+Frame layout (little endian):
+- priority: uint8
+- timestamp_us: uint64
+- payload: steering byte (and any trailing bytes)
+
+Features:
+- Precompiled struct.Struct objects
+- pack_into/unpack_from over reusable buffers
+- 256-entry steering lookup table
+- Vectorized batch decoding with NumPy
+"""
+
+import struct
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+STEERING_CENTER = 127
+STEERING_SCALE_FACTOR = 900 / 255
+
+FRAME_HEADER = struct.Struct('<BQ')
+FRAME_HEADER_SIZE = FRAME_HEADER.size
+FRAME_SIZE = FRAME_HEADER_SIZE + 1
+STEERING_PAYLOAD = struct.Struct('<h')
+
+FRAME_DTYPE = np.dtype([
+    ("priority", "u1"),
+    ("timestamp_us", "<u8"),
+    ("raw", "u1"),
+])
+
+STEERING_LUT: Tuple[int, ...] = tuple(
+    int((raw - STEERING_CENTER) * STEERING_SCALE_FACTOR) for raw in range(256)
+)
+STEERING_LUT_ARRAY = np.array(STEERING_LUT, dtype=np.int16)
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def scale_steering(raw: int) -> int:
+    """Map a raw BLE steering byte to a steering angle in degrees."""
+    if 0 <= raw <= 255:
+        return STEERING_LUT[raw]
+    return int((raw - STEERING_CENTER) * STEERING_SCALE_FACTOR)
+
+
+def decode_frame(data: Buffer, offset: int = 0) -> Tuple[int, int, int]:
+    """
+    Decode one frame without slicing.
+
+    Returns:
+        tuple: (priority, timestamp_us, raw steering byte)
+    """
+    priority, ts_us = FRAME_HEADER.unpack_from(data, offset)
+    return priority, ts_us, data[offset + FRAME_HEADER_SIZE]
+
+
+def encode_frame_into(
+    buffer: Union[bytearray, memoryview],
+    priority: int,
+    ts_us: int,
+    payload: Buffer,
+    offset: int = 0
+) -> int:
+    """
+    Encode a frame into a caller-owned buffer.
+
+    Returns:
+        int: Number of bytes written
+    """
+    FRAME_HEADER.pack_into(buffer, offset, priority, ts_us)
+    end = offset + FRAME_HEADER_SIZE + len(payload)
+    buffer[offset + FRAME_HEADER_SIZE:end] = payload
+    return end - offset
+
+
+class FrameEncoder:
+    """Encodes frames into one reusable buffer and returns views of it."""
+
+    def __init__(self, max_payload: int = 55):
+        self.max_payload = max_payload
+        self._buffer = bytearray(FRAME_HEADER_SIZE + max_payload)
+        self._view = memoryview(self._buffer)
+        self._formats: Dict[int, Tuple[struct.Struct, memoryview]] = {}
+
+    def encode(self, priority: int, ts_us: int, payload: Buffer) -> memoryview:
+        """
+        Encode a frame. The returned view is only valid until the next call.
+        """
+        size = len(payload)
+        entry = self._formats.get(size)
+        if entry is None:
+            if size > self.max_payload:
+                raise ValueError(f"Payload of {size} bytes exceeds {self.max_payload}")
+            entry = self._formats[size] = (
+                struct.Struct(f"<BQ{size}s"),
+                self._view[:FRAME_HEADER_SIZE + size]
+            )
+
+        packer, view = entry
+        packer.pack_into(self._buffer, 0, priority, ts_us, payload)
+        return view
+
+
+def decode_batch(
+    buffer: Buffer,
+    count: Optional[int] = None,
+    stride: int = FRAME_SIZE
+) -> Dict[str, np.ndarray]:
+    """
+    Decode many frames at once from a contiguous buffer.
+
+    Frames start every ``stride`` bytes, so both packed captures
+    (stride == FRAME_SIZE) and fixed-slot receive buffers can be decoded
+    without copying.
+
+    Returns:
+        dict: priority, timestamp_us, raw and angle arrays
+    """
+    if stride < FRAME_SIZE:
+        raise ValueError(f"Stride must be at least {FRAME_SIZE}, got {stride}")
+
+    available = (len(buffer) - FRAME_SIZE) // stride + 1 if len(buffer) >= FRAME_SIZE else 0
+    count = available if count is None else min(count, available)
+
+    frames = np.ndarray(
+        shape=(count,),
+        dtype=FRAME_DTYPE,
+        buffer=buffer,
+        strides=(stride,)
+    )
+
+    raw = frames["raw"]
+    return {
+        "priority": frames["priority"],
+        "timestamp_us": frames["timestamp_us"],
+        "raw": raw,
+        "angle": STEERING_LUT_ARRAY[raw],
+    }
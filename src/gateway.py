@@ -12,10 +12,9 @@ Manages:
 
 import asyncio
 import logging
-import json
 import sqlite3
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from backend.config import settings
 from core.event_bus import event_bus, EventTopic
@@ -24,23 +23,37 @@ from core.metrics_engine import metrics_engine
 from src.ble_receiver import BLEReceiver
 from src.can_translator import CANTranslator
 from src.attack_engine import AttackEngine
+from src.telemetry_buffer import TelemetryRingBuffer
+from src.telemetry_writer import TelemetryWriter, ensure_telemetry_schema
 
 logger = logging.getLogger(__name__)
 
 class Gateway:
     def __init__(self):
         self.running: bool = False
-        self.telemetry: List[Dict[str, Any]] = []
         self.max_telemetry: int = settings.MAX_TELEMETRY_BUFFER
+        self.telemetry = TelemetryRingBuffer(self.max_telemetry)
 
         self._logger = logging.getLogger(__name__)
         self._start_time: Optional[datetime] = None
 
         self.ble = BLEReceiver()
-        self.can = CANTranslator()
+        self.can = CANTranslator(
+            rcvbuf_bytes=settings.UDP_RCVBUF_BYTES,
+            recv_batch=settings.UDP_RECV_BATCH,
+            scheduling=settings.CAN_SCHEDULING,
+            deadline_policy=settings.CAN_DEADLINE_POLICY,
+            tx_burst=settings.CAN_TX_BURST,
+            dos_rate_hz=settings.DOS_RATE_HZ
+        )
         self.attack = AttackEngine()
 
-        event_bus.subscribe(EventTopic.CAN_TX.value, self._on_can_tx)
+        self._can_tx_subscription = event_bus.subscribe(
+            EventTopic.CAN_TX.value,
+            self._on_can_tx_batch,
+            batch_window=settings.TELEMETRY_BATCH_WINDOW,
+            batch_max=settings.TELEMETRY_BATCH_SIZE
+        )
         event_bus.subscribe(EventTopic.ATTACK_EVENT.value, self._on_attack_event)
         event_bus.subscribe(EventTopic.SYSTEM_METRICS.value, self._on_metrics)
 
@@ -49,48 +62,40 @@ class Gateway:
         )
         self._ensure_tables()
 
+        self._writer = TelemetryWriter(
+            self.db_path,
+            batch_size=settings.TELEMETRY_BATCH_SIZE,
+            flush_interval=settings.TELEMETRY_FLUSH_INTERVAL,
+            max_backlog=settings.TELEMETRY_MAX_BACKLOG,
+            drop_policy=settings.TELEMETRY_DROP_POLICY
+        )
+
     def _ensure_tables(self) -> None:
         try:
             with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS telemetry (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                        type TEXT NOT NULL,
-                        angle REAL,
-                        latency_us INTEGER,
-                        queue_size INTEGER,
-                        priority INTEGER,
-                        timestamp_us INTEGER,
-                        attack_mode TEXT,
-                        extra_json TEXT
-                    )
-                """)
-
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_telemetry_timestamp
-                    ON telemetry (timestamp DESC)
-                """)
-
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_telemetry_type
-                    ON telemetry (type)
-                """)
-
+                added = ensure_telemetry_schema(conn)
                 conn.commit()
-                self._logger.debug("Telemetry tables ready")
+
+            if added:
+                self._logger.info(
+                    f"Added telemetry columns {', '.join(added)}; "
+                    f"run scripts/migrate_db.py to backfill older rows"
+                )
+            self._logger.debug("Telemetry tables ready")
 
         except sqlite3.Error as e:
             self._logger.error(f"Database initialization failed: {e}", exc_info=True)
             raise
 
-    def _on_can_tx(self, data: Dict[str, Any]) -> None:
-        data["type"] = "CAN_TX"
-        self._append_telemetry(data)
+    def _on_can_tx_batch(self, batch: List[Dict[str, Any]]) -> None:
+        append = self.telemetry.append
+        for data in batch:
+            data["type"] = "CAN_TX"
+            append(data)
+        self._writer.submit_many(batch)
 
     def _on_attack_event(self, data: Dict[str, Any]) -> None:
+        data.setdefault("attack_type", data.get("type"))
         data["type"] = "ATTACK"
         self._append_telemetry(data)
 
@@ -100,51 +105,11 @@ class Gateway:
 
     def _append_telemetry(self, entry: Dict[str, Any]) -> None:
         self.telemetry.append(entry)
-        if len(self.telemetry) > self.max_telemetry:
-            self.telemetry.pop(0)
-
-        row = {
-            "type": entry.get("type", "UNKNOWN"),
-            "angle": entry.get("angle"),
-            "latency_us": entry.get("latency_us"),
-            "queue_size": entry.get("queue_size"),
-            "priority": entry.get("priority"),
-            "timestamp_us": entry.get("timestamp_us"),
-            "attack_mode": entry.get("attack_mode"),
-            "extra_json": json.dumps(
-                {
-                    k: v for k, v in entry.items()
-                    if k not in {
-                        "type", "angle", "latency_us", "queue_size",
-                        "priority", "timestamp_us", "attack_mode"
-                    }
-                },
-                default=str
-            )
-        }
-
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO telemetry
-                    (type, angle, latency_us, queue_size, priority,
-                     timestamp_us, attack_mode, extra_json)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    row["type"],
-                    row["angle"],
-                    row["latency_us"],
-                    row["queue_size"],
-                    row["priority"],
-                    row["timestamp_us"],
-                    row["attack_mode"],
-                    row["extra_json"]
-                ))
-                conn.commit()
+        self._writer.submit(entry)
 
-        except sqlite3.Error as e:
-            self._logger.error(f"Database insert failed: {e}", exc_info=True)
+    def telemetry_window(self, n: Optional[int] = None) -> Dict[str, Any]:
+        """Get the last ``n`` buffered samples as column arrays."""
+        return self.telemetry.latest(n)
 
     async def start(self) -> None:
         if self.running:
@@ -156,6 +121,8 @@ class Gateway:
         self._logger.info("Starting gateway...")
 
         try:
+            event_bus.bind_loop()
+            self._writer.start()
             await self.ble.start()
             await self.can.start()
             metrics_engine.start()
@@ -187,6 +154,8 @@ class Gateway:
                 metrics_engine.stop(),
                 return_exceptions=True
             )
+            self._can_tx_subscription.flush()
+            await asyncio.to_thread(self._writer.stop)
 
             self._logger.info("Gateway stopped")
 
@@ -234,6 +203,8 @@ class Gateway:
             },
             "telemetry": {
                 "buffered_entries": len(self.telemetry),
-                "max_buffer": self.max_telemetry
+                "max_buffer": self.max_telemetry,
+                "memory_bytes": self.telemetry.nbytes,
+                "writer": self._writer.health_status()
             }
         }
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""
+Fixed-capacity columnar ring buffer for gateway telemetry.
+
+Features:
+- Preallocated NumPy columns for the hot numeric fields
+- O(1) append with no per-entry allocation
+- Windowed reads of the last N samples as arrays
+- Compact event type codes
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TYPE_CODES = {
+    "UNKNOWN": 0,
+    "CAN_TX": 1,
+    "ATTACK": 2,
+    "METRICS": 3,
+}
+TYPE_NAMES = {code: name for name, code in TYPE_CODES.items()}
+
+MISSING_INT = -1
+
+TELEMETRY_FIELDS = (
+    ("angle", np.float64),
+    ("latency_us", np.int64),
+    ("queue_size", np.int32),
+    ("priority", np.int16),
+    ("timestamp_us", np.int64),
+    ("type_code", np.uint8),
+)
+
+
+class TelemetryRingBuffer:
+    """
+    Columnar ring buffer holding the most recent telemetry samples.
+
+    Missing values are stored as NaN in float columns and ``MISSING_INT``
+    in integer columns. ``latest`` returns copies that callers may keep;
+    ``latest_view`` avoids the copy for short-lived reads on the caller's
+    own thread.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError(f"Capacity must be positive, got {capacity}")
+
+        self.capacity = capacity
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.empty(capacity, dtype=dtype)
+            for name, dtype in TELEMETRY_FIELDS
+        }
+        self._angle = self._columns["angle"]
+        self._latency = self._columns["latency_us"]
+        self._queue = self._columns["queue_size"]
+        self._priority = self._columns["priority"]
+        self._ts = self._columns["timestamp_us"]
+        self._type = self._columns["type_code"]
+
+        self._head = 0
+        self._size = 0
+        self._total = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def total_appended(self) -> int:
+        return self._total
+
+    @property
+    def nbytes(self) -> int:
+        return sum(col.nbytes for col in self._columns.values())
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        i = self._head
+
+        value = entry.get("angle")
+        self._angle[i] = np.nan if value is None else value
+        value = entry.get("latency_us")
+        self._latency[i] = MISSING_INT if value is None else value
+        value = entry.get("queue_size")
+        self._queue[i] = MISSING_INT if value is None else value
+        value = entry.get("priority")
+        self._priority[i] = MISSING_INT if value is None else value
+        value = entry.get("timestamp_us")
+        self._ts[i] = MISSING_INT if value is None else value
+        self._type[i] = TYPE_CODES.get(entry.get("type"), 0)
+
+        i += 1
+        self._head = 0 if i == self.capacity else i
+        if self._size < self.capacity:
+            self._size += 1
+        self._total += 1
+
+    def latest(self, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Get the last ``n`` samples (all buffered samples if None).
+
+        The arrays are copies, so later appends never change a window a
+        caller is still holding, whether or not it wrapped.
+
+        Returns:
+            dict: Column name to array, ordered oldest to newest
+        """
+        return self._window(n, copy=True)
+
+    def latest_view(self, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Get the last ``n`` samples without copying where possible.
+
+        A window that does not straddle the wrap point is returned as
+        read-only views into the columns. A view is only valid until the
+        next ``append``, which may overwrite the slots it covers, so use
+        the arrays immediately and call ``latest`` to keep a window.
+
+        Returns:
+            dict: Column name to array, ordered oldest to newest
+        """
+        return self._window(n, copy=False)
+
+    def _window(self, n: Optional[int], copy: bool) -> Dict[str, np.ndarray]:
+        count = self._size if n is None else max(0, min(n, self._size))
+        end = self._head or self.capacity
+        start = end - count
+
+        window: Dict[str, np.ndarray] = {}
+        for name, col in self._columns.items():
+            if start < 0:
+                window[name] = np.concatenate((col[start:], col[:self._head]))
+            elif copy:
+                window[name] = col[start:end].copy()
+            else:
+                view = col[start:end]
+                view.flags.writeable = False
+                window[name] = view
+
+        return window
+
+    def clear(self) -> None:
+        self._head = 0
+        self._size = 0
+
+    def health_status(self) -> Dict[str, Any]:
+        return {
+            "buffered_entries": self._size,
+            "capacity": self.capacity,
+            "total_appended": self._total,
+            "memory_bytes": self.nbytes
+        }
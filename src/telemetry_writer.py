@@ -0,0 +1,341 @@
+"""
+Write-behind telemetry persistence for the gateway.
+
+Features:
+- Bounded in-memory backlog
+- Background writer thread with one long-lived connection
+- Batched executemany inside a single transaction
+- Size- and age-triggered flushes
+- Drop policy and flush statistics
+- Typed columns for every known field; JSON only for unknown ones
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+DROP_POLICIES = (DROP_OLDEST, DROP_NEWEST)
+
+# Column name and SQLite type for every field the gateway publishes.
+# CAN_TX rows fill the first block, ATTACK rows the second and METRICS
+# rows the third; anything else goes to extra_json.
+TELEMETRY_SCHEMA = (
+    ("type", "TEXT NOT NULL"),
+    ("angle", "REAL"),
+    ("latency_us", "INTEGER"),
+    ("queue_size", "INTEGER"),
+    ("priority", "INTEGER"),
+    ("timestamp_us", "INTEGER"),
+    ("attack_mode", "TEXT"),
+    ("tx_wait_us", "INTEGER"),
+    ("deadline_missed", "INTEGER"),
+    ("packet_number", "INTEGER"),
+    ("attack_type", "TEXT"),
+    ("severity", "TEXT"),
+    ("event_count", "INTEGER"),
+    ("cpu_percent", "REAL"),
+    ("memory_percent", "REAL"),
+    ("disk_percent", "REAL"),
+    ("active_tasks", "INTEGER"),
+)
+
+TELEMETRY_COLUMNS = tuple(name for name, _ in TELEMETRY_SCHEMA)
+
+INSERT_SQL = (
+    f"INSERT INTO telemetry ({', '.join(TELEMETRY_COLUMNS)}, extra_json) "
+    f"VALUES ({', '.join('?' * (len(TELEMETRY_COLUMNS) + 1))})"
+)
+
+TELEMETRY_INDEXES = {
+    "idx_telemetry_timestamp": "telemetry (timestamp DESC)",
+    "idx_telemetry_type": "telemetry (type)",
+    "idx_telemetry_type_timestamp": "telemetry (type, timestamp DESC)",
+}
+
+_KNOWN_KEYS = frozenset(TELEMETRY_COLUMNS)
+
+
+def ensure_telemetry_schema(conn: sqlite3.Connection) -> List[str]:
+    """
+    Create the telemetry table and indexes, adding any missing typed column.
+
+    Columns added to an existing table are empty for older rows until
+    ``scripts/migrate_db.py`` backfills them from ``extra_json``.
+
+    Returns:
+        list: Names of the columns that were added
+    """
+    columns = ",\n".join(f"{name} {sql_type}" for name, sql_type in TELEMETRY_SCHEMA)
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS telemetry (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            {columns},
+            extra_json TEXT
+        )
+    """)
+
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(telemetry)")}
+    added = []
+    for name, sql_type in TELEMETRY_SCHEMA:
+        if name not in existing:
+            # ALTER TABLE cannot add a NOT NULL column without a default
+            sql_type = sql_type.replace(" NOT NULL", "")
+            conn.execute(f"ALTER TABLE telemetry ADD COLUMN {name} {sql_type}")
+            added.append(name)
+
+    for index, target in TELEMETRY_INDEXES.items():
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {index} ON {target}")
+
+    return added
+
+
+class TelemetryWriter:
+    """
+    Buffers telemetry rows and persists them from a background thread.
+
+    Rows are queued by ``submit`` on the caller's thread (normally the
+    event loop) and written in batches once ``batch_size`` rows are
+    pending or the oldest pending row is ``flush_interval`` seconds old.
+    When the backlog reaches ``max_backlog`` the configured drop policy
+    decides whether the oldest queued row or the incoming row is lost.
+    With ``autostart`` the writer thread is (re)started by the first
+    ``submit`` after a stop.
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        max_backlog: int = 10_000,
+        drop_policy: str = DROP_OLDEST,
+        autostart: bool = True
+    ):
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(
+                f"Invalid drop policy '{drop_policy}'. Allowed: {', '.join(DROP_POLICIES)}"
+            )
+
+        self.db_path = Path(db_path)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.001, flush_interval)
+        self.max_backlog = max(self.batch_size, max_backlog)
+        self.drop_policy = drop_policy
+        self.autostart = autostart
+
+        self._backlog: Deque[Tuple[Any, ...]] = deque()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._first_pending_at = 0.0
+        self._logger = logging.getLogger(__name__)
+
+        self._submitted = 0
+        self._written = 0
+        self._dropped = 0
+        self._write_errors = 0
+        self._flushes = 0
+        self._last_batch_rows = 0
+        self._last_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    def start(self) -> None:
+        with self._cond:
+            if self._thread and self._thread.is_alive():
+                return
+
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._run,
+                name="telemetry-writer",
+                daemon=True
+            )
+            self._thread.start()
+
+        self._logger.info(
+            f"Telemetry writer started (batch={self.batch_size}, "
+            f"interval={self.flush_interval}s, backlog={self.max_backlog}, "
+            f"policy={self.drop_policy})"
+        )
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Flush everything still queued and stop the writer thread."""
+        with self._cond:
+            thread = self._thread
+            if thread is None:
+                return
+            self._stopping = True
+            self._cond.notify()
+
+        thread.join(timeout)
+        if thread.is_alive():
+            self._logger.warning(f"Telemetry writer did not stop within {timeout}s")
+            return
+
+        with self._cond:
+            if self._thread is thread:
+                self._thread = None
+
+        self._logger.info(
+            f"Telemetry writer stopped (written={self._written}, "
+            f"dropped={self._dropped})"
+        )
+
+    @staticmethod
+    def _to_row(entry: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Column values in ``INSERT_SQL`` order, then unknown keys or None."""
+        get = entry.get
+        extra = None
+        if not entry.keys() <= _KNOWN_KEYS:
+            extra = {k: v for k, v in entry.items() if k not in _KNOWN_KEYS}
+        return (get("type", "UNKNOWN"), *map(get, TELEMETRY_COLUMNS[1:]), extra)
+
+    def submit(self, entry: Dict[str, Any]) -> bool:
+        """
+        Queue a telemetry entry for persistence.
+
+        Returns:
+            bool: False if the entry was rejected by the drop policy
+        """
+        return self.submit_many((entry,)) == 1
+
+    def submit_many(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """
+        Queue several telemetry entries under a single lock acquisition.
+
+        Returns:
+            int: Number of entries accepted by the drop policy
+        """
+        rows = [self._to_row(entry) for entry in entries]
+        if not rows:
+            return 0
+
+        accepted = 0
+        with self._cond:
+            backlog = self._backlog
+            if not backlog:
+                self._first_pending_at = time.monotonic()
+
+            for row in rows:
+                if len(backlog) >= self.max_backlog:
+                    self._dropped += 1
+                    if self.drop_policy == DROP_NEWEST:
+                        continue
+                    backlog.popleft()
+
+                backlog.append(row)
+                accepted += 1
+
+            self._submitted += accepted
+
+            if len(backlog) >= self.batch_size:
+                self._cond.notify()
+
+            alive = self._thread is not None and self._thread.is_alive()
+
+        if not alive and self.autostart:
+            self.start()
+        return accepted
+
+    def _next_batch(self) -> Tuple[list, bool]:
+        with self._cond:
+            while not self._stopping:
+                pending = len(self._backlog)
+                if pending >= self.batch_size:
+                    break
+                if pending:
+                    remaining = self._first_pending_at + self.flush_interval - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                else:
+                    self._cond.wait()
+
+            count = len(self._backlog) if self._stopping else min(len(self._backlog), self.batch_size)
+            batch = [self._backlog.popleft() for _ in range(count)]
+
+            if self._backlog:
+                self._first_pending_at = time.monotonic()
+
+            return batch, self._stopping
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: list) -> None:
+        # Only rows carrying unknown keys are JSON-encoded; CAN_TX rows
+        # are all typed columns and go to executemany as they are.
+        rows = [
+            row if row[-1] is None else row[:-1] + (json.dumps(row[-1], default=str),)
+            for row in batch
+        ]
+
+        t0 = time.perf_counter()
+        try:
+            with conn:
+                conn.executemany(INSERT_SQL, rows)
+        except sqlite3.Error as e:
+            self._write_errors += 1
+            self._dropped += len(rows)
+            self._logger.error(f"Telemetry batch insert failed: {e}", exc_info=True)
+            return
+
+        elapsed_ms = (time.perf_counter() - t0) * 1000.0
+        self._written += len(rows)
+        self._flushes += 1
+        self._last_batch_rows = len(rows)
+        self._last_flush_ms = elapsed_ms
+        self._total_flush_ms += elapsed_ms
+        self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+
+    def _run(self) -> None:
+        try:
+            conn = sqlite3.connect(self.db_path)
+        except sqlite3.Error as e:
+            self._logger.error(f"Telemetry writer cannot open database: {e}", exc_info=True)
+            return
+
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+
+            while True:
+                batch, stopping = self._next_batch()
+                if batch:
+                    self._write_batch(conn, batch)
+                if stopping:
+                    break
+
+        except Exception as e:
+            self._logger.error(f"Telemetry writer failed: {e}", exc_info=True)
+
+        finally:
+            conn.close()
+
+    def health_status(self) -> Dict[str, Any]:
+        flushes = self._flushes
+        return {
+            "running": self._thread is not None and self._thread.is_alive(),
+            "backlog": len(self._backlog),
+            "max_backlog": self.max_backlog,
+            "batch_size": self.batch_size,
+            "flush_interval": self.flush_interval,
+            "drop_policy": self.drop_policy,
+            "rows_submitted": self._submitted,
+            "rows_written": self._written,
+            "rows_dropped": self._dropped,
+            "write_errors": self._write_errors,
+            "flushes": flushes,
+            "rows_per_batch_last": self._last_batch_rows,
+            "rows_per_batch_avg": self._written / flushes if flushes else 0.0,
+            "flush_latency_ms_last": self._last_flush_ms,
+            "flush_latency_ms_avg": self._total_flush_ms / flushes if flushes else 0.0,
+            "flush_latency_ms_max": self._max_flush_ms
+        }
@@ -49,4 +49,469 @@ async def test_anomaly_detector_detect(sample_telemetry_df):
     assert predictions is not None or event is None
     if event:
         assert 0 <= event.anomaly_ratio <= 1
-        assert event.severity in ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
\ No newline at end of file
+        assert event.severity in ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
+
+def _fitted_detector() -> AnomalyDetector:
+    detector = AnomalyDetector(contamination=0.05)
+    rng = np.random.default_rng(0)
+    latency_ms = rng.normal(5.0, 0.5, 500)
+    X = np.column_stack((
+        latency_ms,
+        np.abs(np.diff(latency_ms, prepend=latency_ms[0])),
+        rng.integers(0, 10, 500).astype(float)
+    ))
+    detector.model.fit(X)
+    detector._trained = True
+    return detector
+
+
+@pytest.mark.asyncio
+async def test_anomaly_detector_streaming_window():
+    """Test streaming scoring keeps a bounded rolling window."""
+    from core.event_bus import event_bus, EventTopic
+
+    subscribers = event_bus.get_subscriber_count(EventTopic.CAN_TX.value)
+    detector = _fitted_detector()
+    detector.start_streaming(window=200)
+    try:
+        assert event_bus.get_subscriber_count(EventTopic.CAN_TX.value) == subscribers + 1
+        assert detector.stream_state() is None
+
+        rng = np.random.default_rng(1)
+        for _ in range(5):
+            batch = [
+                {"latency_us": float(v) * 1000, "queue_size": 3}
+                for v in rng.normal(5.0, 0.5, 100)
+            ]
+            await detector._on_can_tx_batch(batch)
+
+        state = detector.stream_state()
+        assert state["total_samples"] == 200
+        assert state["samples_seen"] == 500
+        assert state["batches_scored"] == 5
+        assert 0 <= state["anomaly_ratio"] < 0.3
+        assert detector.stream_state(limit=50)["total_samples"] == 50
+    finally:
+        detector.stop_streaming()
+
+    assert detector.stream_state() is None
+    assert event_bus.get_subscriber_count(EventTopic.CAN_TX.value) == subscribers
+
+
+@pytest.mark.asyncio
+async def test_anomaly_detector_streaming_matches_model():
+    """Test streaming predictions agree with model.predict."""
+    detector = _fitted_detector()
+    detector.start_streaming(window=1000)
+    try:
+        batch = [{"latency_us": 5000.0, "queue_size": 3} for _ in range(20)]
+        batch += [{"latency_us": 50000.0, "queue_size": 40} for _ in range(20)]
+        batch += [{"latency_us": None, "queue_size": 3}]
+        await detector._on_can_tx_batch(batch)
+
+        latency_ms = np.array([5.0] * 20 + [50.0] * 20)
+        X = np.column_stack((
+            latency_ms,
+            np.abs(np.diff(latency_ms, prepend=5.0)),
+            np.array([3.0] * 20 + [40.0] * 20)
+        ))
+        expected = int((detector.model.predict(X) == -1).sum())
+
+        state = detector.stream_state()
+        assert state["samples_filtered"] == 1
+        assert state["anomaly_count"] == expected >= 20
+    finally:
+        detector.stop_streaming()
+
+
+@pytest.mark.asyncio
+async def test_attack_classifier_batch_matches_predict():
+    """Test classify_batch labels rows like predict and publishes once."""
+    from analytics.cyber_attack_classifier import CyberAttackClassifier, ATTACK_TYPES
+    from core.event_bus import event_bus, EventTopic
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 3))
+    y = (X[:, 0] > 0).astype(int)
+
+    classifier = CyberAttackClassifier()
+    classifier.model.set_params(n_jobs=1)
+    classifier.model.fit(X, y)
+
+    events = []
+    on_event = events.append
+    event_bus.subscribe(EventTopic.ATTACK_EVENT.value, on_event)
+    try:
+        predictions = await classifier.classify_batch(X[:50])
+    finally:
+        assert event_bus.unsubscribe(EventTopic.ATTACK_EVENT.value, on_event)
+
+    expected = [ATTACK_TYPES[label] for label in classifier.model.predict(X[:50])]
+    assert [p.attack_type for p in predictions] == expected
+    assert len(events) == 1
+    assert events[0]["attack_counts"] == {"DOS": events[0]["count"]}
+    assert events[0]["total_samples"] == 50
+
+
+@pytest.mark.asyncio
+async def test_inference_executor_process_pool(tmp_path):
+    """Test process-pool inference from a saved model matches in-process scoring."""
+    from analytics.inference_executor import InferenceExecutor
+    from analytics.model_store import save_model
+
+    detector = _fitted_detector()
+    executor = InferenceExecutor(mode="process", max_workers=1)
+    detector.executor = executor
+    path = save_model(detector.model, tmp_path / "anomaly_model.joblib")
+    executor.register(AnomalyDetector.EXECUTOR_NAME, detector.model, path)
+
+    X = np.array([[5.0, 0.1, 3.0], [50.0, 45.0, 40.0]])
+    try:
+        await executor.start()
+        scores = await detector._score_samples(X)
+    finally:
+        await executor.shutdown()
+
+    np.testing.assert_allclose(scores, detector.model.score_samples(X))
+    health = executor.health_status()
+    assert health["completed"] == 1
+    assert health["mapped_models"] == [AnomalyDetector.EXECUTOR_NAME]
+
+
+@pytest.mark.asyncio
+async def test_inference_executor_register_from_thread_while_serving():
+    """Test re-registering from another thread never loses in-flight requests."""
+    import asyncio
+    from analytics.inference_executor import InferenceExecutor
+
+    detector = _fitted_detector()
+    executor = InferenceExecutor(mode="process", max_workers=1, max_pending=64)
+    executor.register(AnomalyDetector.EXECUTOR_NAME, detector.model)
+    X = np.array([[5.0, 0.1, 3.0]])
+
+    def reregister():
+        for _ in range(3):
+            executor.register(AnomalyDetector.EXECUTOR_NAME, detector.model)
+
+    try:
+        await executor.start()
+        results = await asyncio.gather(
+            asyncio.to_thread(reregister),
+            *(executor.run(AnomalyDetector.EXECUTOR_NAME, "score_samples", X)
+              for _ in range(16))
+        )
+    finally:
+        await executor.shutdown()
+
+    for scores in results[1:]:
+        np.testing.assert_allclose(scores, detector.model.score_samples(X))
+    health = executor.health_status()
+    assert health["failed"] == 0
+    assert health["completed"] == 16
+    assert health["pool_restarts"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_inference_executor_rejects_when_queue_full():
+    """Test the executor bounds concurrency and queued requests."""
+    import asyncio
+    import threading
+    from analytics.inference_executor import InferenceExecutor, InferenceRejected
+
+    release = threading.Event()
+
+    class SlowModel:
+        def predict(self, X):
+            release.wait(5)
+            return X
+
+    executor = InferenceExecutor(mode="thread", max_workers=1, max_pending=1)
+    executor.register("slow", SlowModel())
+
+    running = asyncio.create_task(executor.run("slow", "predict", 1))
+    queued = asyncio.create_task(executor.run("slow", "predict", 2))
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(InferenceRejected):
+        await executor.run("slow", "predict", 3)
+
+    release.set()
+    assert await asyncio.gather(running, queued) == [1, 2]
+    await executor.shutdown()
+
+    health = executor.health_status()
+    assert health["completed"] == 2
+    assert health["rejected"] == 1
+
+
+def test_streaming_stats_match_numpy():
+    """Test incremental window statistics agree with full recomputation."""
+    from analytics.streaming_stats import RollingStats
+
+    rng = np.random.default_rng(0)
+    values = rng.normal(20000, 3000, 5000) + np.arange(5000) * 2.0
+    stats = RollingStats(100)
+    for v in values:
+        stats.push(float(v))
+
+    window = values[-100:]
+    slope, intercept = stats.regression.fit()
+    np.testing.assert_allclose((slope, intercept), np.polyfit(range(100), window, 1))
+    assert stats.moments.mean == pytest.approx(window.mean())
+    assert stats.moments.std() == pytest.approx(window.std())
+    assert stats.extrema.min == window.min()
+    assert stats.extrema.max == window.max()
+
+
+def test_p2_quantile_estimates():
+    """Test P² estimates land close to exact percentiles."""
+    from analytics.streaming_stats import P2Quantile
+
+    values = np.random.default_rng(1).normal(100.0, 10.0, 20000)
+    for q in (0.5, 0.95, 0.99):
+        estimator = P2Quantile(q)
+        for v in values:
+            estimator.add(float(v))
+        assert estimator.value == pytest.approx(np.percentile(values, q * 100), rel=0.02)
+
+
+@pytest.mark.asyncio
+async def test_latency_predictor_trend_cadence():
+    """Test trend checks run every trend_interval samples."""
+    from analytics.latency_predictor import LatencyPredictor
+
+    predictor = LatencyPredictor(window_size=50, trend_interval=10)
+    for i in range(100):
+        await predictor.on_can_tx_event({"latency_us": 1000 + i * 5})
+
+    trend = await predictor.analyze_trend()
+    assert trend.slope == pytest.approx(5.0)
+    assert trend.prediction == pytest.approx(1000 + 100 * 5)
+    assert predictor.health_status()["trend_checks"] == 9
+    stats = predictor.get_statistics()
+    assert stats["count"] == 50
+    # Unprefixed percentiles cover the window (the last 50 samples) only
+    assert stats["median"] == pytest.approx(np.median(1000 + np.arange(50, 100) * 5))
+    assert stats["lifetime_median"] < stats["median"]
+
+
+def test_forecasters_track_trend_and_season():
+    """Test Holt follows a linear trend and Holt-Winters a seasonal series."""
+    from analytics.forecasting import MultiHorizonForecaster
+
+    forecaster = MultiHorizonForecaster(horizons=(1, 10), season_length=12)
+    t = np.arange(240)
+    series = 1000 + 5.0 * t + 200 * np.sin(2 * np.pi * t / 12)
+    for x in series:
+        forecaster.update(float(x))
+
+    errors = forecaster.error_summary()
+    assert errors["holt_winters"][1]["mae"] < errors["ewma"][1]["mae"]
+    assert forecaster.best_model(10).name == "holt_winters"
+
+    expected = 1000 + 5.0 * 249 + 200 * np.sin(2 * np.pi * 249 / 12)
+    assert forecaster.forecasts()["holt_winters"][10] == pytest.approx(expected, rel=0.05)
+
+
+@pytest.mark.asyncio
+async def test_latency_predictor_forecasts_budget_breach():
+    """Test LATENCY_DEGRADATION fires before the observed p99 crosses the budget."""
+    from analytics.latency_predictor import LatencyPredictor
+    from core.event_bus import event_bus, EventTopic
+
+    predictor = LatencyPredictor(horizons=(1, 10), season_length=12, latency_budget_us=5000)
+    events = []
+    on_event = events.append
+    event_bus.subscribe(EventTopic.ERROR.value, on_event)
+    try:
+        observed_at_alert = None
+        for second in range(60):
+            for i in range(20):
+                latency = 1000 + second * 100 + i
+                await predictor.on_can_tx_event({"latency_us": latency}, now=second + i / 20)
+            if events and observed_at_alert is None:
+                observed_at_alert = predictor.get_forecast()["current_p99_us"]
+    finally:
+        assert event_bus.unsubscribe(EventTopic.ERROR.value, on_event)
+
+    alerts = [e for e in events if e.get("predicted")]
+    assert len(alerts) == 1
+    assert observed_at_alert < 5000
+    assert alerts[0]["forecast_p99_us"] > 5000
+    assert predictor.get_forecast()["buckets"] == 59
+
+
+def test_telemetry_features_match_pandas(sample_telemetry_df):
+    """Test the NumPy feature pipeline reproduces the pandas path."""
+    from analytics.utils import extract_features, frame_features, FeaturePipeline
+
+    df = sample_telemetry_df.copy()
+    df.loc[[3, 40], "latency_us"] = np.nan
+    df.loc[10, "latency_us"] = 1e7
+    df["queue_size"] = df["queue_size"].astype(float)
+    df.loc[60, "queue_size"] = np.nan
+
+    expected = extract_features(preprocess_telemetry(df))
+    np.testing.assert_allclose(frame_features(df), expected)
+
+    pipeline = FeaturePipeline(16)
+    X = pipeline.transform(df["latency_us"].to_numpy(), df["queue_size"].to_numpy())
+    np.testing.assert_allclose(X, expected)
+    assert pipeline.capacity == len(df)
+
+
+def test_window_features_sliding_and_tumbling():
+    """Test windowed features over steady traffic and a replayed burst."""
+    from analytics.window_features import WindowFeatureExtractor
+
+    emitted = []
+    extractor = WindowFeatureExtractor(
+        window_us=100_000,
+        tumbling_us=100_000,
+        on_window=lambda start, features: emitted.append((start, features))
+    )
+
+    # 10 ms period, steering sweeping back and forth
+    angles = [0, 5, 10, 5, 0, 5, 10, 5, 0, 5]
+    for i in range(30):
+        extractor.on_can_tx_event({"timestamp_us": i * 10_000, "angle": angles[i % 10]})
+
+    features = extractor.sliding()
+    assert features.frames == 10
+    assert features.message_rate_hz == pytest.approx(100.0)
+    assert features.inter_arrival_mean_ms == pytest.approx(10.0)
+    assert features.inter_arrival_var_ms2 == pytest.approx(0.0)
+    assert features.angle_delta_mean == pytest.approx(5.0)
+    assert features.sign_flips == 4
+    assert features.duplicate_ratio == pytest.approx(0.7)
+    assert [start for start, _ in emitted] == [0, 100_000]
+    assert emitted[0][1].frames == 10
+
+    # Replay: old timestamps and a repeated angle
+    for _ in range(5):
+        extractor.on_can_tx_event({"timestamp_us": 50_000, "angle": 5})
+
+    features = extractor.sliding()
+    assert features.out_of_order == 5
+    assert features.frames == 15
+    assert features.to_array().shape == (11,)
+
+
+def test_reservoir_sample_is_bounded_and_uniform():
+    """Test the reservoir keeps a fixed-size uniform sample of the stream."""
+    from analytics.online_learning import ReservoirSample
+
+    reservoir = ReservoirSample(capacity=1000, n_features=1, seed=0)
+    stream = np.arange(100_000, dtype=float).reshape(-1, 1)
+    for start in range(0, len(stream), 250):
+        reservoir.add(stream[start:start + 250])
+
+    sample = reservoir.snapshot()[:, 0]
+    assert len(sample) == 1000
+    assert reservoir.seen == 100_000
+    assert len(np.unique(sample)) == 1000
+    assert 40_000 < sample.mean() < 60_000
+
+
+@pytest.mark.asyncio
+async def test_online_learning_bootstraps_and_swaps_model():
+    """Test streamed telemetry trains an untrained detector and swaps models."""
+    detector = AnomalyDetector(contamination=0.05)
+    learner = detector.enable_online_learning(reservoir_size=500, min_samples=200, seed=0)
+    detector.start_streaming(window=500)
+    try:
+        rng = np.random.default_rng(2)
+        batch = [
+            {"latency_us": float(v) * 1000, "queue_size": 3}
+            for v in rng.normal(5.0, 0.5, 300)
+        ]
+        await detector._on_can_tx_batch(batch)
+        assert detector._trained is False
+        assert learner.due
+
+        old_model = detector.model
+        assert await learner.refit()
+        assert detector._trained is True
+        assert detector.model is not old_model
+        assert not learner.due
+
+        await detector._on_can_tx_batch(batch)
+        assert detector.stream_state()["total_samples"] > 0
+        assert detector.health_status()["model_swaps"] == 1
+    finally:
+        detector.stop_streaming()
+
+
+def test_compiled_forests_match_sklearn(tmp_path):
+    """Test compiled tree tables reproduce sklearn outputs after an mmap round trip."""
+    from sklearn.ensemble import IsolationForest, RandomForestClassifier
+    from analytics.compiled_trees import compile_model, load_compiled
+
+    rng = np.random.default_rng(3)
+    X = rng.normal(size=(1000, 3))
+    y = rng.integers(0, 4, len(X))
+    X[:, 0] += y
+    T = rng.normal(size=(200, 3)) * 3
+
+    models = [
+        (IsolationForest(random_state=0).fit(X), "score_samples"),
+        (IsolationForest(max_features=2, random_state=0).fit(X), "score_samples"),
+        (RandomForestClassifier(n_estimators=20, max_depth=6, random_state=0).fit(X, y), "predict_proba")
+    ]
+    for i, (model, method) in enumerate(models):
+        compiled = load_compiled(compile_model(model).save(tmp_path / f"m{i}"))
+        np.testing.assert_allclose(getattr(compiled, method)(T), getattr(model, method)(T), atol=1e-12)
+        np.testing.assert_array_equal(compiled.predict(T), model.predict(T))
+        np.testing.assert_allclose(getattr(compiled, method)(T[0]), getattr(model, method)(T[:1]), atol=1e-12)
+
+
+@pytest.mark.asyncio
+async def test_detector_scores_small_batches_inline(tmp_path):
+    """Test small batches use the compiled model and stale exports are ignored."""
+    import os
+    import joblib
+    from analytics.compiled_trees import compile_model, export_compiled, load_or_compile
+
+    detector = _fitted_detector()
+    detector.compiled = compile_model(detector.model)
+    df = pd.DataFrame({"latency_us": [5000.0] * 8 + [50000.0] * 4, "queue_size": [3] * 12})
+
+    predictions, _ = await detector.detect(df)
+    assert detector.health_status()["inline_calls"] == 1
+
+    detector.compiled = None
+    expected, _ = await detector.detect(df)
+    np.testing.assert_array_equal(predictions, expected)
+
+    model_path = tmp_path / "anomaly_model.joblib"
+    joblib.dump(detector.model, model_path)
+    export_compiled(detector.model, model_path)
+    assert load_or_compile(detector.model, model_path).meta["source"] == model_path.name
+
+    stat = model_path.stat()
+    os.utime(model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert "source" not in load_or_compile(detector.model, model_path).meta
+
+
+@pytest.mark.asyncio
+async def test_models_load_lazily_and_mmap(tmp_path):
+    """Test models load on warm-up or first use, memory-mapped from disk."""
+    from sklearn.ensemble import IsolationForest
+    from analytics.model_store import load_model, save_model
+
+    detector = AnomalyDetector(contamination=0.05)
+    assert not detector.loaded
+    assert detector.health_status()["available"] is True
+
+    await detector.warm_up()
+    assert detector.loaded
+    assert detector.health_status()["load_ms"] is not None
+
+    model = IsolationForest(random_state=0).fit(np.random.default_rng(0).normal(size=(300, 3)))
+    path = save_model(model, tmp_path / "model.joblib")
+    assert not (tmp_path / "model.joblib.tmp").exists()
+
+    loaded = load_model(path)
+    assert isinstance(loaded.estimators_features_[0], np.memmap)
+    X = np.random.default_rng(1).normal(size=(20, 3))
+    np.testing.assert_array_equal(loaded.score_samples(X), model.score_samples(X))
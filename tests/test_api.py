@@ -4,9 +4,17 @@ Tests for REST API endpoints.
 Tests gateway control, analytics, and health endpoints.
 """
 
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from fastapi.testclient import TestClient
 
+from core.lazy_imports import lazy_import
+
 
 class TestGatewayAPI:
     """Gateway control endpoint tests."""
@@ -46,6 +54,14 @@ class TestGatewayAPI:
         data = response.json()
         assert data.get("status") == "success"
 
+    def test_gateway_telemetry_window_endpoint(self, client):
+        """Test GET /api/gateway/telemetry/window"""
+        response = client.get("/api/gateway/telemetry/window?n=10")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] <= 10
+        assert "latency_us" in data["columns"]
+
     def test_gateway_attack_invalid_endpoint(self, client):
         """Test POST /api/gateway/attack/invalid"""
         response = client.post("/api/gateway/attack/invalid")
@@ -73,6 +89,14 @@ class TestAnalyticsAPI:
         data = response.json()
         assert "status" in data
 
+    def test_window_features_endpoint(self, client):
+        """Test GET /api/analytics/features/window"""
+        response = client.get("/api/analytics/features/window?last=5")
+        assert response.status_code == 200
+        data = response.json()
+        assert "message_rate_hz" in data["sliding"]
+        assert isinstance(data["tumbling"], list)
+
 
 class TestHealthAPI:
     """Health check API tests."""
@@ -89,4 +113,46 @@ class TestHealthAPI:
         response = client.get("/status")
         assert response.status_code == 200
         data = response.json()
-        assert data["status"] == "running"
\ No newline at end of file
+        assert data["status"] == "running"
+
+    def test_gateway_only_startup_skips_ml_stack(self):
+        """ANALYTICS_ENABLED=false imports the app without sklearn or pandas."""
+        probe = (
+            "import json, sys\n"
+            "import backend.main\n"
+            "paths = [r.path for r in backend.main.app.routes]\n"
+            "heavy = [m for m in ('sklearn', 'pandas', 'scipy', 'joblib', 'can') if m in sys.modules]\n"
+            "print(json.dumps({'heavy': heavy, 'paths': paths}))\n"
+        )
+        root = Path(__file__).parent.parent
+        env = dict(os.environ, ANALYTICS_ENABLED="false", PYTHONPATH=str(root))
+        result = subprocess.run(
+            [sys.executable, "-c", probe],
+            cwd=root, env=env, capture_output=True, text=True, timeout=120
+        )
+        assert result.returncode == 0, result.stderr
+        data = json.loads(result.stdout.strip().splitlines()[-1])
+
+        assert data["heavy"] == []
+        assert "/health" in data["paths"]
+        assert not any(p.startswith("/api/analytics") for p in data["paths"])
+
+    def test_lazy_import_defers_and_handles_missing(self):
+        """lazy_import returns None for missing modules and loads on first use."""
+        assert lazy_import("aegiscan_no_such_module") is None
+
+        probe = (
+            "import sys\n"
+            "from core.lazy_imports import lazy_import\n"
+            "colorsys = lazy_import('colorsys')\n"
+            "assert 'colorsys' not in sys.modules\n"
+            "assert colorsys.rgb_to_hsv(1, 0, 0) == (0.0, 1.0, 1)\n"
+            "assert 'colorsys' in sys.modules\n"
+        )
+        root = Path(__file__).parent.parent
+        env = dict(os.environ, PYTHONPATH=str(root))
+        result = subprocess.run(
+            [sys.executable, "-c", probe],
+            cwd=root, env=env, capture_output=True, text=True, timeout=60
+        )
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,302 @@
+"""
+Tests for event bus dispatch.
+Tests subscriber classification, ordering and error isolation.
+"""
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_publish_dispatches_sync_and_async(mock_event_bus):
+    calls = []
+
+    def on_sync(data):
+        calls.append(("sync", data))
+
+    async def on_async(data):
+        calls.append(("async", data))
+
+    mock_event_bus.subscribe("can.tx", on_async)
+    mock_event_bus.subscribe("can.tx", on_sync)
+
+    executed = await mock_event_bus.publish("can.tx", 1)
+    assert executed == 2
+    assert calls == [("sync", 1), ("async", 1)]
+
+    mock_event_bus.unsubscribe("can.tx", on_sync)
+    assert await mock_event_bus.publish("can.tx", 2) == 1
+    assert calls[-1] == ("async", 2)
+
+
+@pytest.mark.asyncio
+async def test_failing_callback_does_not_block_others(mock_event_bus):
+    received = []
+
+    def broken(data):
+        raise RuntimeError("boom")
+
+    mock_event_bus.subscribe("can.tx", broken)
+    mock_event_bus.subscribe("can.tx", received.append)
+
+    assert await mock_event_bus.publish("can.tx", "x") == 1
+    assert received == ["x"]
+    assert mock_event_bus.health_status()["error_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_once_subscription_fires_once(mock_event_bus):
+    received = []
+    mock_event_bus.subscribe("can.tx", received.append, once=True)
+
+    await mock_event_bus.publish("can.tx", 1)
+    await mock_event_bus.publish("can.tx", 2)
+
+    assert received == [1]
+    assert mock_event_bus.get_subscriber_count("can.tx") == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_delivery_overlaps_slow_subscribers(mock_event_bus):
+    import asyncio
+    import time
+
+    async def slow(data):
+        await asyncio.sleep(0.05)
+
+    for _ in range(4):
+        mock_event_bus.subscribe("can.tx", slow, delivery="concurrent")
+
+    t0 = time.perf_counter()
+    assert await mock_event_bus.publish("can.tx", 1) == 4
+    assert time.perf_counter() - t0 < 0.15
+
+
+@pytest.mark.asyncio
+async def test_queued_delivery_reports_lag_and_drops(mock_event_bus):
+    import asyncio
+
+    received = []
+    gate = asyncio.Event()
+
+    async def slow_consumer(data):
+        await gate.wait()
+        received.append(data)
+
+    sub = mock_event_bus.subscribe("can.tx", slow_consumer, delivery="queued", mailbox_size=3)
+
+    for i in range(6):
+        assert await mock_event_bus.publish("can.tx", i) == 1
+
+    await asyncio.sleep(0)
+    gate.set()
+    await mock_event_bus.drain("can.tx")
+
+    stats = sub.stats()
+    assert received == [3, 4, 5]
+    assert stats["dropped"] == 3
+    assert stats["delivered"] == 3
+    assert stats["lag_ms_max"] >= 0.0
+    mock_event_bus.unsubscribe("can.tx", slow_consumer)
+
+
+@pytest.mark.asyncio
+async def test_publish_nowait_creates_no_task_per_event(mock_event_bus):
+    import asyncio
+
+    sync_received = []
+    async_received = []
+
+    async def on_async(data):
+        async_received.append(data)
+
+    mock_event_bus.subscribe("can.tx", sync_received.append)
+    mock_event_bus.subscribe("can.tx", on_async)
+
+    mock_event_bus.publish_nowait("can.tx", 0)
+    tasks_before = len(asyncio.all_tasks())
+    for i in range(1, 100):
+        assert mock_event_bus.publish_nowait("can.tx", i) == 2
+    assert len(asyncio.all_tasks()) == tasks_before
+
+    await mock_event_bus.drain()
+    assert sync_received == list(range(100))
+    assert async_received == list(range(100))
+    mock_event_bus.unsubscribe("can.tx", on_async)
+
+
+@pytest.mark.asyncio
+async def test_publish_threadsafe_delivers_on_loop(mock_event_bus):
+    import asyncio
+    import threading
+
+    loop_thread = threading.get_ident()
+    received = []
+    done = asyncio.Event()
+
+    def on_event(data):
+        received.append((data, threading.get_ident()))
+        if len(received) == 3:
+            done.set()
+
+    mock_event_bus.subscribe("can.tx", on_event)
+    mock_event_bus.bind_loop()
+
+    worker = threading.Thread(
+        target=lambda: [mock_event_bus.publish_threadsafe("can.tx", i) for i in range(3)]
+    )
+    worker.start()
+    worker.join()
+    await asyncio.wait_for(done.wait(), timeout=2.0)
+
+    assert [d for d, _ in received] == [0, 1, 2]
+    assert all(tid == loop_thread for _, tid in received)
+
+
+def test_incomplete_transport_fails_on_instantiation(mock_event_bus):
+    from core.event_transport import EventTransport
+
+    class StartOnly(EventTransport):
+        async def start(self):
+            pass
+
+    with pytest.raises(TypeError):
+        StartOnly(["can.tx"], bus=mock_event_bus)
+
+
+@pytest.mark.asyncio
+async def test_unix_socket_transport_bridges_buses_without_echo(tmp_path):
+    import asyncio
+    from core.event_bus import EventBus
+    from core.event_transport import UnixSocketTransport
+
+    hub_bus, peer_bus = EventBus(), EventBus()
+    path = str(tmp_path / "events.sock")
+    hub = UnixSocketTransport(path, ["can.tx"], bus=hub_bus, listen=True)
+    peer = UnixSocketTransport(path, ["can.tx"], bus=peer_bus, listen=False, reconnect_interval=0.01)
+
+    hub_received, peer_received = [], []
+    hub_bus.subscribe("can.tx", hub_received.append)
+    peer_bus.subscribe("can.tx", peer_received.append)
+
+    try:
+        await hub.start()
+        await peer.start()
+        for _ in range(100):
+            if hub.health_status()["peers"] == 1:
+                break
+            await asyncio.sleep(0.01)
+
+        hub_bus.publish_nowait("can.tx", {"angle": 12})
+        peer_bus.publish_nowait("can.tx", {"angle": -5})
+        for _ in range(100):
+            if len(peer_received) == 2 and len(hub_received) == 2:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+
+        assert peer_received == [{"angle": -5}, {"angle": 12}]
+        assert hub_received == [{"angle": 12}, {"angle": -5}]
+        assert hub.sent == 1 and peer.sent == 1
+    finally:
+        await peer.stop()
+        await hub.stop()
+
+
+@pytest.mark.asyncio
+async def test_wildcard_subscriptions_match_hierarchically(mock_event_bus):
+    received = []
+
+    mock_event_bus.subscribe("can.*", lambda d: received.append(("can.*", d)))
+    mock_event_bus.subscribe("*.tx", lambda d: received.append(("*.tx", d)))
+    mock_event_bus.subscribe("#", lambda t, d: received.append(("#", t)), with_topic=True)
+    mock_event_bus.subscribe("attack.#", lambda d: received.append(("attack.#", d)))
+
+    await mock_event_bus.publish("can.tx", 1)
+    assert received == [("can.*", 1), ("*.tx", 1), ("#", "can.tx")]
+
+    received.clear()
+    mock_event_bus.publish_nowait("ble.tx", 2)
+    mock_event_bus.publish_nowait("attack.event", 3)
+    mock_event_bus.publish_nowait("can.tx.extended", 4)
+    assert received == [
+        ("*.tx", 2), ("#", "ble.tx"),
+        ("#", "attack.event"), ("attack.#", 3),
+        ("#", "can.tx.extended"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_resolved_topic_cache_is_invalidated_on_subscription_change(mock_event_bus):
+    received = []
+
+    def on_all_can(data):
+        received.append(data)
+
+    assert await mock_event_bus.publish("can.tx", 0) == 0
+
+    mock_event_bus.subscribe("can.#", on_all_can)
+    assert await mock_event_bus.publish("can.tx", 1) == 1
+
+    mock_event_bus.unsubscribe("can.#", on_all_can)
+    assert await mock_event_bus.publish("can.tx", 2) == 0
+    assert received == [1]
+
+
+def test_invalid_topic_patterns_are_rejected(mock_event_bus):
+    for pattern in ("can..tx", "#.tx", "can.t*"):
+        with pytest.raises(ValueError):
+            mock_event_bus.subscribe(pattern, print)
+
+
+@pytest.mark.asyncio
+async def test_sample_interval_rate_limits_delivery(mock_event_bus):
+    import asyncio
+
+    received = []
+    sub = mock_event_bus.subscribe("can.tx", received.append, sample_interval=0.05)
+
+    for i in range(100):
+        mock_event_bus.publish_nowait("can.tx", i)
+    await asyncio.sleep(0.06)
+    mock_event_bus.publish_nowait("can.tx", 100)
+
+    assert received == [0, 100]
+    assert sub.stats()["sampled_out"] == 99
+
+
+@pytest.mark.asyncio
+async def test_latest_only_conflates_to_newest_event(mock_event_bus):
+    import asyncio
+
+    received = []
+
+    async def on_latest(data):
+        received.append(data)
+        await asyncio.sleep(0.01)
+
+    mock_event_bus.subscribe("can.tx", on_latest, latest_only=True)
+
+    mock_event_bus.publish_nowait("can.tx", 0)
+    await asyncio.sleep(0)
+    for i in range(1, 50):
+        mock_event_bus.publish_nowait("can.tx", i)
+    await mock_event_bus.drain("can.tx")
+
+    assert received == [0, 49]
+    mock_event_bus.unsubscribe("can.tx", on_latest)
+
+
+@pytest.mark.asyncio
+async def test_batch_window_delivers_lists(mock_event_bus):
+    import asyncio
+
+    batches = []
+    sub = mock_event_bus.subscribe("can.*", batches.append, batch_window=0.02, batch_max=40)
+
+    for i in range(50):
+        mock_event_bus.publish_nowait("can.tx", i)
+    assert batches == [list(range(40))]
+
+    await asyncio.sleep(0.05)
+    assert batches == [list(range(40)), list(range(40, 50))]
+    assert sub.stats()["batches"] == 2
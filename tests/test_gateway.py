@@ -7,6 +7,7 @@ Tests gateway initialization, start/stop, and attack modes.
 
 import pytest
 import asyncio
+import numpy as np
 from src.gateway import Gateway
 
 
@@ -41,4 +42,195 @@ async def test_gateway_attack_mode(gateway):
     assert gateway.can.attack_mode == "flip"
     
     gateway.set_attack_mode(None)
-    assert gateway.can.attack_mode is None
\ No newline at end of file
+    assert gateway.can.attack_mode is None
+
+def test_telemetry_writer_batches_rows(gateway):
+    """Test telemetry is persisted in batches by the write-behind writer."""
+    import sqlite3
+
+    with sqlite3.connect(gateway.db_path) as conn:
+        before = conn.execute("SELECT COUNT(*) FROM telemetry").fetchone()[0]
+
+    gateway._on_can_tx_batch(
+        [{"angle": i, "latency_us": 100, "packet_number": i} for i in range(10)]
+    )
+    gateway._writer.stop()
+
+    with sqlite3.connect(gateway.db_path) as conn:
+        after = conn.execute("SELECT COUNT(*) FROM telemetry").fetchone()[0]
+
+    writer = gateway.health_status()["telemetry"]["writer"]
+    assert after - before >= 10
+    assert writer["rows_written"] >= 10
+    assert writer["flushes"] >= 1
+    assert writer["rows_per_batch_last"] >= 1
+
+
+def test_telemetry_writer_drop_policy(temp_db):
+    """Test bounded backlog applies the configured drop policy."""
+    from src.telemetry_writer import TelemetryWriter, DROP_NEWEST
+
+    writer = TelemetryWriter(
+        temp_db,
+        batch_size=4,
+        flush_interval=60.0,
+        max_backlog=4,
+        drop_policy=DROP_NEWEST,
+        autostart=False
+    )
+
+    results = [writer.submit({"type": "CAN_TX", "angle": i}) for i in range(6)]
+
+    assert results == [True, True, True, True, False, False]
+    assert writer.health_status()["rows_dropped"] == 2
+
+    with pytest.raises(ValueError):
+        TelemetryWriter(temp_db, drop_policy="block")
+
+
+def test_telemetry_writer_typed_columns(temp_db):
+    """Test known fields land in typed columns and only unknown keys in extra_json."""
+    import json
+    import sqlite3
+    from src.telemetry_writer import TelemetryWriter, ensure_telemetry_schema
+
+    with sqlite3.connect(temp_db) as conn:
+        ensure_telemetry_schema(conn)
+
+    writer = TelemetryWriter(temp_db, batch_size=8, flush_interval=0.01)
+    writer.submit_many([
+        {"type": "CAN_TX", "angle": 1.5, "latency_us": 120, "tx_wait_us": 30,
+         "deadline_missed": False, "packet_number": 7},
+        {"type": "ATTACK", "attack_type": "DOS", "severity": "HIGH",
+         "event_count": 3, "description": "DoS attack"},
+        {"type": "METRICS", "cpu_percent": 12.5, "memory_percent": 40.0,
+         "disk_percent": 70.0, "active_tasks": 4},
+    ])
+    writer.stop()
+
+    with sqlite3.connect(temp_db) as conn:
+        rows = {
+            row[0]: row[1:] for row in conn.execute(
+                "SELECT type, packet_number, deadline_missed, attack_type, severity, "
+                "event_count, cpu_percent, active_tasks, extra_json FROM telemetry"
+            )
+        }
+
+    assert rows["CAN_TX"] == (7, 0, None, None, None, None, None, None)
+    assert rows["ATTACK"][2:5] == ("DOS", "HIGH", 3)
+    assert json.loads(rows["ATTACK"][-1]) == {"description": "DoS attack"}
+    assert rows["METRICS"][5:] == (12.5, 4, None)
+
+
+def test_migrate_db_backfills_typed_columns(temp_db):
+    """Test the migration adds typed columns and moves values out of extra_json."""
+    import json
+    import sqlite3
+    from scripts.migrate_db import migrate
+
+    with sqlite3.connect(temp_db) as conn:
+        conn.execute("""
+            CREATE TABLE telemetry (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                type TEXT NOT NULL, angle REAL, latency_us INTEGER,
+                queue_size INTEGER, priority INTEGER, timestamp_us INTEGER,
+                attack_mode TEXT, extra_json TEXT
+            )
+        """)
+        conn.executemany(
+            "INSERT INTO telemetry (type, extra_json) VALUES (?, ?)",
+            [
+                ("CAN_TX", json.dumps({"packet_number": 42})),
+                ("ATTACK", json.dumps({"severity": "HIGH", "event_count": 2, "description": "x"})),
+                ("METRICS", json.dumps({"cpu_percent": 5.0, "memory_percent": None})),
+            ]
+        )
+
+    assert migrate(temp_db) == {
+        "packet_number": 1, "severity": 1, "event_count": 1,
+        "cpu_percent": 1, "memory_percent": 1
+    }
+    assert migrate(temp_db) == {}
+
+    with sqlite3.connect(temp_db) as conn:
+        rows = conn.execute(
+            "SELECT packet_number, severity, event_count, cpu_percent, extra_json "
+            "FROM telemetry ORDER BY id"
+        ).fetchall()
+
+    assert rows[0] == (42, None, None, None, None)
+    assert rows[1][1:3] == ("HIGH", 2)
+    assert json.loads(rows[1][-1]) == {"description": "x"}
+    assert rows[2] == (None, None, None, 5.0, None)
+
+
+def test_telemetry_ring_buffer_wraps():
+    """Test ring buffer keeps the newest samples in order."""
+    from src.telemetry_buffer import TelemetryRingBuffer, MISSING_INT, TYPE_CODES
+
+    buf = TelemetryRingBuffer(4)
+    for i in range(6):
+        buf.append({"type": "CAN_TX", "angle": float(i), "latency_us": i * 10})
+    buf.append({"type": "METRICS"})
+
+    assert len(buf) == 4
+    assert buf.total_appended == 7
+
+    window = buf.latest()
+    assert window["latency_us"].tolist() == [30, 40, 50, MISSING_INT]
+    assert window["type_code"][-1] == TYPE_CODES["METRICS"]
+    assert np.isnan(window["angle"][-1])
+
+    recent = buf.latest(2)
+    assert recent["angle"].tolist()[0] == 5.0
+
+    # Windows are snapshots: later appends overwrite neither layout
+    unwrapped = buf.latest(1)
+    for i in range(4):
+        buf.append({"type": "CAN_TX", "angle": 100.0 + i, "latency_us": 0})
+    assert recent["angle"].tolist()[0] == 5.0
+    assert np.isnan(unwrapped["angle"][0])
+
+
+def test_telemetry_ring_buffer_latest_view():
+    """Test views alias the columns until the next append and are read-only."""
+    from src.telemetry_buffer import TelemetryRingBuffer
+
+    buf = TelemetryRingBuffer(4)
+    for i in range(3):
+        buf.append({"type": "CAN_TX", "angle": float(i)})
+
+    view = buf.latest_view(2)
+    assert view["angle"].tolist() == [1.0, 2.0]
+    assert np.shares_memory(view["angle"], buf._columns["angle"])
+    with pytest.raises(ValueError):
+        view["angle"][0] = 9.0
+
+    # Straddling the wrap point still has to copy
+    for i in range(3, 6):
+        buf.append({"type": "CAN_TX", "angle": float(i)})
+    wrapped = buf.latest_view()
+    assert wrapped["angle"].tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert not np.shares_memory(wrapped["angle"], buf._columns["angle"])
+
+
+def test_telemetry_ring_buffer_large_capacity():
+    """Test a 1M sample buffer stays compact."""
+    from src.telemetry_buffer import TelemetryRingBuffer
+
+    buf = TelemetryRingBuffer(1_000_000)
+    assert buf.nbytes < 40 * 1024 * 1024
+
+
+def test_can_tx_batch_fills_buffer_and_writer(gateway):
+    """Test batched CAN_TX delivery reaches the ring buffer and the writer in bulk."""
+    before = len(gateway.telemetry)
+    batch = [{"angle": i, "latency_us": 50, "packet_number": i} for i in range(5)]
+
+    gateway._on_can_tx_batch(batch)
+    gateway._writer.stop()
+
+    assert len(gateway.telemetry) == before + 5
+    assert all(entry["type"] == "CAN_TX" for entry in batch)
+    assert gateway.health_status()["telemetry"]["writer"]["rows_submitted"] >= 5
@@ -28,4 +28,250 @@ def test_scale_range(translator):
     assert result_255 > 0, f"Value 255 should be positive, got {result_255}"
     
     result_127 = translator._scale_steering(127)
-    assert -100 <= result_127 <= 100, f"Center should be near 0, got {result_127}"
\ No newline at end of file
+    assert -100 <= result_127 <= 100, f"Center should be near 0, got {result_127}"
+
+@pytest.mark.asyncio
+async def test_udp_frame_reaches_can_tx():
+    import asyncio
+    import socket
+    import struct
+    from core.event_bus import event_bus, EventTopic
+
+    translator = CANTranslator(listen_port=5205)
+    received = asyncio.Event()
+
+    def on_can_tx(data):
+        received.set()
+
+    event_bus.subscribe(EventTopic.CAN_TX.value, on_can_tx)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        await translator.start()
+        await asyncio.sleep(0.05)
+        sender.sendto(bytes([0]) + struct.pack('<Q', 1) + bytes([200]), ("127.0.0.1", 5205))
+        await asyncio.wait_for(received.wait(), timeout=2.0)
+        assert translator.health_status()["packets_processed"] == 1
+    finally:
+        sender.close()
+        await translator.stop()
+        event_bus.unsubscribe(EventTopic.CAN_TX.value, on_can_tx)
+
+
+@pytest.mark.asyncio
+async def test_udp_ingress_drains_in_batches():
+    import asyncio
+    import socket
+    from src.udp_ingress import UDPIngress, MAX_DATAGRAM_SIZE
+
+    received = []
+
+    def on_batch(buffer, sizes, count):
+        received.extend(sizes[:count])
+
+    ingress = UDPIngress("127.0.0.1", 5206, on_batch, rcvbuf_bytes=1 << 18)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        await ingress.start()
+        for i in range(50):
+            size = 100 if i % 10 == 9 else 10
+            sender.sendto(bytes([i]) * size, ("127.0.0.1", 5206))
+        for _ in range(100):
+            if len(received) == 50:
+                break
+            await asyncio.sleep(0.01)
+
+        status = ingress.health_status()
+        assert received == ([10] * 9 + [MAX_DATAGRAM_SIZE]) * 5
+        assert status["datagrams"] == 50
+        assert status["truncated"] == 5
+        assert status["batches"] <= 50
+        assert status["rcvbuf_bytes"] >= 1 << 18
+    finally:
+        sender.close()
+        ingress.close()
+
+
+def test_frame_codec_roundtrip():
+    from src.frame_codec import FrameEncoder, decode_frame, decode_batch, scale_steering, FRAME_SIZE
+
+    encoder = FrameEncoder()
+    frame = bytes(encoder.encode(2, 123456789, b"\xff"))
+
+    assert len(frame) == FRAME_SIZE
+    assert decode_frame(frame) == (2, 123456789, 255)
+
+    batch = decode_batch(frame * 3)
+    assert batch["timestamp_us"].tolist() == [123456789] * 3
+    assert batch["angle"].tolist() == [scale_steering(255)] * 3
+
+
+def test_steering_lut_matches_formula(translator):
+    for raw in range(256):
+        assert translator._scale_steering(raw) == int((raw - 127) * (900 / 255))
+
+
+def test_edf_orders_by_deadline():
+    from src.can_translator import SCHEDULING_EDF
+
+    edf = CANTranslator(scheduling=SCHEDULING_EDF)
+    edf._enqueue(2, 0, 127, arrival_us=0)
+    edf._enqueue(0, 0, 127, arrival_us=99_000)
+    assert edf.queue.get_nowait()[1] == 2
+
+    fixed = CANTranslator()
+    fixed._enqueue(2, 0, 127, arrival_us=0)
+    fixed._enqueue(0, 0, 127, arrival_us=99_000)
+    assert fixed.queue.get_nowait()[1] == 0
+
+
+def test_edf_drops_frames_past_deadline():
+    from src.can_translator import SCHEDULING_EDF
+
+    edf = CANTranslator(scheduling=SCHEDULING_EDF)
+    edf._enqueue(0, 0, 200, arrival_us=0)
+    edf._enqueue(7, 0, 200, arrival_us=0)
+    edf._process_packet(edf.queue.get_nowait())
+    edf._process_packet(edf.queue.get_nowait())
+
+    status = edf.health_status()
+    assert status["deadline_policy"] == "drop"
+    assert status["deadline_drops"] == 2
+    assert status["deadline_misses"] == {0: 1, 1: 0, 2: 1}
+    assert status["packets_processed"] == 0
+
+    with pytest.raises(ValueError):
+        CANTranslator(scheduling="fifo")
+
+
+@pytest.mark.asyncio
+async def test_can_tx_worker_sends_off_loop():
+    import asyncio
+    import threading
+    import can
+    from src.can_tx_worker import CANTxWorker
+
+    bus = can.interface.Bus(interface="virtual", channel="tx-test", receive_own_messages=True)
+    completed = []
+    done = asyncio.Event()
+    loop_thread = threading.get_ident()
+
+    def on_complete(results):
+        assert threading.get_ident() == loop_thread
+        completed.extend(results)
+        if len(completed) == 5:
+            done.set()
+
+    worker = CANTxWorker(bus, 0x100, on_complete, max_burst=4)
+    try:
+        worker.start()
+        for angle in range(5):
+            assert worker.submit(angle * 10, angle, 0, False, 0)
+        await asyncio.wait_for(done.wait(), timeout=2.0)
+
+        received = [bus.recv(timeout=1.0) for _ in range(5)]
+        assert [int.from_bytes(m.data, "little", signed=True) for m in received] == [0, 10, 20, 30, 40]
+        assert [r[0] for r in completed] == [0, 10, 20, 30, 40]
+        assert all(r[-1] for r in completed)
+        assert worker.health_status()["sent"] == 5
+    finally:
+        await asyncio.to_thread(worker.stop)
+        bus.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_tx_worker_rechecks_deadline_at_send():
+    """Frames that expire while queued are dropped or flagged at send time."""
+    import asyncio
+    import time
+    from src.can_tx_worker import CANTxWorker
+
+    past_us = time.monotonic_ns() // 1000 - 1_000
+    future_us = time.monotonic_ns() // 1000 + 60_000_000
+
+    for drop_expired in (True, False):
+        completed = []
+        done = asyncio.Event()
+
+        def on_complete(results):
+            completed.extend(results)
+            if len(completed) == 3:
+                done.set()
+
+        worker = CANTxWorker(None, 0x100, on_complete, drop_expired=drop_expired)
+        try:
+            worker.start()
+            assert worker.submit(10, 1, 0, False, 0, past_us)
+            assert worker.submit(20, 2, 0, False, 0, future_us)
+            assert worker.submit(30, 3, 0, False, 0)
+            await asyncio.wait_for(done.wait(), timeout=2.0)
+        finally:
+            await asyncio.to_thread(worker.stop)
+
+        # (angle, deadline_missed, expired, ok)
+        outcome = [(r[0], r[3], r[-2], r[-1]) for r in completed]
+        if drop_expired:
+            assert outcome == [(10, False, True, False), (20, False, False, True), (30, False, False, True)]
+            assert worker.health_status()["expired_dropped"] == 1
+        else:
+            assert outcome == [(10, True, True, True), (20, False, False, True), (30, False, False, True)]
+            assert worker.health_status()["expired_dropped"] == 0
+        assert worker.health_status()["expired"] == 1
+
+
+@pytest.mark.asyncio
+async def test_dos_flood_tick_injects_at_configured_rate():
+    translator = CANTranslator(listen_port=5207, dos_rate_hz=5000, max_queue_size=1000)
+
+    # 20 ticks of 3ms owe 300 frames; fractions carry over between ticks
+    injected = [translator._dos_tick(0.003, 1.0) for _ in range(20)]
+
+    assert 299 <= sum(injected) <= 300
+    assert all(14 <= n <= 16 for n in injected)
+    assert translator.queue.qsize() == sum(injected)
+    assert translator.health_status()["dos_frames_injected"] == sum(injected)
+
+
+@pytest.mark.asyncio
+async def test_dos_mode_floods_queue_without_blocking_loop():
+    import asyncio
+    import time
+
+    max_gap = 0.0
+
+    async def heartbeat():
+        nonlocal max_gap
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            max_gap = max(max_gap, now - last)
+            last = now
+
+    translator = CANTranslator(listen_port=5208, dos_rate_hz=5000)
+    beat = None
+    try:
+        await translator.start()
+        beat = asyncio.create_task(heartbeat())
+        translator.attack_mode = "dos"
+
+        deadline = time.perf_counter() + 5.0
+        while time.perf_counter() < deadline:
+            status = translator.health_status()
+            if status["dos_frames_injected"] > 100 and status["packets_processed"] > 0:
+                break
+            await asyncio.sleep(0.01)
+
+        assert status["dos_frames_injected"] > 100
+        assert status["packets_processed"] > 0
+        # A flood that blocked the loop would stall the heartbeat for its duration
+        assert max_gap < 0.5
+
+        translator.attack_mode = None
+        await asyncio.sleep(0.02)
+        injected = translator.health_status()["dos_frames_injected"]
+        await asyncio.sleep(0.05)
+        assert translator.health_status()["dos_frames_injected"] == injected
+    finally:
+        if beat:
+            beat.cancel()
+        await translator.stop()